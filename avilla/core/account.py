@@ -30,13 +30,21 @@ class BaseAccount:
     route: Selector
     avilla: Avilla
 
+    _staff_cache: tuple[AccountInfo, Staff] | None = field(default=None, init=False, repr=False, compare=False)
+
     @property
     def info(self) -> AccountInfo:
         return self.avilla.accounts[self.route]
 
     @property
-    def staff(self):
-        return Staff(self.get_staff_artifacts(), self.get_staff_components())
+    def staff(self) -> Staff:
+        info = self.info
+        if self._staff_cache is None or self._staff_cache[0] is not info:
+            self._staff_cache = (info, Staff(self.get_staff_artifacts(), self.get_staff_components()))
+        return self._staff_cache[1]
+
+    def invalidate_staff(self):
+        self._staff_cache = None
 
     @property
     def available(self) -> bool:
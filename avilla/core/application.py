@@ -9,19 +9,24 @@ from graia.amnesia.builtins.memcache import MemcacheService
 from graia.broadcast import Broadcast
 from launart import Launart
 from launart.service import Service
-from loguru import logger
 
 from avilla.core._runtime import get_current_avilla
 from avilla.core.account import AccountInfo, BaseAccount
 from avilla.core.dispatchers import AvillaBuiltinDispatcher
 from avilla.core.event import MetadataModified
+from avilla.core.event_log import EventLogConfig, EventLogger
+from avilla.core.http import HttpClientConfig, HttpClientService
+from avilla.core.metrics import Metrics, MetricsConfig
 from avilla.core.protocol import BaseProtocol
+from avilla.core.ryanvk.descriptor.query import QueryConfig, QueryResultCache
 from avilla.core.ryanvk.staff import Staff
 from avilla.core.selector import Selector
 from avilla.core.service import AvillaService
+from avilla.core.subscription import EventSubscriptions
+from avilla.core.utilles.media_cache import MediaCacheConfig, OutboundMediaCache
+from avilla.core.utilles.metadata_cache import MetadataCache, MetadataCacheConfig
+from avilla.core.utilles.resource_cache import ResourceCache, ResourceCacheConfig
 from avilla.core.utilles import identity
-from avilla.standard.core.activity import ActivityEvent
-from avilla.standard.core.request import RequestEvent
 
 if TYPE_CHECKING:
     from graia.broadcast import Decorator, Dispatchable, Namespace, T_Dispatcher
@@ -42,6 +47,14 @@ class Avilla:
     protocols: list[BaseProtocol]
     accounts: dict[Selector, AccountInfo]
     service: AvillaService
+    http_client: HttpClientService
+    resource_cache: ResourceCache
+    metadata_cache: MetadataCache
+    media_cache: OutboundMediaCache
+    query_cache: QueryResultCache
+    event_subscriptions: EventSubscriptions
+    event_log: EventLogger
+    metrics: Metrics
     global_artifacts: dict[Any, Any]
 
     def __init__(
@@ -50,7 +63,18 @@ class Avilla:
         broadcast: Broadcast | None = None,
         launch_manager: Launart | None = None,
         message_cache_size: int = 300,
+        message_cache_bytes: int = 4 * 1024 * 1024,
+        message_cache_ttl: float | None = None,
+        message_cache_spill: bool = False,
         record_send: bool = True,
+        http_client_config: HttpClientConfig | None = None,
+        resource_cache_config: ResourceCacheConfig | None = None,
+        metadata_cache_config: MetadataCacheConfig | None = None,
+        media_cache_config: MediaCacheConfig | None = None,
+        query_config: QueryConfig | None = None,
+        skip_unobserved_events: bool = True,
+        event_log_config: EventLogConfig | None = None,
+        metrics_config: MetricsConfig | None = None,
     ):
         self.broadcast = broadcast or it(Broadcast)
         self.launch_manager = launch_manager or it(Launart)
@@ -58,33 +82,69 @@ class Avilla:
         self._protocol_map = {}
         self.accounts = {}
 
-        self.service = AvillaService(self, message_cache_size)
+        self.service = AvillaService(
+            self,
+            message_cache_size,
+            cache_bytes=message_cache_bytes,
+            cache_ttl=message_cache_ttl,
+            cache_spill=message_cache_spill,
+        )
+        self.http_client = HttpClientService(http_client_config)
+        self.resource_cache = ResourceCache(resource_cache_config)
+        self.metadata_cache = MetadataCache(metadata_cache_config)
+        self.media_cache = OutboundMediaCache(media_cache_config)
+        self.query_cache = QueryResultCache(query_config)
+        self.event_subscriptions = EventSubscriptions(self.broadcast, enabled=skip_unobserved_events)
+        self.event_log = EventLogger(event_log_config)
+        self.metrics = Metrics(metrics_config)
         self.global_artifacts = {}
 
         self.launch_manager.add_component(MemcacheService())
         self.launch_manager.add_component(self.service)
+        self.launch_manager.add_component(self.http_client)
         self.broadcast.finale_dispatchers.append(AvillaBuiltinDispatcher(self))
 
         self.__init_isolate__()
 
+        from avilla.standard.core.account import AccountRegistered, AccountUnregistered
+
+        async def invalidate_account_staff(account: BaseAccount):
+            account.invalidate_staff()
+
+        invalidate_account_staff.__annotations__ = {"account": BaseAccount}
+        self.broadcast.receiver(AccountRegistered)(invalidate_account_staff)
+        self.broadcast.receiver(AccountUnregistered)(invalidate_account_staff)
+
+        self.__init_metadata_cache__()
+
         if message_cache_size > 0:
             from avilla.core.context import Context
             from avilla.core.message import Message
             from avilla.standard.core.account import AccountUnregistered
-            from avilla.standard.core.message import MessageReceived
+            from avilla.standard.core.message import (
+                MessageReceived,
+                MessageRevoked,
+                MessageSent,
+            )
 
-            @self.broadcast.receiver(MessageReceived)
             async def message_cacher(context: Context, message: Message):
                 if context.account.info.enabled_message_cache:
-                    self.service.message_cache[context.account.route].push(message)
+                    self.service.get_message_cache(context.account.route).push(message)
+
+            @self.broadcast.receiver(MessageRevoked)
+            async def message_revoked(event: MessageRevoked):
+                if (store := self.service.message_cache.get(event.context.account.route)) is not None:
+                    store.discard(event.message)
 
             @self.broadcast.receiver(AccountUnregistered)
             async def clear_cache(event: AccountUnregistered):
-                if event.account.route in self.service.message_cache:
-                    del self.service.message_cache[event.account.route]
+                self.service.drop_message_cache(event.account.route)
 
             message_cacher.__annotations__ = {"context": Context, "message": Message}
+            message_revoked.__annotations__ = {"event": MessageRevoked}
             clear_cache.__annotations__ = {"event": AccountUnregistered}
+            self.broadcast.receiver(MessageReceived)(message_cacher)
+            self.broadcast.receiver(MessageSent)(message_cacher)
 
         if record_send:
             from avilla.core.context import Context
@@ -93,87 +153,61 @@ class Avilla:
 
             @self.broadcast.receiver(MessageSent)
             async def message_sender(context: Context, message: Message):
-                scene = f"{'.'.join(f'{k}({v})' for k, v in context.scene.items())}"
-                logger.info(
-                    f"[{context.account.info.protocol.__class__.__name__.replace('Protocol', '')} "
-                    f"{context.account.route['account']}]: "
-                    f"{scene} <- {str(message.content)!r}"
-                )
+                self.event_log.record_sent(context, message)
 
             message_sender.__annotations__ = {"context": Context, "message": Message}
 
         self.custom_event_recorder: dict[type[AvillaEvent], Callable[[AvillaEvent], None]] = {}
 
-    def event_record(self, event: AvillaEvent | AvillaLifecycleEvent):
-        from avilla.standard.core.account.event import AccountStatusChanged
-        from avilla.standard.core.application import AvillaLifecycleEvent
-        from avilla.standard.core.message import (
-            MessageEdited,
-            MessageReceived,
-            MessageSent,
+    def __init_metadata_cache__(self):
+        from avilla.core.event import (
+            DirectSessionDestroyed,
+            MemberCreated,
+            MemberDestroyed,
+            RelationshipDestroyed,
+            RelationshipEvent,
+            SceneCreated,
+            SceneDestroyed,
         )
+        from avilla.standard.core.account import AccountUnregistered
 
-        if isinstance(event, AccountStatusChanged):
-            logger.debug(
-                f"[{event.account.info.protocol.__class__.__name__.replace('Protocol', '')} "
-                f"{event.account.route['account']}]: "
-                f"{event.__class__.__name__}"
-            )
-            return
-        if isinstance(event, AvillaLifecycleEvent):
-            logger.debug(event.__class__.__name__)
-            return
-        context = event.context
-        client = context.client.display
-        scene = context.scene.display
-        endpoint = context.endpoint.display
-
-        if isinstance(event, MessageSent):
-            return
-
-        if type(event) in self.custom_event_recorder:
-            self.custom_event_recorder[type(event)](event)
-
-        elif isinstance(event, RequestEvent):
-            logger.info(
-                f"[{context.account.info.protocol.__class__.__name__.replace('Protocol', '')} "
-                f"{context.account.route['account']}]: "
-                f"Request {event.request.request_type or event.request.id}"
-                f"{f' with {event.request.message}' if event.request.message else ''} "
-                f"from {client} in {scene}"
-            )
-        elif isinstance(event, ActivityEvent):
-            logger.info(
-                f"[{context.account.info.protocol.__class__.__name__.replace('Protocol', '')} "
-                f"{context.account.route['account']}]: "
-                f"Activity {event.id}: {event.activity}"
-                f"from {client} in {scene}"
-            )
-        elif isinstance(event, MetadataModified):
-            logger.info(
-                f"[{context.account.info.protocol.__class__.__name__.replace('Protocol', '')} "
-                f"{context.account.route['account']}]: "
-                f"Metadata {event.route} Modified: {event.details}"
-                f"from {client} in {scene}"
-            )
-        elif isinstance(event, MessageReceived):
-            logger.info(
-                f"[{context.account.info.protocol.__class__.__name__.replace('Protocol', '')} "
-                f"{context.account.route['account']}]: "
-                f"{scene} -> {str(event.message.content)!r}"
-            )
-        elif isinstance(event, MessageEdited):
-            logger.info(
-                f"[{context.account.info.protocol.__class__.__name__.replace('Protocol', '')} "
-                f"{context.account.route['account']}]: "
-                f"{scene} => {str(event.past)!r} -> {str(event.current)!r}"
-            )
-        else:
-            logger.info(
-                f"[{context.account.info.protocol.__class__.__name__.replace('Protocol', '')} "
-                f"{context.account.route['account']}]: "
-                f"{event.__class__.__name__} from {client} to {endpoint} in {scene}"
-            )
+        # 以最高优先级执行, 保证其他监听器拉取时已经失效
+        @self.broadcast.receiver(MetadataModified, priority=0)
+        async def invalidate_modified(event: MetadataModified):
+            self.metadata_cache.invalidate(event.context.account.route, event.endpoint, event.route)
+
+        @self.broadcast.receiver(AccountUnregistered)
+        async def invalidate_account(event: AccountUnregistered):
+            self.metadata_cache.invalidate_account(event.account.route)
+            self.query_cache.invalidate_account(event.account.route)
+
+        invalidate_modified.__annotations__ = {"event": MetadataModified}
+        invalidate_account.__annotations__ = {"event": AccountUnregistered}
+
+        # 同一个 callable 不能重复注册, 为每种事件生成一个监听器
+        def invalidate_destroyed_for(event_type: type[RelationshipDestroyed]):
+            async def invalidate_destroyed(event: RelationshipDestroyed):
+                self.metadata_cache.invalidate_prefix(event.context.account.route, event.context.endpoint)
+
+            invalidate_destroyed.__annotations__ = {"event": event_type}
+            self.broadcast.receiver(event_type, priority=0)(invalidate_destroyed)
+
+        for event_type in (RelationshipDestroyed, DirectSessionDestroyed, SceneDestroyed, MemberDestroyed):
+            invalidate_destroyed_for(event_type)
+
+        # 场景与成员的增减会改变查询的中间结果 (如群列表、成员列表)
+        def invalidate_queries_for(event_type: type[RelationshipEvent]):
+            async def invalidate_queries(event: RelationshipEvent):
+                self.query_cache.invalidate_account(event.context.account.route)
+
+            invalidate_queries.__annotations__ = {"event": event_type}
+            self.broadcast.receiver(event_type, priority=0)(invalidate_queries)
+
+        for event_type in (SceneCreated, SceneDestroyed, MemberCreated, MemberDestroyed):
+            invalidate_queries_for(event_type)
+
+    def event_record(self, event: AvillaEvent | AvillaLifecycleEvent):
+        self.event_log.record(event, self.custom_event_recorder)
 
     @overload
     def add_event_recorder(self, event_type: type[TE]) -> Callable[[Callable[[TE], None]], Callable[[TE], None]]:
@@ -1,4 +1,6 @@
 import asyncio
+import re
+from contextlib import suppress
 from dataclasses import dataclass
 from typing import (
     Any,
@@ -50,6 +52,7 @@ from avilla.core import Context, MessageReceived, Notice
 
 T = TypeVar("T")
 TCallable = TypeVar("TCallable", bound=Callable[..., Any])
+_CommandEntry = tuple[Alconna, ExecTarget, bool, bool]
 
 
 @dataclass
@@ -150,20 +153,89 @@ class AvillaCommands:
         self.remove_tome = remove_tome
         config.namespaces["Avilla"] = Namespace(self.__namespace__)
 
+        # 快捷指令索引: 字面量的 key 按前缀查找, 其余 (正则、带前缀或 flags 的) 总是作为候选
+        self._shortcut_trie: CharTrie = CharTrie()
+        self._shortcut_always: dict[tuple[int, int], _CommandEntry] = {}
+        self._shortcut_keys: dict[tuple[int, int], tuple[str, ...]] = {}
+        self._initials: set[str] = set()
+
         @self.broadcast.receiver(MessageReceived)
         async def listener(event: MessageReceived):
-            msg = str(event.message.content.exclude(Notice)).lstrip()
+            content = event.message.content.exclude(Notice)
+            if not self._shortcut_always and not self._may_match(content):
+                return
+            msg = str(content).lstrip()
             if matches := list(self.trie.prefixes(msg)):
                 await asyncio.gather(*(self.execute(*res.value, event) for res in matches if res.value))  # type: ignore
                 return
             # shortcut
             head, _ = split_once(msg, (" ",))
-            for value in self.trie.values():
+            for value in self._shortcut_candidates(head):
                 try:
-                    command_manager.find_shortcut(value[0], head)  # type: ignore
+                    command_manager.find_shortcut(value[0], [head])
                 except ValueError:
                     continue
-                await self.execute(*value, event)  # type: ignore
+                await self.execute(*value, event)
+
+    def _may_match(self, content: MessageChain) -> bool:
+        """仅根据首个字符判断消息是否可能命中指令或字面量快捷指令, 避免将整条消息转为字符串."""
+        for element in content:
+            text = (element.text if isinstance(element, Text) else str(element)).lstrip()
+            if text:
+                return text[0] in self._initials
+        return False
+
+    def _shortcut_candidates(self, head: str) -> list[_CommandEntry]:
+        candidates = dict(self._shortcut_always)
+        for res in self._shortcut_trie.prefixes(head):
+            candidates.update(res.value)
+        return list(candidates.values())
+
+    def _index_command(self, entry: _CommandEntry, key: str):
+        self.trie[key] = entry
+        self._initials.add(key[:1])
+        self._index_shortcuts(entry)
+
+    def _index_shortcuts(self, entry: _CommandEntry) -> bool:
+        """将 entry 对应指令的快捷指令写入索引, 返回索引是否有变化."""
+        command = entry[0]
+        ident = (id(command), id(entry[1]))
+        shortcuts = {}
+        with suppress(ValueError):
+            shortcuts = command_manager.get_shortcut(command)
+        keys = tuple(sorted(shortcuts))
+        if self._shortcut_keys.get(ident, ()) == keys:
+            return False
+
+        self._shortcut_keys[ident] = keys
+        self._shortcut_always.pop(ident, None)
+        for key in list(self._shortcut_trie.keys()):
+            self._shortcut_trie[key].pop(ident, None)
+            if not self._shortcut_trie[key]:
+                del self._shortcut_trie[key]
+
+        for key, args in shortcuts.items():
+            literal = re.escape(key) == key and key
+            if not literal or getattr(args, "prefix", False) or getattr(args, "flags", 0):
+                self._shortcut_always[ident] = entry
+                continue
+            if self._shortcut_trie.has_key(key):
+                self._shortcut_trie[key][ident] = entry
+            else:
+                self._shortcut_trie[key] = {ident: entry}
+            self._initials.add(key[:1])
+        return True
+
+    def refresh_shortcuts(self):
+        """重建快捷指令索引; 直接通过 `Alconna.shortcut` 增删快捷指令后需调用此方法."""
+        for entry in {(id(i[0]), id(i[1])): i for i in self.trie.values()}.values():
+            self._index_shortcuts(entry)
+
+    def shortcut(self, command: Alconna, key: str, **kwargs: Any) -> str:
+        """为指令添加快捷指令, 并更新索引; 参数同 `Alconna.shortcut`."""
+        result = command.shortcut(key, **kwargs)
+        self.refresh_shortcuts()
+        return result
 
     @property
     def all_helps(self) -> str:
@@ -187,6 +259,8 @@ class AvillaCommands:
             except Exception as e:
                 _res = Arparma(command.path, event.message.content, False, error_info=e)
             may_help_text: Optional[str] = cap.get("output", None)
+        # 指令内置的 --shortcut 选项可能增删了快捷指令
+        self._index_shortcuts((command, target, need_tome, remove_tome))
         if _res.matched:
             await self.broadcast.Executor(target, [event.Dispatcher, AlconnaDispatcher(command)])
             target.oplog.clear()
@@ -254,18 +328,18 @@ class AvillaCommands:
                 key = _command.name + "".join(
                     f" {arg.value.target}" for arg in _command.args if isinstance(arg.value, DirectPattern)
                 )
-                self.trie[key] = (_command, target, need_tome, remove_tome)
+                self._index_command((_command, target, need_tome, remove_tome), key)
             else:
                 if not isinstance(command.command, str):
                     raise TypeError("Command name must be a string.")
+                command.reset_namespace(self.__namespace__)
                 if not command.prefixes:
-                    self.trie[command.command] = (command, target, need_tome, remove_tome)
+                    self._index_command((command, target, need_tome, remove_tome), command.command)
                 elif not all(isinstance(i, str) for i in command.prefixes):
                     raise TypeError("Command prefixes must be a list of string.")
                 else:
                     for prefix in cast(list[str], command.prefixes):
-                        self.trie[prefix + command.command] = (command, target, need_tome, remove_tome)
-                command.reset_namespace(self.__namespace__)
+                        self._index_command((command, target, need_tome, remove_tome), prefix + command.command)
             return func
 
         return wrapper
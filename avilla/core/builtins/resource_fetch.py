@@ -2,13 +2,13 @@ from __future__ import annotations
 
 from avilla.core.resource import LocalFileResource, RawResource, UrlResource
 from avilla.core.ryanvk.collector.application import ApplicationCollector
+from avilla.core.utilles.fileio import read_file
 
 try:
-    from aiohttp import ClientSession
+    import aiohttp  # noqa: F401
 
     aio = True
 except ImportError:
-    ClientSession = None
     aio = False
 
 from .capability import CoreCapability
@@ -17,7 +17,7 @@ from .capability import CoreCapability
 class CoreResourceFetchPerform((m := ApplicationCollector())._):
     @m.entity(CoreCapability.fetch, resource=LocalFileResource)
     async def fetch_localfile(self, resource: LocalFileResource):
-        return resource.file.read_bytes()
+        return await read_file(resource.file)
 
     @m.entity(CoreCapability.fetch, resource=RawResource)
     async def fetch_raw(self, resource: RawResource):
@@ -27,9 +27,7 @@ class CoreResourceFetchPerform((m := ApplicationCollector())._):
 
         @m.entity(CoreCapability.fetch, resource=UrlResource)
         async def fetch_url(self, resource: UrlResource):
-            async with ClientSession() as session:
-                async with session.get(resource.url) as resp:
-                    return await resp.read()
+            return await self.avilla.http_client.fetch(resource.url)
 
     else:
 
@@ -11,7 +11,6 @@ from avilla.core.metadata import Metadata, MetadataRoute
 from avilla.core.platform import Land
 from avilla.core.resource import Resource
 from avilla.core.ryanvk import Fn
-from avilla.core.ryanvk.staff import Staff
 from avilla.core.selector import FollowsPredicater, Selectable, Selector
 from avilla.core.utilles import classproperty
 
@@ -72,7 +71,8 @@ class Context:
         self.mediums = [ContextMedium(ContextSelector.from_selector(self, medium)) for medium in mediums or []]
 
         self.cache = {"meta": prelude_metadatas or {}}
-        self.staff = Staff(self.get_staff_artifacts(), self.get_staff_components())
+        self.staff = account.staff.ext(self.get_staff_components())
+        self.staff.artifact_collections = self.artifacts
 
     @property
     def protocol(self):
@@ -138,7 +138,18 @@ class Context:
             if not route.has_params():
                 return cast("_MetadataT", meta)
 
-        return await self.staff.pull_metadata(target, route)
+        if not flush and (store := self.avilla.service.message_cache.get(self.account.route)) is not None:
+            from avilla.core.message import Message
+
+            if route is Message and (message := await store.get(target)) is not None:
+                return cast("_MetadataT", message)
+
+        if route.has_params():
+            return await self.staff.pull_metadata(target, route)
+
+        return await self.avilla.metadata_cache.get_or_pull(
+            self.account.route, target, route, lambda: self.staff.pull_metadata(target, route), flush=flush
+        )
 
     @overload
     def __getitem__(self, closure: Selector) -> ContextSelector:
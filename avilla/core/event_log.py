@@ -0,0 +1,275 @@
+from __future__ import annotations
+
+import json
+import queue
+import random
+import threading
+import time
+from dataclasses import dataclass, field
+from functools import lru_cache
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, Callable, Dict, TextIO, Union
+
+from loguru import logger
+
+if TYPE_CHECKING:
+    from avilla.core.account import BaseAccount
+    from avilla.core.context import Context
+    from avilla.core.event import AvillaEvent
+    from avilla.core.message import Message
+    from avilla.standard.core.application import AvillaLifecycleEvent
+
+EventSink = Union[str, Path, TextIO, Callable[[str], Any]]
+
+
+@dataclass
+class EventLogConfig:
+    level: str = "INFO"
+    """事件日志的级别; 账号状态与生命周期事件固定为 DEBUG."""
+    sample_rate: Dict[type, float] = field(default_factory=dict)
+    """按事件类型 (含子类) 设置的采样率, 取值 0 ~ 1."""
+    rate_limit: Dict[type, float] = field(default_factory=dict)
+    """按事件类型 (含子类) 设置的每秒记录条数上限, 超出的部分会被计入 suppressed."""
+    json: bool = False
+    """以紧凑的 JSON 行输出, 便于日志系统采集."""
+    sink: EventSink | None = None
+    """设置后事件日志不再经过 loguru, 而是交给后台线程写入该目标, 不阻塞事件循环."""
+
+
+class _RateLimit:
+    __slots__ = ("rate", "tokens", "updated")
+
+    def __init__(self, rate: float):
+        self.rate = rate
+        self.tokens = max(rate, 1.0)
+        self.updated = time.monotonic()
+
+    def acquire(self) -> bool:
+        now = time.monotonic()
+        self.tokens = min(self.tokens + (now - self.updated) * self.rate, max(self.rate, 1.0))
+        self.updated = now
+        if self.tokens < 1:
+            return False
+        self.tokens -= 1
+        return True
+
+
+class _ThreadedSink:
+    """在后台线程中写入日志行; 调用方只需入队."""
+
+    def __init__(self, target: EventSink):
+        self._queue: queue.SimpleQueue[str | None] = queue.SimpleQueue()
+        self._file: TextIO | None = None
+        if isinstance(target, (str, Path)):
+            self._file = open(target, "a", encoding="utf-8")  # noqa: SIM115
+            self._write = self._file.write
+        elif callable(target):
+            self._write = lambda line: target(line)  # type: ignore
+        else:
+            self._write = target.write
+        self._thread = threading.Thread(target=self._run, name="avilla-event-log", daemon=True)
+        self._thread.start()
+
+    def put(self, line: str):
+        self._queue.put(line)
+
+    def _run(self):
+        while (line := self._queue.get()) is not None:
+            try:
+                self._write(line + "\n")
+            except Exception as e:
+                logger.error(f"failed to write event log: {e!r}")
+            if self._file is not None and self._queue.empty():
+                self._file.flush()
+
+    def close(self):
+        self._queue.put(None)
+        self._thread.join(timeout=5)
+        if self._file is not None:
+            self._file.close()
+
+
+@lru_cache(maxsize=None)
+def _record_types():
+    from avilla.standard.core.account.event import AccountStatusChanged
+    from avilla.standard.core.application import AvillaLifecycleEvent
+    from avilla.standard.core.message import MessageSent
+
+    return AccountStatusChanged, AvillaLifecycleEvent, MessageSent
+
+
+def _protocol_name(account: BaseAccount) -> str:
+    return account.info.protocol.__class__.__name__.replace("Protocol", "")
+
+
+class EventLogger:
+    """Avilla 的事件日志: 只有在确实会输出时才格式化事件.
+
+    默认经由 loguru 以 lazy 方式记录, 被日志级别过滤掉的事件不会产生格式化开销.
+    """
+
+    config: EventLogConfig
+    suppressed: dict[type, int]
+
+    _policies: dict[type, tuple[float | None, _RateLimit | None]]
+    _limits: dict[type, _RateLimit]
+    _sink: _ThreadedSink | None
+
+    def __init__(self, config: EventLogConfig | None = None):
+        self.config = config or EventLogConfig()
+        self.suppressed = {}
+        self._policies = {}
+        self._limits = {}
+        self._sink = None
+        self._lazy = logger.opt(lazy=True)
+
+    def _policy(self, event_type: type) -> tuple[float | None, _RateLimit | None]:
+        if (policy := self._policies.get(event_type)) is None:
+            mro = event_type.__mro__
+            sample_rate = next((self.config.sample_rate[i] for i in mro if i in self.config.sample_rate), None)
+            # 子类共用所匹配类型的令牌桶, 使 {AvillaEvent: 10} 表示总计每秒 10 条
+            limited = next((i for i in mro if i in self.config.rate_limit), None)
+            limit = None
+            if limited is not None and (limit := self._limits.get(limited)) is None:
+                limit = self._limits[limited] = _RateLimit(self.config.rate_limit[limited])
+            policy = self._policies[event_type] = (sample_rate, limit)
+        return policy
+
+    def admit(self, event_type: type) -> bool:
+        """按采样率与速率限制决定是否记录这一类型的事件."""
+        sample_rate, limit = self._policy(event_type)
+        if sample_rate is not None and random.random() >= sample_rate:
+            return False
+        if limit is not None and not limit.acquire():
+            self.suppressed[event_type] = self.suppressed.get(event_type, 0) + 1
+            return False
+        return True
+
+    def emit(self, level: str, render: Callable[[], str], record: Callable[[], dict[str, Any]]):
+        if self.config.sink is not None:
+            if self._sink is None:
+                self._sink = _ThreadedSink(self.config.sink)
+            self._sink.put(self.dump(record()) if self.config.json else render())
+        elif self.config.json:
+            self._lazy.log(level, "{}", lambda: self.dump(record()))
+        else:
+            self._lazy.log(level, "{}", render)
+
+    @staticmethod
+    def dump(record: dict[str, Any]) -> str:
+        return json.dumps(record, ensure_ascii=False, separators=(",", ":"), default=str)
+
+    def record(
+        self,
+        event: AvillaEvent | AvillaLifecycleEvent,
+        custom_recorders: dict[type[AvillaEvent], Callable[[AvillaEvent], None]] | None = None,
+    ):
+        AccountStatusChanged, AvillaLifecycleEvent, MessageSent = _record_types()
+
+        if isinstance(event, MessageSent):
+            return
+        if not self.admit(type(event)):
+            return
+
+        if isinstance(event, AccountStatusChanged):
+            self.emit(
+                "DEBUG",
+                lambda: f"[{_protocol_name(event.account)} {event.account.route['account']}]: "  # type: ignore
+                f"{event.__class__.__name__}",
+                lambda: {"event": event.__class__.__name__, "account": event.account.route.display},  # type: ignore
+            )
+            return
+        if isinstance(event, AvillaLifecycleEvent):
+            self.emit("DEBUG", lambda: event.__class__.__name__, lambda: {"event": event.__class__.__name__})
+            return
+
+        if custom_recorders and type(event) in custom_recorders:
+            custom_recorders[type(event)](event)
+            return
+
+        self.emit(self.config.level, lambda: self.render(event), lambda: self.to_record(event))  # type: ignore
+
+    def record_sent(self, context: Context, message: Message):
+        if not self.admit(_record_types()[2]):
+            return
+        self.emit(
+            self.config.level,
+            lambda: f"[{_protocol_name(context.account)} {context.account.route['account']}]: "
+            f"{'.'.join(f'{k}({v})' for k, v in context.scene.items())} <- {str(message.content)!r}",
+            lambda: {
+                **self._context_record(context, "MessageSent"),
+                "message": message.id,
+                "content": str(message.content),
+            },
+        )
+
+    @staticmethod
+    def render(event: AvillaEvent) -> str:
+        from avilla.core.event import MetadataModified
+        from avilla.standard.core.activity import ActivityEvent
+        from avilla.standard.core.message import MessageEdited, MessageReceived
+        from avilla.standard.core.request import RequestEvent
+
+        context = event.context
+        prefix = f"[{_protocol_name(context.account)} {context.account.route['account']}]: "
+
+        if isinstance(event, RequestEvent):
+            return (
+                f"{prefix}Request {event.request.request_type or event.request.id}"
+                f"{f' with {event.request.message}' if event.request.message else ''} "
+                f"from {context.client.display} in {context.scene.display}"
+            )
+        if isinstance(event, ActivityEvent):
+            return (
+                f"{prefix}Activity {event.id}: {event.activity} "
+                f"from {context.client.display} in {context.scene.display}"
+            )
+        if isinstance(event, MetadataModified):
+            return (
+                f"{prefix}Metadata {event.route} Modified: {event.details} "
+                f"from {context.client.display} in {context.scene.display}"
+            )
+        if isinstance(event, MessageReceived):
+            return f"{prefix}{context.scene.display} -> {str(event.message.content)!r}"
+        if isinstance(event, MessageEdited):
+            return f"{prefix}{context.scene.display} => {str(event.past)!r} -> {str(event.current)!r}"
+        return (
+            f"{prefix}{event.__class__.__name__} "
+            f"from {context.client.display} to {context.endpoint.display} in {context.scene.display}"
+        )
+
+    @staticmethod
+    def _context_record(context: Context, event_name: str) -> dict[str, Any]:
+        return {
+            "event": event_name,
+            "protocol": _protocol_name(context.account),
+            "account": context.account.route.display,
+            "client": context.client.display,
+            "endpoint": context.endpoint.display,
+            "scene": context.scene.display,
+        }
+
+    @classmethod
+    def to_record(cls, event: AvillaEvent) -> dict[str, Any]:
+        from avilla.core.event import MetadataModified
+        from avilla.standard.core.activity import ActivityEvent
+        from avilla.standard.core.message import MessageEdited, MessageReceived
+        from avilla.standard.core.request import RequestEvent
+
+        record = cls._context_record(event.context, event.__class__.__name__)
+        if isinstance(event, RequestEvent):
+            record.update(request=event.request.id, type=event.request.request_type, comment=event.request.message)
+        elif isinstance(event, ActivityEvent):
+            record.update(activity=event.activity.display, id=event.id)
+        elif isinstance(event, MetadataModified):
+            record.update(route=repr(event.route), details=event.details)
+        elif isinstance(event, MessageReceived):
+            record.update(message=event.message.id, content=str(event.message.content))
+        elif isinstance(event, MessageEdited):
+            record.update(message=event.message.id, past=str(event.past), current=str(event.current))
+        return record
+
+    def close(self):
+        if self._sink is not None:
+            self._sink.close()
+            self._sink = None
@@ -0,0 +1,102 @@
+from __future__ import annotations
+
+import asyncio
+from contextlib import asynccontextmanager
+from dataclasses import dataclass
+from typing import Any, AsyncIterator, Mapping
+
+from aiohttp import ClientResponse, ClientSession, ClientTimeout, TCPConnector
+from launart import Launart, Service
+from yarl import URL
+
+
+@dataclass
+class HttpClientConfig:
+    limit: int = 100
+    limit_per_host: int = 8
+    dns_cache_ttl: int = 300
+    keepalive_timeout: float = 30
+    connect_timeout: float | None = 30
+    read_timeout: float | None = 60
+    """两次读取之间的最长间隔; 不限制整个请求的耗时, 大文件下载不会因总时长超时."""
+
+
+class HttpClientService(Service):
+    """Avilla 共用的 HTTP 客户端, 复用连接池与 DNS 缓存.
+
+    对同一 URL 的并发 `fetch` 只会发出一次请求, 其余调用等待同一个结果;
+    非 2xx 响应会抛出 `aiohttp.ClientResponseError`, 而不是把错误页面作为资源内容返回.
+    """
+
+    id = "avilla.service/http"
+    required: set[str] = set()
+    stages: set[str] = {"preparing", "cleanup"}
+
+    config: HttpClientConfig
+    _session: ClientSession | None
+    _inflight: dict[tuple[str, Any], asyncio.Task[bytes]]
+
+    def __init__(self, config: HttpClientConfig | None = None):
+        self.config = config or HttpClientConfig()
+        self._session = None
+        self._inflight = {}
+        super().__init__()
+
+    @property
+    def session(self) -> ClientSession:
+        if self._session is None or self._session.closed:
+            self._session = ClientSession(
+                connector=TCPConnector(
+                    limit=self.config.limit,
+                    limit_per_host=self.config.limit_per_host,
+                    ttl_dns_cache=self.config.dns_cache_ttl,
+                    keepalive_timeout=self.config.keepalive_timeout,
+                ),
+                timeout=ClientTimeout(
+                    total=None, sock_connect=self.config.connect_timeout, sock_read=self.config.read_timeout
+                ),
+            )
+        return self._session
+
+    @asynccontextmanager
+    async def request(self, method: str, url: str | URL, **kwargs: Any) -> AsyncIterator[ClientResponse]:
+        async with self.session.request(method, url, **kwargs) as resp:
+            resp.raise_for_status()
+            yield resp
+
+    async def _fetch(self, url: str | URL, headers: Mapping[str, str] | None) -> bytes:
+        async with self.request("GET", url, headers=headers) as resp:
+            return await resp.read()
+
+    async def fetch(self, url: str | URL, *, headers: Mapping[str, str] | None = None) -> bytes:
+        key = (str(url), frozenset(headers.items()) if headers else None)
+        if (task := self._inflight.get(key)) is None:
+            # 请求由 service 持有, 发起方被取消时不影响其他等待者
+            task = self._inflight[key] = asyncio.create_task(self._fetch(url, headers))
+            task.add_done_callback(lambda _: self._fetch_done(key, task))
+        return await asyncio.shield(task)
+
+    def _fetch_done(self, key: tuple[str, Any], task: asyncio.Task[bytes]):
+        if self._inflight.get(key) is task:
+            del self._inflight[key]
+        if not task.cancelled():
+            task.exception()
+
+    async def stream(
+        self, url: str | URL, *, chunk_size: int = 65536, headers: Mapping[str, str] | None = None
+    ) -> AsyncIterator[bytes]:
+        async with self.request("GET", url, headers=headers) as resp:
+            async for chunk in resp.content.iter_chunked(chunk_size):
+                yield chunk
+
+    async def close(self):
+        if self._session is not None:
+            await self._session.close()
+            self._session = None
+
+    async def launch(self, manager: Launart):
+        async with self.stage("preparing"):
+            ...
+
+        async with self.stage("cleanup"):
+            await self.close()
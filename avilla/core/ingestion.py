@@ -0,0 +1,209 @@
+from __future__ import annotations
+
+import asyncio
+import time
+import weakref
+from collections import deque
+from dataclasses import dataclass
+from enum import Enum
+from itertools import count
+from typing import Any, Awaitable, Callable, ClassVar, Generic, Hashable, TypeVar
+
+from loguru import logger
+
+T = TypeVar("T")
+
+
+class OverflowPolicy(str, Enum):
+    BLOCK = "block"
+    """队列已满时挂起接收方, 直到有空位 (背压)."""
+
+    DROP_OLDEST = "drop_oldest"
+    """队列已满时丢弃最早入队的条目."""
+
+    SHED_LOW_PRIORITY = "shed_low_priority"
+    """队列已满时优先丢弃低优先级条目 (如 notice), 没有可丢弃的条目时按 `IngestionConfig.fallback` 处理."""
+
+
+@dataclass
+class IngestionConfig:
+    max_queue_size: int = 1024
+    workers: int = 8
+    overflow: OverflowPolicy = OverflowPolicy.BLOCK
+    fallback: OverflowPolicy = OverflowPolicy.BLOCK
+    """SHED_LOW_PRIORITY 没有可丢弃的低优先级条目时采用的策略, 只能是 BLOCK 或 DROP_OLDEST."""
+
+
+@dataclass
+class IngestionStats:
+    received: int = 0
+    handled: int = 0
+    failed: int = 0
+    dropped: int = 0
+    shed: int = 0
+
+
+class _IngestionLane:
+    maxsize: int
+    items: deque[tuple[Any, bool]]
+    readable: asyncio.Event
+    writable: asyncio.Event
+    idle: asyncio.Event
+
+    def __init__(self, maxsize: int):
+        self.maxsize = maxsize
+        self.items = deque()
+        self.readable = asyncio.Event()
+        self.writable = asyncio.Event()
+        self.writable.set()
+        self.idle = asyncio.Event()
+        self.idle.set()
+
+    @property
+    def full(self) -> bool:
+        return len(self.items) >= self.maxsize
+
+    def shed_low_priority(self) -> bool:
+        for index, (_, low_priority) in enumerate(self.items):
+            if low_priority:
+                del self.items[index]
+                return True
+        return False
+
+
+class EventIngestion(Generic[T]):
+    """协议侧原始事件的入口: 有界队列 + 固定数量的 worker.
+
+    同一 scene 的条目总是进入同一条 lane, 由同一个 worker 按顺序处理;
+    没有 scene 的条目轮流分配到各条 lane.
+    """
+
+    instances: ClassVar[weakref.WeakSet[EventIngestion]] = weakref.WeakSet()
+    WARN_INTERVAL: ClassVar[float] = 10.0
+
+    handler: Callable[[T], Awaitable[Any]]
+    config: IngestionConfig
+    stats: IngestionStats
+    name: str
+
+    _lanes: list[_IngestionLane]
+    _workers: list[asyncio.Task]
+    _warned_at: float | None
+
+    def __init__(
+        self,
+        handler: Callable[[T], Awaitable[Any]],
+        config: IngestionConfig | None = None,
+        *,
+        name: str | None = None,
+    ):
+        self.handler = handler
+        self.config = config or IngestionConfig()
+        self.stats = IngestionStats()
+        self.name = name or type(getattr(handler, "__self__", handler)).__name__
+        self._lanes = []
+        self._workers = []
+        self._round_robin = count()
+        self._warned_at = None
+        EventIngestion.instances.add(self)
+
+    @property
+    def running(self) -> bool:
+        return bool(self._workers)
+
+    @property
+    def queue_depth(self) -> int:
+        return sum(len(lane.items) for lane in self._lanes)
+
+    def start(self):
+        if self._workers:
+            return
+
+        workers = max(self.config.workers, 1)
+        lane_size = max(-(-self.config.max_queue_size // workers), 1)
+        self._lanes = [_IngestionLane(lane_size) for _ in range(workers)]
+        self._workers = [asyncio.create_task(self._work(lane)) for lane in self._lanes]
+
+    async def close(self, *, drain: bool = True):
+        if drain:
+            for lane in self._lanes:
+                await lane.idle.wait()
+
+        for task in self._workers:
+            task.cancel()
+        await asyncio.gather(*self._workers, return_exceptions=True)
+        self._workers = []
+
+    async def __aenter__(self):
+        self.start()
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb):
+        await self.close(drain=exc_type is None)
+
+    def _select_lane(self, scene: Hashable | None) -> _IngestionLane:
+        if scene is None:
+            return self._lanes[next(self._round_robin) % len(self._lanes)]
+        return self._lanes[hash(scene) % len(self._lanes)]
+
+    async def put(self, item: T, *, scene: Hashable | None = None, low_priority: bool = False) -> bool:
+        self.start()
+        self.stats.received += 1
+        lane = self._select_lane(scene)
+
+        while lane.full:
+            overflow = self.config.overflow
+            if overflow is OverflowPolicy.SHED_LOW_PRIORITY:
+                if low_priority:
+                    self.stats.shed += 1
+                    self._warn_overflow()
+                    return False
+                if lane.shed_low_priority():
+                    self.stats.shed += 1
+                    self._warn_overflow()
+                    continue
+                overflow = self.config.fallback
+
+            if overflow is OverflowPolicy.DROP_OLDEST:
+                lane.items.popleft()
+                self.stats.dropped += 1
+                self._warn_overflow()
+            else:
+                lane.writable.clear()
+                await lane.writable.wait()
+
+        lane.items.append((item, low_priority))
+        lane.idle.clear()
+        lane.readable.set()
+        return True
+
+    def _warn_overflow(self):
+        now = time.monotonic()
+        if self._warned_at is not None and now - self._warned_at < self.WARN_INTERVAL:
+            return
+
+        self._warned_at = now
+        logger.warning(
+            f"{self.name} ingestion queue is full, discarding events "
+            f"(dropped {self.stats.dropped}, shed {self.stats.shed} so far)"
+        )
+
+    async def _work(self, lane: _IngestionLane):
+        while True:
+            while not lane.items:
+                lane.readable.clear()
+                await lane.readable.wait()
+
+            item, _ = lane.items.popleft()
+            lane.writable.set()
+
+            try:
+                await self.handler(item)
+            except Exception as e:
+                self.stats.failed += 1
+                logger.exception(f"failed to handle ingested item: {e}")
+            else:
+                self.stats.handled += 1
+
+            if not lane.items:
+                lane.idle.set()
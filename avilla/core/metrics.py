@@ -0,0 +1,269 @@
+from __future__ import annotations
+
+import inspect
+import time
+from collections import defaultdict
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Any, Awaitable, Callable, Iterable
+
+from avilla.core.ingestion import EventIngestion
+from avilla.core.ratelimit import RateLimiter
+from avilla.core.utilles.histogram import DEFAULT_LATENCY_BUCKETS, LatencyHistogram
+
+if TYPE_CHECKING:
+    from graia.ryanvk import Fn
+
+
+@dataclass
+class MetricsConfig:
+    enabled: bool = False
+    endpoint: str | None = "/metrics"
+    """挂载到 UvicornASGIService 上的路径, 以 Prometheus 文本格式导出; 为 None 时不挂载."""
+    fn_latency: bool = True
+    """是否记录每个 Fn 的调用耗时; 会为每次 `Staff.call_fn` 与 `Staff.call_fn_many` 增加少量开销."""
+    buckets: tuple[float, ...] = DEFAULT_LATENCY_BUCKETS
+
+
+class _NullTimer:
+    __slots__ = ()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        return None
+
+
+_NULL_TIMER = _NullTimer()
+
+
+class _Timer:
+    __slots__ = ("histogram", "start")
+
+    def __init__(self, histogram: LatencyHistogram):
+        self.histogram = histogram
+
+    def __enter__(self):
+        self.start = time.perf_counter()
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.histogram.observe(time.perf_counter() - self.start, error=exc_type is not None)
+
+
+def _fn_name(fn: Fn) -> str:
+    owner = getattr(fn, "owner", None)
+    return f"{owner.__name__}.{fn.name}" if owner is not None else repr(fn)
+
+
+async def _observe_awaitable(histogram: LatencyHistogram, start: float, awaitable: Awaitable[Any]):
+    try:
+        result = await awaitable
+    except BaseException:
+        histogram.observe(time.perf_counter() - start, error=True)
+        raise
+    histogram.observe(time.perf_counter() - start)
+    return result
+
+
+def _summary(histogram: LatencyHistogram) -> dict[str, float]:
+    return {
+        "count": histogram.count,
+        "errors": histogram.errors,
+        "mean": histogram.mean,
+        "p50": histogram.quantile(0.5),
+        "p99": histogram.quantile(0.99),
+    }
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def _labels(**labels: str) -> str:
+    return ",".join(f'{k}="{_escape(str(v))}"' for k, v in labels.items())
+
+
+class Metrics:
+    """Avilla 的运行指标: 事件计数、Fn 与 RPC 耗时、事件队列深度、限频桶的状态.
+
+    未启用时各记录方法在检查 `enabled` 后立即返回; 调用方在需要额外计算标签时也应先检查 `enabled`.
+    """
+
+    config: MetricsConfig
+    events: defaultdict[tuple[str, str, str], int]
+    fn_latency: dict[str, LatencyHistogram]
+    rpc_latency: dict[tuple[str, str], LatencyHistogram]
+
+    _fn_names: dict[tuple[Fn, bool], str]
+
+    def __init__(self, config: MetricsConfig | None = None) -> None:
+        self.config = config or MetricsConfig()
+        self.events = defaultdict(int)
+        self.fn_latency = {}
+        self.rpc_latency = {}
+        self._fn_names = {}
+        if self.config.enabled:
+            self.enable()
+
+    @property
+    def enabled(self) -> bool:
+        return self.config.enabled
+
+    @property
+    def fn_enabled(self) -> bool:
+        return self.config.enabled and self.config.fn_latency
+
+    def enable(self):
+        self.config.enabled = True
+
+    def disable(self):
+        self.config.enabled = False
+
+    def count_event(self, protocol: str, event_type: str, stage: str):
+        """stage: received / parsed / skipped (无人订阅) / dropped (解析结果为空)."""
+        if self.config.enabled:
+            self.events[protocol, event_type, stage] += 1
+
+    def count_parsed(self, protocol: str, raw_type: str, result: Any):
+        """记录一次解析的结果: 产出的事件按类型计为 parsed, 结果为空时原始事件计为 dropped."""
+        if not self.config.enabled:
+            return
+        if result is None:
+            self.events[protocol, raw_type, "dropped"] += 1
+            return
+        for event in result if isinstance(result, list) else (result,):
+            self.events[protocol, type(event).__name__, "parsed"] += 1
+
+    def fn_histogram(self, fn: Fn, *, many: bool = False) -> LatencyHistogram:
+        """many 为 True 时返回 `call_fn_many` 整批调用的耗时, 与单次调用分开记录."""
+        if (name := self._fn_names.get((fn, many))) is None:
+            name = self._fn_names[fn, many] = _fn_name(fn) + ("[many]" if many else "")
+        if (histogram := self.fn_latency.get(name)) is None:
+            histogram = self.fn_latency[name] = LatencyHistogram(self.config.buckets)
+        return histogram
+
+    def call_fn(self, fn: Fn, call: Callable[..., Any], *args, **kwargs) -> Any:
+        """以 `call(fn, *args, **kwargs)` 调用 fn 并记录耗时; 异步实现记录到 await 结束为止."""
+        histogram = self.fn_histogram(fn)
+        start = time.perf_counter()
+        try:
+            result = call(fn, *args, **kwargs)
+        except BaseException:
+            histogram.observe(time.perf_counter() - start, error=True)
+            raise
+        if inspect.isawaitable(result):
+            return _observe_awaitable(histogram, start, result)
+        histogram.observe(time.perf_counter() - start)
+        return result
+
+    def time_fn_many(self, fn: Fn) -> _Timer:
+        return _Timer(self.fn_histogram(fn, many=True))
+
+    def time_rpc(self, protocol: str, action: str) -> _Timer | _NullTimer:
+        """以 with 语句记录一次协议端调用的耗时, 抛出异常时计为错误."""
+        if not self.config.enabled:
+            return _NULL_TIMER
+        if (histogram := self.rpc_latency.get((protocol, action))) is None:
+            histogram = self.rpc_latency[protocol, action] = LatencyHistogram(self.config.buckets)
+        return _Timer(histogram)
+
+    def observe_rpc(self, protocol: str, action: str, seconds: float, *, error: bool = False):
+        if not self.config.enabled:
+            return
+        if (histogram := self.rpc_latency.get((protocol, action))) is None:
+            histogram = self.rpc_latency[protocol, action] = LatencyHistogram(self.config.buckets)
+        histogram.observe(seconds, error=error)
+
+    @staticmethod
+    def ingestion_stats() -> dict[str, dict[str, int]]:
+        result: dict[str, dict[str, int]] = {}
+        for ingestion in list(EventIngestion.instances):
+            record = result.setdefault(ingestion.name, defaultdict(int))
+            record["queue_depth"] += ingestion.queue_depth
+            for key, value in vars(ingestion.stats).items():
+                record[key] += value
+        return {k: dict(v) for k, v in result.items()}
+
+    @staticmethod
+    def rate_limit_stats() -> dict[str, dict[str, dict[str, float]]]:
+        return {limiter.name: limiter.stats() for limiter in list(RateLimiter.instances)}
+
+    def snapshot(self) -> dict[str, Any]:
+        return {
+            "events": {"/".join(k): v for k, v in self.events.items()},
+            "fn": {k: _summary(v) for k, v in self.fn_latency.items()},
+            "rpc": {"/".join(k): _summary(v) for k, v in self.rpc_latency.items()},
+            "ingestion": self.ingestion_stats(),
+            "rate_limit": self.rate_limit_stats(),
+        }
+
+    @staticmethod
+    def _render_histogram(name: str, histograms: Iterable[tuple[str, LatencyHistogram]]) -> list[str]:
+        lines = [f"# TYPE {name}_seconds histogram"]
+        errors = [f"# TYPE {name}_errors_total counter"]
+        for labels, histogram in histograms:
+            seen = 0
+            for bound, count in zip(histogram.buckets, histogram.counts):
+                seen += count
+                le = "+Inf" if bound == float("inf") else repr(bound)
+                lines.append(f'{name}_seconds_bucket{{{labels},le="{le}"}} {seen}')
+            lines.append(f"{name}_seconds_sum{{{labels}}} {histogram.total}")
+            lines.append(f"{name}_seconds_count{{{labels}}} {histogram.count}")
+            errors.append(f"{name}_errors_total{{{labels}}} {histogram.errors}")
+        return lines + errors
+
+    def render(self) -> str:
+        """以 Prometheus 文本格式导出全部指标."""
+        lines = ["# TYPE avilla_events_total counter"]
+        for (protocol, event_type, stage), count in self.events.items():
+            lines.append(f"avilla_events_total{{{_labels(protocol=protocol, type=event_type, stage=stage)}}} {count}")
+
+        lines += self._render_histogram(
+            "avilla_fn_latency", ((_labels(fn=k), v) for k, v in self.fn_latency.items())
+        )
+        lines += self._render_histogram(
+            "avilla_rpc_latency",
+            ((_labels(protocol=protocol, action=action), v) for (protocol, action), v in self.rpc_latency.items()),
+        )
+
+        ingestion = self.ingestion_stats()
+        lines.append("# TYPE avilla_ingestion_queue_depth gauge")
+        lines.extend(
+            f"avilla_ingestion_queue_depth{{{_labels(name=name)}}} {record['queue_depth']}"
+            for name, record in ingestion.items()
+        )
+        lines.append("# TYPE avilla_ingestion_items_total counter")
+        for name, record in ingestion.items():
+            lines.extend(
+                f"avilla_ingestion_items_total{{{_labels(name=name, result=key)}}} {value}"
+                for key, value in record.items()
+                if key != "queue_depth"
+            )
+
+        rate_limit = self.rate_limit_stats()
+        for key, kind in (
+            ("waiting", "gauge"),
+            ("blocked", "gauge"),
+            ("sent", "counter"),
+            ("waited", "counter"),
+            ("limited", "counter"),
+        ):
+            name = f"avilla_rate_limit_{key}" + ("_total" if kind == "counter" else "")
+            lines.append(f"# TYPE {name} {kind}")
+            lines.extend(
+                f"{name}{{{_labels(name=limiter, route=route)}}} {record[key]}"
+                for limiter, routes in rate_limit.items()
+                for route, record in routes.items()
+            )
+        return "\n".join(lines) + "\n"
+
+    def asgi_app(self):
+        from starlette.applications import Starlette
+        from starlette.responses import PlainTextResponse
+        from starlette.routing import Route
+
+        async def endpoint(_):
+            return PlainTextResponse(self.render(), media_type="text/plain; version=0.0.4")
+
+        return Starlette(routes=[Route("/", endpoint)])
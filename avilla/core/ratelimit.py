@@ -0,0 +1,164 @@
+from __future__ import annotations
+
+import asyncio
+import time
+import weakref
+from dataclasses import dataclass, field
+from typing import Awaitable, Callable, ClassVar, Hashable, TypeVar
+
+from loguru import logger
+
+T = TypeVar("T")
+
+
+@dataclass
+class RateLimitConfig:
+    enabled: bool = True
+    rate: float = 10.0
+    """每个桶每秒补充的请求数."""
+    burst: int = 10
+    """每个桶允许的突发请求数."""
+    routes: dict[str, tuple[float, int]] = field(default_factory=dict)
+    """按路由覆盖 (rate, burst), 键为 RateLimiter 使用的路由名."""
+    max_retries: int = 3
+    """被服务端限频后, 按其给出的等待时间重试的最大次数."""
+    max_buckets: int = 4096
+    """桶的数量超过该值时清理已回满且无人等待的桶."""
+
+
+@dataclass
+class BucketStats:
+    sent: int = 0
+    waited: int = 0
+    limited: int = 0
+
+
+class _Bucket:
+    rate: float
+    burst: int
+    tokens: float
+    updated: float
+    blocked_until: float
+    waiting: int
+    stats: BucketStats
+
+    def __init__(self, rate: float, burst: int):
+        self.rate = rate
+        self.burst = max(burst, 1)
+        self.tokens = float(self.burst)
+        self.updated = time.monotonic()
+        self.blocked_until = 0.0
+        self.waiting = 0
+        self.stats = BucketStats()
+        # 按到达顺序放行, 突发的请求被平滑到 rate 之内
+        self._lock = asyncio.Lock()
+
+    def _refill(self, now: float):
+        self.tokens = min(self.burst, self.tokens + (now - self.updated) * self.rate)
+        self.updated = now
+
+    @property
+    def idle(self) -> bool:
+        now = time.monotonic()
+        self._refill(now)
+        return not self.waiting and now >= self.blocked_until and self.tokens >= self.burst
+
+    async def acquire(self):
+        self.waiting += 1
+        try:
+            async with self._lock:
+                waited = False
+                while True:
+                    now = time.monotonic()
+                    if now < self.blocked_until:
+                        delay = self.blocked_until - now
+                    else:
+                        self._refill(now)
+                        if self.tokens >= 1:
+                            self.tokens -= 1
+                            break
+                        delay = (1 - self.tokens) / self.rate
+                    waited = True
+                    await asyncio.sleep(delay)
+        finally:
+            self.waiting -= 1
+        self.stats.sent += 1
+        if waited:
+            self.stats.waited += 1
+
+    def block(self, seconds: float):
+        self.blocked_until = max(self.blocked_until, time.monotonic() + seconds)
+        self.tokens = 0.0
+        self.stats.limited += 1
+
+
+class RateLimiter:
+    """协议端 HTTP 调用的限频调度: 每个 (路由, 目标) 一个令牌桶.
+
+    请求在桶内排队, 超出 rate 的突发会被平滑; 服务端返回限频时,
+    整个桶按其给出的等待时间暂停, 再重试该请求.
+    """
+
+    instances: ClassVar[weakref.WeakSet[RateLimiter]] = weakref.WeakSet()
+
+    config: RateLimitConfig
+    name: str
+    buckets: dict[tuple[str, Hashable], _Bucket]
+
+    def __init__(self, config: RateLimitConfig | None = None, *, name: str = "rate_limiter") -> None:
+        self.config = config or RateLimitConfig()
+        self.name = name
+        self.buckets = {}
+        RateLimiter.instances.add(self)
+
+    def bucket(self, route: str, target: Hashable = None) -> _Bucket:
+        if (bucket := self.buckets.get((route, target))) is None:
+            if len(self.buckets) >= self.config.max_buckets:
+                self._prune()
+            rate, burst = self.config.routes.get(route, (self.config.rate, self.config.burst))
+            bucket = self.buckets[route, target] = _Bucket(rate, burst)
+        return bucket
+
+    def _prune(self):
+        for key in [k for k, v in self.buckets.items() if v.idle]:
+            del self.buckets[key]
+
+    async def run(
+        self,
+        route: str,
+        target: Hashable,
+        call: Callable[[], Awaitable[T]],
+        retry_after: Callable[[Exception], float | None],
+    ) -> T:
+        """在 (route, target) 的桶中排队执行 call; retry_after 从异常中取出服务端要求的等待秒数, 不是限频时返回 None."""
+        if not self.config.enabled:
+            return await call()
+
+        bucket = self.bucket(route, target)
+        retries = 0
+        while True:
+            await bucket.acquire()
+            try:
+                return await call()
+            except Exception as e:
+                if (delay := retry_after(e)) is None or retries >= self.config.max_retries:
+                    raise
+                retries += 1
+                bucket.block(delay)
+                logger.warning(f"{self.name}: rate limited on {route} ({target}), retry in {delay:.2f}s")
+
+    def stats(self) -> dict[str, dict[str, float]]:
+        """按路由汇总桶的状态; 目标的数量可能很多, 不逐一列出."""
+        result: dict[str, dict[str, float]] = {}
+        now = time.monotonic()
+        for (route, _), bucket in self.buckets.items():
+            record = result.setdefault(
+                route, {"buckets": 0, "waiting": 0, "blocked": 0, "sent": 0, "waited": 0, "limited": 0}
+            )
+            record["buckets"] += 1
+            record["waiting"] += bucket.waiting
+            record["blocked"] += bucket.blocked_until > now
+            record["sent"] += bucket.stats.sent
+            record["waited"] += bucket.stats.waited
+            record["limited"] += bucket.stats.limited
+        return result
@@ -1,11 +1,14 @@
 from __future__ import annotations
 
-from collections import deque
+import asyncio
+import operator
+import time
+from collections import OrderedDict, deque
 from dataclasses import dataclass
-from typing import Any, AsyncGenerator, Callable, Container, Protocol, overload
+from typing import Any, AsyncGenerator, Callable, Container, Hashable, Mapping, Protocol, Sequence, overload
 
 from avilla.core.selector import Selector, _FollowItem
-from graia.ryanvk import BaseCollector
+from graia.ryanvk import GLOBAL_DISPATCH_CACHE, BaseCollector
 
 
 @dataclass(unsafe_hash=True)
@@ -80,6 +83,150 @@ async def query_depth_generator(
             yield current
 
 
+_QUERY_DONE = object()
+_FEED_DONE = object()
+
+
+class _QueryFailure:
+    def __init__(self, exc: BaseException) -> None:
+        self.exc = exc
+
+
+async def query_fanout_generator(
+    handler: QueryHandler,
+    predicate: Callable[[str, str], bool] | str,
+    previous_generator: AsyncGenerator[Selector, None] | None = None,
+    *,
+    concurrency: int = 8,
+):
+    """与 `query_depth_generator` 相同, 但对不同的上级 selector 并发执行查询, 至多 `concurrency` 个.
+
+    结果按完成顺序产出, 不保证与上级的顺序一致.
+    """
+    if previous_generator is None or concurrency <= 1:
+        async for current in query_depth_generator(handler, predicate, previous_generator):
+            yield current
+        return
+
+    # 有界队列: 调用方消费较慢时, 并发的查询会在此等待而不是无限堆积结果
+    queue: asyncio.Queue[Any] = asyncio.Queue(maxsize=concurrency * 64)
+    window = asyncio.Semaphore(concurrency)
+    tasks: set[asyncio.Task[None]] = set()
+    started = 0
+
+    async def run(previous: Selector):
+        try:
+            try:
+                async for current in handler(predicate, previous):
+                    await queue.put(current)
+            except Exception as e:
+                await queue.put(_QueryFailure(e))
+            await queue.put(_QUERY_DONE)
+        finally:
+            window.release()
+
+    async def feed():
+        nonlocal started
+
+        try:
+            async for previous in previous_generator:
+                await window.acquire()
+                started += 1
+                task = asyncio.create_task(run(previous))
+                tasks.add(task)
+                task.add_done_callback(tasks.discard)
+        except Exception as e:
+            await queue.put(_QueryFailure(e))
+        await queue.put(_FEED_DONE)
+
+    feeder = asyncio.create_task(feed())
+    finished = 0
+    fed = False
+    try:
+        while not fed or finished < started:
+            item = await queue.get()
+            if item is _QUERY_DONE:
+                finished += 1
+            elif item is _FEED_DONE:
+                fed = True
+            elif isinstance(item, _QueryFailure):
+                raise item.exc
+            else:
+                yield item
+    finally:
+        feeder.cancel()
+        for task in [*tasks]:
+            task.cancel()
+        await asyncio.gather(feeder, *tasks, return_exceptions=True)
+
+
+@dataclass
+class QueryConfig:
+    concurrency: int = 8
+    """对不同上级 selector 并发查询的数量上限."""
+    cache_ttl: float = 0
+    """中间结果 (如群列表) 的缓存时间, 为 0 时不缓存.
+
+    账号的缓存会在收到场景或成员的创建、销毁事件时失效; 协议端未推送这些事件时, 结果在 TTL 内可能过期.
+    """
+    cache_max_entries: int = 256
+
+
+class QueryResultCache:
+    """短时缓存查询中间步骤的结果, 仅缓存不带筛选条件的步骤."""
+
+    config: QueryConfig
+    _entries: OrderedDict[Hashable, tuple[tuple[Selector, ...], float]]
+
+    def __init__(self, config: QueryConfig | None = None) -> None:
+        self.config = config or QueryConfig()
+        self._entries = OrderedDict()
+
+    @property
+    def enabled(self) -> bool:
+        return self.config.cache_ttl > 0
+
+    def get(self, key: Hashable) -> tuple[Selector, ...] | None:
+        record = self._entries.get(key)
+        if record is None:
+            return
+        if record[1] < time.monotonic():
+            del self._entries[key]
+            return
+        self._entries.move_to_end(key)
+        return record[0]
+
+    def set(self, key: Hashable, value: tuple[Selector, ...]):
+        self._entries[key] = (value, time.monotonic() + self.config.cache_ttl)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.config.cache_max_entries:
+            self._entries.popitem(last=False)
+
+    def wrap(self, handler: QueryHandler, key: Callable[[Selector | None], Hashable]) -> QueryHandler:
+        async def cached(predicate: Callable[[str, str], bool] | str, previous: Selector | None = None):
+            cache_key = key(previous)
+            if (result := self.get(cache_key)) is not None:
+                for i in result:
+                    yield i
+                return
+
+            collected = []
+            async for i in handler(predicate, previous):
+                collected.append(i)
+                yield i
+            self.set(cache_key, tuple(collected))
+
+        return cached
+
+    def invalidate_account(self, account: Selector | None):
+        """失效该账号的全部条目; 缓存键以 `(account, ...)` 形式的元组开头."""
+        for key in [k for k in self._entries if isinstance(k, tuple) and k and k[0] == account]:
+            del self._entries[key]
+
+    def clear(self):
+        self._entries.clear()
+
+
 @dataclass
 class _MatchStep:
     upper: str
@@ -109,3 +256,44 @@ def find_querier_steps(
                 else:
                     queue.append(_MatchStep(full_path, head.start, head.history + (query,)))
     return result
+
+
+_query_plans: OrderedDict[
+    Hashable, tuple[int, tuple[Mapping[Any, Any], ...], tuple[tuple[int, QueryRecord], ...] | None]
+] = OrderedDict()
+
+
+def plan_query(
+    artifact_collections: Sequence[Mapping[Any, Any]],
+    artifacts: Container[Any],
+    frags: list[_FollowItem],
+) -> list[tuple[tuple[_FollowItem, ...], QueryRecord]] | None:
+    """带缓存的 `find_querier_steps`.
+
+    路径只取决于各段的名称与已注册的 QueryRecord, 因此以名称和 artifact collections 为键缓存, 再按当前的 frags 还原;
+    collect 等操作会使 `GLOBAL_DISPATCH_CACHE.generation` 递增, 此时重新规划.
+    """
+    collections = tuple(artifact_collections)
+    key = (tuple(map(id, collections)), tuple(i.name for i in frags))
+    generation = GLOBAL_DISPATCH_CACHE.generation
+    cached = _query_plans.get(key)
+    if cached is not None and cached[0] == generation and all(map(operator.is_, cached[1], collections)):
+        _query_plans.move_to_end(key)
+        plan = cached[2]
+    else:
+        steps = find_querier_steps(artifacts, frags)
+        plan = None if steps is None else tuple((len(items), record) for items, record in steps)
+        _query_plans[key] = (generation, collections, plan)
+        _query_plans.move_to_end(key)
+        if len(_query_plans) > 1024:
+            _query_plans.popitem(last=False)
+
+    if plan is None:
+        return
+
+    result = []
+    offset = 0
+    for length, record in plan:
+        result.append(((*frags[offset : offset + length],), record))
+        offset += length
+    return result
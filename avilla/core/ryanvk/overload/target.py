@@ -1,11 +1,15 @@
 from __future__ import annotations
 
+from collections.abc import Mapping
 from dataclasses import dataclass, field
+from functools import lru_cache
+from types import MappingProxyType
 from typing import TYPE_CHECKING, Any, Callable
 
 from typing_extensions import TypeAlias
 
 from avilla.core.selector import FollowsPredicater, Selector, _parse_follows
+from graia.ryanvk import GLOBAL_DISPATCH_CACHE
 from graia.ryanvk.collector import BaseCollector
 from graia.ryanvk.overload import FnOverload
 
@@ -26,6 +30,22 @@ LookupBranches: TypeAlias = "dict[str | FollowsPredicater | None, LookupBranch]"
 LookupCollection: TypeAlias = "dict[str, LookupBranches]"
 
 
+@dataclass(frozen=True)
+class CompiledLookupBranch:
+    bind: frozenset[tuple[BaseCollector, Callable]]
+    levels: CompiledLookupCollection
+
+
+@dataclass(frozen=True)
+class CompiledLookupBranches:
+    literals: Mapping[str, CompiledLookupBranch]
+    predicates: tuple[tuple[FollowsPredicater, CompiledLookupBranch], ...]
+    default: CompiledLookupBranch | None
+
+
+CompiledLookupCollection: TypeAlias = "Mapping[str, CompiledLookupBranches]"
+
+
 @dataclass
 class TargetOverloadConfig:
     pattern: str
@@ -53,7 +73,87 @@ def _merge_lookup_collection(current: LookupCollection, other: LookupCollection)
     current |= other
 
 
+def _compile_lookup_collection(collection: LookupCollection) -> CompiledLookupCollection:
+    result = {}
+
+    for key, branches in collection.items():
+        literals: dict[str, CompiledLookupBranch] = {}
+        predicates: list[tuple[FollowsPredicater, CompiledLookupBranch]] = []
+        default = branches.get(None)
+
+        for header, branch in branches.items():
+            if header is None:
+                continue
+
+            # 默认分支的 levels 在这里预先合并, 而不是在每次查找时进行.
+            levels = branch.levels if default is None else default.levels | branch.levels
+            compiled = CompiledLookupBranch(frozenset(branch.bind), _compile_lookup_collection(levels))
+
+            if callable(header):
+                predicates.append((header, compiled))
+            else:
+                literals[header] = compiled
+
+        result[key] = CompiledLookupBranches(
+            MappingProxyType(literals),
+            tuple(predicates),
+            None
+            if default is None
+            else CompiledLookupBranch(frozenset(default.bind), _compile_lookup_collection(default.levels)),
+        )
+
+    return MappingProxyType(result)
+
+
+class CompiledTargetLookup:
+    root: CompiledLookupCollection
+
+    def __init__(self, collection: LookupCollection, maxsize: int = 1024):
+        self.root = _compile_lookup_collection(collection)
+        self.lookup = lru_cache(maxsize=maxsize)(self._lookup)
+
+    def _lookup(self, selector: Selector) -> frozenset[tuple[BaseCollector, Callable]] | None:
+        levels = self.root
+        branch = None
+
+        for key, value in selector.pattern.items():
+            if (branches := levels.get(key)) is None:
+                return
+
+            branch = branches.literals.get(value)
+            if branch is None:
+                for predicate, candidate in branches.predicates:
+                    if predicate(value):
+                        branch = candidate  # hit predicate
+                        break
+                else:
+                    if branches.default is not None:
+                        branch = branches.default  # hit default
+                    elif "*" in branches.literals:
+                        return branches.literals["*"].bind or None  # hit wildcard
+                    else:
+                        return
+
+            levels = branch.levels
+
+        if branch is not None and branch.bind:
+            return branch.bind
+
+
 class TargetOverload(FnOverload):
+    compiled: dict[int, tuple[int, LookupCollection, CompiledTargetLookup]]
+
+    def __init__(self) -> None:
+        self.compiled = {}
+
+    def get_lookup(self, collection: LookupCollection) -> CompiledTargetLookup:
+        # collect 等操作会使 generation 递增, 此时重新编译.
+        generation = GLOBAL_DISPATCH_CACHE.generation
+        record = self.compiled.get(id(collection))
+        if record is None or record[0] != generation or record[1] is not collection:
+            record = self.compiled[id(collection)] = (generation, collection, CompiledTargetLookup(collection))
+        return record[2]
+
     def collect_entity(
         self,
         collector: BaseCollector,
@@ -94,47 +194,19 @@ class TargetOverload(FnOverload):
             branch.bind.add(record)
 
     def get_entities(self, scope: dict[Any, Any], args: dict[str, Selector]) -> set[tuple[BaseCollector, Callable]]:
-        bind_sets: list[set] = []
+        bind_sets: list[frozenset] = []
 
         for arg_name, selector in args.items():
             if arg_name not in scope:
                 raise NotImplementedError
 
-            def get_bind_set():
-                processing_scope: LookupCollection = scope[arg_name]
-                branch = None
-                for key, value in selector.pattern.items():
-                    if (branches := processing_scope.get(key)) is None:
-                        raise NotImplementedError
-
-                    if value in branches:
-                        header = value
-                    else:
-                        for _key, branch in branches.items():
-                            if callable(_key) and _key(value):
-                                header = _key
-                                break  # hit predicate
-                        else:
-                            if None in branches:
-                                header = None  # hit default
-                            elif "*" in branches:
-                                return branches["*"].bind  # hit wildcard
-                            else:
-                                raise NotImplementedError
-
-                    branch = branches[header]
-                    processing_scope = branch.levels
-
-                    if header is not None and None in branches:
-                        processing_scope = branches[None].levels | processing_scope
-                if branch is not None and branch.bind:
-                    # branch has bind
-                    return branch.bind
-
+            bind = self.get_lookup(scope[arg_name]).lookup(selector)
+            if bind is None:
                 raise NotImplementedError
 
-            bind_sets.append(get_bind_set())
-        return bind_sets.pop().intersection(*bind_sets)
+            bind_sets.append(bind)
+
+        return set(bind_sets.pop().intersection(*bind_sets))
 
     def merge_scopes(self, *scopes: dict[Any, Any]):
         # scope layout: {
@@ -152,4 +224,6 @@ class TargetOverload(FnOverload):
             for other in collections:
                 _merge_lookup_collection(current, other)
 
+            self.get_lookup(current)
+
         return result
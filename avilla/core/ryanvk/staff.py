@@ -1,26 +1,32 @@
 from __future__ import annotations
 
 from functools import reduce
-from typing import TYPE_CHECKING, Any, Callable, ChainMap, overload
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, AsyncIterator, Awaitable, Callable, Iterable, overload
 
 from typing_extensions import ParamSpec, TypeVar, Unpack
 
 from avilla.core.builtins.capability import CoreCapability
 from avilla.core.metadata import MetadataRoute
+from avilla.core.resource import LocalFileResource
 from avilla.core.selector import (
     FollowsPredicater,
     Selector,
     _FollowItem,
     _parse_follows,
 )
+from avilla.core.utilles.resource_cache import iter_view, resource_cache_key
 from graia.ryanvk import BaseCollector
 from graia.ryanvk import Staff as BaseStaff
 
-from .descriptor.query import find_querier_steps, query_depth_generator
+from .descriptor.query import QueryConfig, QueryRecord, QueryResultCache, plan_query, query_fanout_generator
 
 if TYPE_CHECKING:
     from avilla.core.metadata import Metadata
+    from avilla.core.metrics import Metrics
     from avilla.core.resource import Resource
+    from avilla.core.utilles.resource_cache import ResourceCache
+    from graia.ryanvk import Fn
 
     from .descriptor.query import QueryHandler, QueryHandlerPerform
 
@@ -40,8 +46,60 @@ class Staff(BaseStaff):
     def get_context(self, target: Selector, *, via: Selector | None = None):
         return self.call_fn(CoreCapability.get_context, target, via=via)
 
+    @property
+    def fn_metrics(self) -> Metrics | None:
+        avilla = self.components.get("avilla")
+        if avilla is None or not avilla.metrics.fn_enabled:
+            return
+        return avilla.metrics
+
+    def call_fn(self, fn: Fn[P, R], *args: P.args, **kwargs: P.kwargs) -> R:
+        if (metrics := self.fn_metrics) is None:
+            return super().call_fn(fn, *args, **kwargs)
+        return metrics.call_fn(fn, super().call_fn, *args, **kwargs)
+
+    async def call_fn_many(self, fn: Fn[[T], R | Awaitable[R]], items: Iterable[T]) -> list[R]:
+        if (metrics := self.fn_metrics) is None:
+            return await super().call_fn_many(fn, items)
+        with metrics.time_fn_many(fn):
+            return await super().call_fn_many(fn, items)
+
+    @property
+    def resource_cache(self) -> ResourceCache | None:
+        avilla = self.components.get("avilla")
+        if avilla is None or not avilla.resource_cache.config.enabled:
+            return
+        return avilla.resource_cache
+
     async def fetch_resource(self, resource: Resource[T]) -> T:
-        return await self.get_fn_call(CoreCapability.fetch)(resource)
+        fetch = self.get_fn_call(CoreCapability.fetch)
+        if (cache := self.resource_cache) is None or (key := resource_cache_key(resource)) is None:
+            return await fetch(resource)
+        return await cache.get_or_fetch(key, lambda: fetch(resource))
+
+    async def fetch_resource_path(self, resource: Resource[bytes]) -> Path:
+        """获取资源在磁盘缓存中的路径, 适合较大的文件; 需要启用资源缓存及其磁盘层."""
+        if isinstance(resource, LocalFileResource):
+            return resource.file
+        if (cache := self.resource_cache) is None or (key := resource_cache_key(resource)) is None:
+            raise NotImplementedError("resource cache is not available for this resource")
+        if (path := await cache.path(key)) is None:
+            await self.fetch_resource(resource)
+            path = await cache.path(key)
+        if path is None:
+            raise NotImplementedError("disk tier of resource cache is disabled")
+        return path
+
+    async def stream_resource(self, resource: Resource[bytes], chunk_size: int = 65536) -> AsyncIterator[bytes]:
+        view = None
+        if (cache := self.resource_cache) is not None and (key := resource_cache_key(resource)) is not None:
+            view = await cache.view(key)
+        if view is None:
+            # 资源超出内存层的单项上限、已被淘汰或过期时不会留在缓存中, 直接使用取得的内容
+            view = memoryview(await self.fetch_resource(resource))
+
+        async for chunk in iter_view(view, chunk_size):
+            yield chunk
 
     @overload
     async def pull_metadata(
@@ -68,19 +126,28 @@ class Staff(BaseStaff):
 
     async def query_entities(self, pattern: str, **predicators: FollowsPredicater):
         items = _parse_follows(pattern, **predicators)
-        artifact_map = ChainMap(*self.artifact_collections)
-        steps = find_querier_steps(artifact_map, items)
+        artifact_map = self.artifact_map
+        steps = plan_query(self.artifact_collections, artifact_map, items)
 
         if steps is None:
             return
 
+        avilla = self.components.get("avilla")
+        config: QueryConfig = avilla.query_cache.config if avilla is not None else QueryConfig()
+        cache: QueryResultCache | None = avilla.query_cache if avilla is not None else None
+        account = self.components.get("account")
+        account_route = account.route if account is not None else None
+
         def build_handler(artifact: tuple[BaseCollector, QueryHandlerPerform]) -> QueryHandler:
             async def handler(predicate: Callable[[str, str], bool] | str, previous: Selector | None = None):
                 collector, entity = artifact
 
                 def _get_instance(_staff: Staff, _cls: type[N]) -> N:
                     if _cls not in _staff.instances:
-                        res = _staff.instances[_cls] = _cls(_staff)
+                        owner = _staff.instance_owner(_cls)  # type: ignore
+                        if _cls not in owner.instances:
+                            owner.instances[_cls] = _cls(owner)
+                        res = _staff.instances[_cls] = owner.instances[_cls]
                     else:
                         res = _staff.instances[_cls]
 
@@ -106,12 +173,26 @@ class Staff(BaseStaff):
 
             return predicater
 
+        def cache_key(record: QueryRecord):
+            return lambda previous: (account_route, record, previous)
+
         handlers = []
-        for follow_item, query_record in steps:
-            handlers.append((follow_item, build_handler(artifact_map[query_record])))
+        for index, (follow_item, query_record) in enumerate(steps):
+            handler = build_handler(artifact_map[query_record])
+            if (
+                cache is not None
+                and cache.enabled
+                and index < len(steps) - 1
+                and all(i.literal is None and i.predicate is None for i in follow_item)
+            ):
+                # 只缓存不带条件的中间步骤, 如 land.group.member 中的群列表
+                handler = cache.wrap(handler, cache_key(query_record))
+            handlers.append((follow_item, handler))
 
         r = reduce(
-            lambda previous, current: query_depth_generator(current[1], build_predicate(current[0]), previous),
+            lambda previous, current: query_fanout_generator(
+                current[1], build_predicate(current[0]), previous, concurrency=config.concurrency
+            ),
             handlers,
             None,
         )
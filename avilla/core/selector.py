@@ -1,10 +1,11 @@
 from __future__ import annotations
 
 import re
+import sys
 from collections.abc import Callable, Mapping
 from copy import deepcopy
 from dataclasses import dataclass
-from itertools import filterfalse
+from functools import lru_cache
 from types import MappingProxyType
 from typing import Protocol, runtime_checkable
 
@@ -17,9 +18,10 @@ ESCAPE = {")": "\\)", "(": "\\(", "]": "\\]", "[": "\\[", "}": "\\}", "{": "\\{"
 
 _follows_pattern = re.compile(r"(?P<name>(\w+?|[*~]))(#(?P<predicate>\w+))?(\((?P<literal>[^#]+?)\))?")
 FollowsPredicater: TypeAlias = "Callable[[str], bool]"
+SelectorItems: TypeAlias = "tuple[tuple[str, str], ...]"
 
 
-@dataclass
+@dataclass(frozen=True)
 class _FollowItem:
     name: str
     literal: str | None = None
@@ -52,6 +54,17 @@ def _parse_follows_item(item: str, items: dict[str, _FollowItem], predicates: di
 
 
 def _parse_follows(pattern: str, **kwargs: FollowsPredicater) -> list[_FollowItem]:
+    return list(_parse_follows_cached(pattern, tuple(kwargs.items())))
+
+
+@lru_cache(maxsize=1024)
+def _parse_follows_cached(
+    pattern: str, predicates: tuple[tuple[str, FollowsPredicater], ...]
+) -> tuple[_FollowItem, ...]:
+    return tuple(_parse_follows_uncached(pattern, **dict(predicates)))
+
+
+def _parse_follows_uncached(pattern: str, **kwargs: FollowsPredicater) -> list[_FollowItem]:
     items = {}
     item = ""
     bracket_stack = []
@@ -74,22 +87,63 @@ def _parse_follows(pattern: str, **kwargs: FollowsPredicater) -> list[_FollowIte
     return list(items.values())
 
 
+@lru_cache(maxsize=8192)
+def _intern_items(items: SelectorItems) -> tuple[SelectorItems, int]:
+    # 相同内容的 selector 共享同一个 items 元组, 顺带缓存其 hash.
+    return items, hash(("Selector", *items))
+
+
+def _replace_item(items: SelectorItems, key: str, value: str) -> SelectorItems:
+    for index, (k, _) in enumerate(items):
+        if k == key:
+            return (*items[:index], (key, value), *items[index + 1 :])
+    return (*items, (key, value))
+
+
 class Selector:
-    pattern: Mapping[str, str]
+    __slots__ = ("_items", "_hash", "_pattern")
+
+    _items: SelectorItems
+    _hash: int
+    _pattern: Mapping[str, str] | None
 
     def __init__(self, pattern: Mapping[str, str] = EMPTY_MAP) -> None:
-        self.pattern = MappingProxyType({k: str(v) for k, v in pattern.items()})
-        self._hash = hash(("Selector", *self.pattern.items()))
+        self._items, self._hash = _intern_items(tuple((sys.intern(k), str(v)) for k, v in pattern.items()))
+        self._pattern = None
+
+    @property
+    def pattern(self) -> Mapping[str, str]:
+        if self._pattern is None:
+            self._pattern = MappingProxyType(dict(self._items))
+        return self._pattern
 
     def modify(self, pattern: Mapping[str, str]) -> Self:
         return self.__class__(pattern=pattern)
 
+    def _derive(self, items: SelectorItems) -> Self:
+        if type(self) is not Selector:
+            return self.modify(dict(items))
+
+        instance = Selector.__new__(Selector)
+        instance._items, instance._hash = _intern_items(items)
+        instance._pattern = None
+        return instance  # type: ignore
+
+    def plain(self) -> Selector:
+        """去掉 ContextSelector 等子类携带的上下文; 子类与 Selector 不对称相等, 用作缓存键前应先调用."""
+        if type(self) is Selector:
+            return self
+
+        instance = Selector.__new__(Selector)
+        instance._items, instance._hash, instance._pattern = self._items, self._hash, None
+        return instance
+
     def __getattr__(self, name: str) -> Callable[[str], Self]:
-        if name.startswith("__"):
+        if name.startswith("__") or name in Selector.__slots__:
             return super().__getattribute__(name)  # type: ignore
 
         def wrapper(content: str) -> Self:
-            return self.modify({**self.pattern, name: str(content)})
+            return self._derive(_replace_item(self._items, sys.intern(name), str(content)))
 
         return wrapper
 
@@ -99,14 +153,21 @@ class Selector:
     def __eq__(self, o: object) -> bool:
         return isinstance(o, self.__class__) and o._hash == self._hash
 
+    def __reduce__(self):
+        # 序列化时总是还原为普通的 Selector, 不携带 ContextSelector 等绑定的上下文.
+        return Selector, (dict(self._items),)
+
     def __contains__(self, key: str) -> bool:
-        return key in self.pattern
+        return any(k == key for k, _ in self._items)
 
     def __getitem__(self, key: str) -> str:
-        return self.pattern[key]
+        for k, v in self._items:
+            if k == key:
+                return v
+        raise KeyError(key)
 
     def __repr__(self) -> str:
-        return f"{self.__class__.__name__}().{'.'.join(f'{k}({v})' for k, v in self.pattern.items())}"
+        return f"{self.__class__.__name__}().{'.'.join(f'{k}({v})' for k, v in self._items)}"
 
     def __copy__(self):
         return self.modify({**self.pattern})
@@ -117,43 +178,43 @@ class Selector:
 
     @property
     def empty(self) -> bool:
-        return not self.pattern
+        return not self._items
 
     @property
     def path(self) -> str:
-        return ".".join(self.pattern)
+        return ".".join(k for k, _ in self._items)
 
     @property
     def path_without_land(self) -> str:
-        return ".".join(filterfalse(lambda x: x == "land", self.pattern))
+        return ".".join(k for k, _ in self._items if k != "land")
 
     @property
     def display(self) -> str:
-        return ".".join(f"{k}({v})" for k, v in self.pattern.items())
+        return ".".join(f"{k}({v})" for k, v in self._items)
 
     @property
     def display_without_land(self) -> str:
-        return ".".join(f"{k}({v})" for k, v in self.pattern.items() if k != "land")
+        return ".".join(f"{k}({v})" for k, v in self._items if k != "land")
 
     @property
     def last_key(self) -> str:
-        return next(reversed(self.pattern.keys()))
+        return self._items[-1][0]
 
     @property
     def last_value(self) -> str:
-        return next(reversed(self.pattern.values()))
+        return self._items[-1][1]
 
     def items(self):
         return self.pattern.items()
 
     def appendix(self, key: str, value: str):
-        return self.modify({**self.pattern, key: str(value)})
+        return self._derive(_replace_item(self._items, sys.intern(key), str(value)))
 
     def land(self, land: Land | str):
         if isinstance(land, Land):
             land = land.name
 
-        return self.modify({"land": land, **{k: v for k, v in self.pattern.items() if k != "land"}})
+        return self._derive((("land", str(land)), *((k, v) for k, v in self._items if k != "land")))
 
     def to_selector(self):
         return self
@@ -171,9 +232,9 @@ class Selector:
     from_follows_pattern = from_follows
 
     def follows(self, pattern: str, **kwargs: FollowsPredicater) -> bool:
-        items = _parse_follows(pattern, **kwargs)
+        items = _parse_follows_cached(pattern, tuple(kwargs.items()))
         index = 0
-        for index, (item, name, value) in enumerate(zip(items, self.pattern.keys(), self.pattern.values())):
+        for index, (item, (name, value)) in enumerate(zip(items, self._items)):
             if item.name == "*":
                 return True
             if item.name != name:
@@ -182,10 +243,10 @@ class Selector:
                 return False
             if item.literal is not None and value != item.literal:
                 return False
-        return index + 1 == len(self.pattern)
+        return index + 1 == len(self._items)
 
     def into(self, pattern: str, **kwargs: str) -> Self:
-        items = _parse_follows(pattern)
+        items = _parse_follows_cached(pattern, ())
         new_patterns = {}
         iterator = iter(self.pattern)
         if items and items[0].name == "~":
@@ -1,12 +1,12 @@
 from __future__ import annotations
 
-from collections import defaultdict
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Any
 
 from launart import Launart, Service
 from loguru import logger
 
-from avilla.core.utilles.message_cache import MessageCacheDeque
+from avilla.core.utilles.message_cache import MessageSpill, MessageStore
+from avilla.core.utilles.store import get_cache_file
 from avilla.standard.core.application import (
     ApplicationClosed,
     ApplicationClosing,
@@ -27,15 +27,51 @@ class AvillaService(Service):
 
     avilla: Avilla
     enabled_cache_message: bool
-    message_cache: defaultdict[Selector, MessageCacheDeque]
-
-    def __init__(self, avilla: Avilla, cache_size: int):
+    message_cache: dict[Selector, MessageStore]
+
+    message_cache_size: int
+    message_cache_bytes: int
+    message_cache_ttl: float | None
+    message_cache_spill: bool
+
+    _metrics_mount: tuple[Any, str] | None
+
+    def __init__(
+        self,
+        avilla: Avilla,
+        cache_size: int,
+        *,
+        cache_bytes: int = 4 * 1024 * 1024,
+        cache_ttl: float | None = None,
+        cache_spill: bool = False,
+    ):
         self.avilla = avilla
-        if cache_size > 0:
-            self.enabled_cache_message = True
-            self.message_cache = defaultdict(lambda: MessageCacheDeque(cache_size))
+        self.enabled_cache_message = cache_size > 0
+        self.message_cache = {}
+        self.message_cache_size = cache_size
+        self.message_cache_bytes = cache_bytes
+        self.message_cache_ttl = cache_ttl
+        self.message_cache_spill = cache_spill
+        self._metrics_mount = None
         super().__init__()
 
+    def get_message_cache(self, account: Selector) -> MessageStore:
+        if account not in self.message_cache:
+            spill = None
+            if self.message_cache_spill:
+                spill = MessageSpill(get_cache_file("message_cache", f"{account.display}.sqlite3"))
+            self.message_cache[account] = MessageStore(
+                self.message_cache_bytes,
+                max_count=self.message_cache_size,
+                ttl=self.message_cache_ttl,
+                spill=spill,
+            )
+        return self.message_cache[account]
+
+    def drop_message_cache(self, account: Selector):
+        if (store := self.message_cache.pop(account, None)) is not None:
+            store.close()
+
     @property
     def required(self) -> set[str]:
         return set()
@@ -47,6 +83,24 @@ class AvillaService(Service):
     def get_interface(self, interface_type):
         ...
 
+    def mount_metrics(self, manager: Launart):
+        config = self.avilla.metrics.config
+        if not config.enabled or config.endpoint is None:
+            return
+
+        try:
+            from graia.amnesia.builtins.asgi import UvicornASGIService
+
+            asgi_service = manager.get_component(UvicornASGIService)
+        except (ImportError, ValueError):
+            logger.warning("metrics endpoint requires UvicornASGIService, skipped")
+            return
+
+        endpoint = config.endpoint.rstrip("/")
+        asgi_service.middleware.mounts[endpoint] = self.avilla.metrics.asgi_app()  # type: ignore
+        self._metrics_mount = (asgi_service, endpoint)
+        logger.info(f"Metrics available at {config.endpoint}")
+
     async def launch(self, manager: Launart):
         async with self.stage("preparing"):
             await self.avilla.broadcast.postEvent(ApplicationPreparing(self.avilla))
@@ -60,6 +114,8 @@ class AvillaService(Service):
                     # alt=f"[magenta]Using platform: [/][dark_orange]{protocol.__class__.platform}[/]",
                 )
 
+            self.mount_metrics(manager)
+
         await self.avilla.broadcast.postEvent(ApplicationReady(self.avilla))
 
         async with self.stage("blocking"):
@@ -67,5 +123,12 @@ class AvillaService(Service):
 
         async with self.stage("cleanup"):
             await self.avilla.broadcast.postEvent(ApplicationClosing(self.avilla))
+            for account in list(self.message_cache):
+                self.drop_message_cache(account)
+            self.avilla.resource_cache.close()
+            self.avilla.media_cache.clear()
+            self.avilla.event_log.close()
+            if self._metrics_mount is not None:
+                self._metrics_mount[0].middleware.mounts.pop(self._metrics_mount[1], None)
 
         await self.avilla.broadcast.postEvent(ApplicationClosed(self.avilla))
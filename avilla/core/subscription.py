@@ -0,0 +1,197 @@
+from __future__ import annotations
+
+from itertools import chain
+from typing import TYPE_CHECKING, Any, Callable, Iterable, Iterator, Mapping, MutableMapping, TypeVar
+
+from graia.ryanvk import GLOBAL_DISPATCH_CACHE
+from graia.ryanvk.sign import FnImplement
+
+if TYPE_CHECKING:
+    from graia.broadcast import Broadcast
+    from graia.broadcast.entities.event import Dispatchable
+    from graia.ryanvk import Fn, Staff
+    from graia.ryanvk.sign import FnRecord
+
+T = TypeVar("T", bound=Callable)
+
+
+def produces(*event_types: type[Dispatchable]):
+    """标注事件解析实现可能产出的事件类型.
+
+    标注后, 若这些事件都没有监听器, 原始事件会在构造 Context、反序列化消息之前被跳过;
+    因此只应标注没有其他副作用的实现, 未标注的实现总是会被执行.
+    """
+
+    def wrapper(entity: T) -> T:
+        entity.__avilla_produces__ = event_types  # type: ignore
+        return entity
+
+    return wrapper
+
+
+def _scope_entities(scope: Mapping[Any, Any]) -> Iterator[Callable]:
+    # overload scope 为按参数、取值嵌套的 dict, 叶子是 (collector, entity) 的集合
+    for value in scope.values():
+        if isinstance(value, Mapping):
+            yield from _scope_entities(value)
+        else:
+            for _, entity in value:
+                yield entity
+
+
+def _has_producers(record: FnRecord) -> bool:
+    """在 Fn 的 artifact record 中查找是否存在经 `produces` 标注的实现."""
+    entities: Iterable[Callable] = chain.from_iterable(map(_scope_entities, record["overload_scopes"].values()))
+    if (record_tuple := record["record_tuple"]) is not None:
+        entities = chain(entities, (record_tuple[1],))  # type: ignore
+    return any(hasattr(i, "__avilla_produces__") for i in entities)
+
+
+class _TrackedList(list):
+    """变更时递增 owner.version 的 list."""
+
+    __slots__ = ("owner",)
+
+    owner: EventSubscriptions
+
+    def __init__(self, owner: EventSubscriptions, iterable: Iterable[Any] = ()):
+        super().__init__(iterable)
+        self.owner = owner
+
+    def _track(self, item: Any) -> Any:
+        return item
+
+    def _changed(self):
+        self.owner.version += 1
+
+    def append(self, item: Any):
+        super().append(self._track(item))
+        self._changed()
+
+    def extend(self, items: Iterable[Any]):
+        super().extend(map(self._track, items))
+        self._changed()
+
+    def insert(self, index: Any, item: Any):
+        super().insert(index, self._track(item))
+        self._changed()
+
+    def remove(self, item: Any):
+        super().remove(item)
+        self._changed()
+
+    def pop(self, index: Any = -1):
+        item = super().pop(index)
+        self._changed()
+        return item
+
+    def clear(self):
+        super().clear()
+        self._changed()
+
+    def __setitem__(self, index: Any, item: Any):
+        if isinstance(index, slice):
+            super().__setitem__(index, list(map(self._track, item)))
+        else:
+            super().__setitem__(index, self._track(item))
+        self._changed()
+
+    def __delitem__(self, index: Any):
+        super().__delitem__(index)
+        self._changed()
+
+    def __iadd__(self, items: Iterable[Any]):
+        self.extend(items)
+        return self
+
+
+class _ListenerList(_TrackedList):
+    __slots__ = ()
+
+    def _track(self, item: Any) -> Any:
+        # Broadcast.receiver 会向已有监听器的 listening_events 追加事件类型, 同样需要追踪
+        events = getattr(item, "listening_events", None)
+        if isinstance(events, list) and not (isinstance(events, _TrackedList) and events.owner is self.owner):
+            item.listening_events = _TrackedList(self.owner, events)
+        return item
+
+
+class EventSubscriptions:
+    """记录当前有监听器的事件类型, 供协议侧跳过无人订阅的原始事件.
+
+    监听器的增删会使缓存的结果失效; 被隐藏或禁用的 Namespace 中的监听器也视作订阅者.
+
+    Avilla 自身的缓存也以监听器的形式工作: 启用消息缓存时 MessageReceived / MessageSent / MessageRevoked,
+    以及 metadata 缓存失效所用的 MetadataModified 与各 *Destroyed 事件始终有订阅者, 产出这些事件的原始事件不会被跳过.
+    """
+
+    broadcast: Broadcast
+    enabled: bool
+    version: int
+    skipped: int
+
+    _listeners: _ListenerList | None
+    _observed: frozenset[type]
+    _observed_version: int
+    _annotated: dict[tuple[Fn, tuple[int, ...]], tuple[int, tuple[MutableMapping[Any, Any], ...], bool]]
+
+    def __init__(self, broadcast: Broadcast, *, enabled: bool = True) -> None:
+        self.broadcast = broadcast
+        self.enabled = enabled
+        self.version = 0
+        self.skipped = 0
+        self._listeners = None
+        self._observed = frozenset()
+        self._observed_version = -1
+        self._annotated = {}
+
+    def _ensure_tracked(self):
+        if self.broadcast.listeners is not self._listeners:
+            # 首次访问, 或 listeners 被整体替换
+            self._listeners = _ListenerList(self, [])
+            self._listeners.extend(self.broadcast.listeners)
+            self.broadcast.listeners = self._listeners
+
+    @property
+    def observed(self) -> frozenset[type]:
+        self._ensure_tracked()
+        if self._observed_version != self.version:
+            self._observed = frozenset(i for listener in self.broadcast.listeners for i in listener.listening_events)
+            self._observed_version = self.version
+        return self._observed
+
+    def is_observed(self, *event_types: type[Dispatchable]) -> bool:
+        return not self.observed.isdisjoint(event_types)
+
+    def annotated(self, staff: Staff, fn: Fn) -> bool:
+        """staff 中 fn 的实现是否有任何一个经 `produces` 标注; 结果随 dispatch cache 的 generation 失效."""
+        maps = tuple(staff.artifact_map.maps)
+        key = (fn, tuple(map(id, maps)))
+        generation = GLOBAL_DISPATCH_CACHE.generation
+        cached = self._annotated.get(key)
+        if cached is None or cached[0] != generation or any(a is not b for a, b in zip(cached[1], maps)):
+            record = staff.artifact_map.get(FnImplement(fn))
+            cached = self._annotated[key] = (generation, maps, record is not None and _has_producers(record))
+        return cached[2]
+
+    def skippable(self, staff: Staff, fn: Fn, *args, **kwargs) -> bool:
+        """判断原始事件是否可以跳过: 对应的实现已用 `produces` 标注, 且标注的事件都无人订阅.
+
+        fn 没有任何标注的实现时直接返回 False, 不再解析实现; 否则会多做一次 `harvest_overload`,
+        其结果进入 dispatch cache, 随后实际调用 fn 时可直接命中.
+        """
+        if not self.enabled or not self.annotated(staff, fn):
+            return False
+
+        try:
+            _, entity = fn.behavior.harvest_overload(staff, fn, *args, **kwargs)
+        except NotImplementedError:
+            # 交由调用方按原流程处理
+            return False
+
+        event_types = getattr(entity, "__avilla_produces__", None)
+        if event_types is None or self.is_observed(*event_types):
+            return False
+
+        self.skipped += 1
+        return True
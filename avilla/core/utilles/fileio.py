@@ -0,0 +1,88 @@
+from __future__ import annotations
+
+import asyncio
+import base64
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+from pathlib import Path
+from typing import IO, AsyncIterator, Callable, TypeVar
+
+_T = TypeVar("_T")
+
+BASE64_CHUNK_SIZE = 3 * 256 * 1024
+"""分块编码时每块读取的字节数; 须为 3 的倍数, 各块的编码结果才能直接拼接."""
+
+_max_workers = 4
+_executor: ThreadPoolExecutor | None = None
+
+
+def configure_file_io(max_workers: int):
+    """设置本地文件读写线程池的大小, 需在首次读写前调用."""
+    global _max_workers, _executor
+
+    _max_workers = max(max_workers, 1)
+    if _executor is not None:
+        _executor.shutdown(wait=False)
+        _executor = None
+
+
+def _get_executor() -> ThreadPoolExecutor:
+    global _executor
+
+    if _executor is None:
+        _executor = ThreadPoolExecutor(_max_workers, thread_name_prefix="avilla-fileio")
+    return _executor
+
+
+async def run_io(func: Callable[..., _T], *args) -> _T:
+    """在有界的线程池中执行阻塞的文件操作, 避免占用事件循环."""
+    return await asyncio.get_running_loop().run_in_executor(_get_executor(), partial(func, *args))
+
+
+async def read_file(path: Path) -> bytes:
+    return await run_io(path.read_bytes)
+
+
+async def file_size(path: Path) -> int:
+    return (await run_io(path.stat)).st_size
+
+
+async def open_file(path: Path) -> IO[bytes]:
+    return await run_io(path.open, "rb")
+
+
+def _read_b64(file: IO[bytes], size: int) -> str:
+    return base64.b64encode(file.read(size)).decode("ascii")
+
+
+async def iter_file(path: Path, chunk_size: int = 65536) -> AsyncIterator[bytes]:
+    file = await open_file(path)
+    try:
+        while chunk := await run_io(file.read, chunk_size):
+            yield chunk
+    finally:
+        await run_io(file.close)
+
+
+async def iter_b64encode_file(path: Path, chunk_size: int = BASE64_CHUNK_SIZE) -> AsyncIterator[str]:
+    """逐块读取并编码文件, 读取与编码都在线程池中完成."""
+    if chunk_size % 3:
+        raise ValueError("chunk_size must be a multiple of 3")
+
+    file = await open_file(path)
+    try:
+        while chunk := await run_io(_read_b64, file, chunk_size):
+            yield chunk
+    finally:
+        await run_io(file.close)
+
+
+async def b64encode_file(path: Path, chunk_size: int = BASE64_CHUNK_SIZE) -> str:
+    return "".join([chunk async for chunk in iter_b64encode_file(path, chunk_size)])
+
+
+async def b64encode(data: bytes) -> str:
+    """编码内存中的数据; 数据较大时交给线程池处理."""
+    if len(data) <= BASE64_CHUNK_SIZE:
+        return base64.b64encode(data).decode("ascii")
+    return await run_io(lambda: base64.b64encode(data).decode("ascii"))
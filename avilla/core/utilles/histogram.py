@@ -0,0 +1,54 @@
+from __future__ import annotations
+
+from bisect import bisect_left
+from math import inf
+
+DEFAULT_LATENCY_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, inf)
+
+
+class LatencyHistogram:
+    """固定分桶的耗时直方图, 单位为秒; 每个桶记录耗时不超过其上界的次数 (不累加)."""
+
+    buckets: tuple[float, ...]
+    counts: list[int]
+    count: int
+    total: float
+    errors: int
+
+    def __init__(self, buckets: tuple[float, ...] = DEFAULT_LATENCY_BUCKETS) -> None:
+        if buckets[-1] != inf:
+            buckets = (*buckets, inf)
+        self.buckets = buckets
+        self.counts = [0] * len(buckets)
+        self.count = 0
+        self.total = 0.0
+        self.errors = 0
+
+    def observe(self, seconds: float, *, error: bool = False):
+        self.counts[bisect_left(self.buckets, seconds)] += 1
+        self.count += 1
+        self.total += seconds
+        if error:
+            self.errors += 1
+
+    @property
+    def mean(self) -> float:
+        return self.total / self.count if self.count else 0.0
+
+    def quantile(self, q: float) -> float:
+        """返回 q 分位数所在桶的上界."""
+        if not self.count:
+            return 0.0
+        threshold = q * self.count
+        seen = 0
+        for bound, count in zip(self.buckets, self.counts):
+            seen += count
+            if seen >= threshold:
+                return bound
+        return inf
+
+    def __repr__(self) -> str:
+        return (
+            f"<LatencyHistogram count={self.count} errors={self.errors} "
+            f"mean={self.mean:.4f} p50<={self.quantile(0.5)} p99<={self.quantile(0.99)}>"
+        )
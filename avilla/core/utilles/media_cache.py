@@ -0,0 +1,142 @@
+from __future__ import annotations
+
+import asyncio
+import hashlib
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Any, Awaitable, Callable, Hashable, TypeVar
+
+from avilla.core.resource import LocalFileResource, RawResource
+
+from .fileio import BASE64_CHUNK_SIZE, b64encode, b64encode_file, run_io
+
+_T = TypeVar("_T")
+
+
+@dataclass
+class MediaCacheConfig:
+    ttl: float | None = 600
+    memory_bytes: int = 64 * 1024 * 1024
+
+
+async def content_key(data: bytes | str) -> str:
+    if isinstance(data, str):
+        data = data.encode()
+    if len(data) <= BASE64_CHUNK_SIZE:
+        return hashlib.sha256(data).hexdigest()
+    return await run_io(lambda: hashlib.sha256(data).hexdigest())
+
+
+async def media_key(resource: LocalFileResource | RawResource) -> str | None:
+    """本地文件以路径、大小与修改时间标识, 不必为此读取整个文件; 内存中的数据以 sha256 标识."""
+    if isinstance(resource, LocalFileResource):
+        stat = await run_io(resource.file.stat)
+        return f"file:{resource.file.absolute()}:{stat.st_size}:{stat.st_mtime_ns}"
+    if isinstance(resource.data, (bytes, str)):
+        return f"sha256:{await content_key(resource.data)}"
+
+
+def _sizeof(value: Any) -> int:
+    if isinstance(value, (bytes, str)):
+        return len(value)
+    return 256
+
+
+class OutboundMediaCache:
+    """待发送媒体的缓存, 保存编码后的内容或平台返回的句柄 (如 QQAPI 的 file_info).
+
+    同一张图片发往多个场景时只编码或上传一次; 条目按 `namespace` 区分用途.
+    """
+
+    config: MediaCacheConfig
+    memory_usage: int
+
+    _entries: OrderedDict[tuple[str, Hashable], tuple[Any, int, float]]
+    _inflight: dict[tuple[str, Hashable], asyncio.Task[Any]]
+
+    def __init__(self, config: MediaCacheConfig | None = None) -> None:
+        self.config = config or MediaCacheConfig()
+        self.memory_usage = 0
+        self._entries = OrderedDict()
+        self._inflight = {}
+
+    def get(self, namespace: str, key: Hashable) -> Any | None:
+        record = self._entries.get((namespace, key))
+        if record is None:
+            return
+        if record[2] < time.monotonic():
+            self.discard(namespace, key)
+            return
+        self._entries.move_to_end((namespace, key))
+        return record[0]
+
+    def set(self, namespace: str, key: Hashable, value: Any, *, ttl: float | None = None):
+        ttl = self.config.ttl if ttl is None else ttl
+        if ttl == 0:
+            return
+
+        size = _sizeof(value)
+        if size > self.config.memory_bytes:
+            return
+        self.discard(namespace, key)
+        self._entries[namespace, key] = (value, size, time.monotonic() + ttl if ttl is not None else float("inf"))
+        self.memory_usage += size
+
+        while self.memory_usage > self.config.memory_bytes:
+            _, (_, evicted, _) = self._entries.popitem(last=False)
+            self.memory_usage -= evicted
+
+    async def get_or_create(
+        self,
+        namespace: str,
+        key: Hashable,
+        factory: Callable[[], Awaitable[_T]],
+        *,
+        ttl: Callable[[_T], float | None] | None = None,
+    ) -> _T:
+        """命中时直接返回; 否则调用 factory, 对同一键的并发请求只会调用一次.
+
+        `ttl` 可根据结果决定有效期, 如平台返回的句柄自带的过期时间.
+        """
+        if (value := self.get(namespace, key)) is not None:
+            return value
+
+        if (task := self._inflight.get((namespace, key))) is None:
+            task = self._inflight[namespace, key] = asyncio.create_task(self._create(namespace, key, factory, ttl))
+            task.add_done_callback(lambda _: self._inflight.pop((namespace, key), None))
+        return await asyncio.shield(task)
+
+    async def _create(
+        self,
+        namespace: str,
+        key: Hashable,
+        factory: Callable[[], Awaitable[_T]],
+        ttl: Callable[[_T], float | None] | None,
+    ) -> _T:
+        value = await factory()
+        if value is not None:
+            self.set(namespace, key, value, ttl=ttl(value) if ttl is not None else None)
+        return value
+
+    async def base64(self, resource: LocalFileResource | RawResource) -> str:
+        """返回资源内容的 base64 编码, 相同内容只编码一次."""
+        if isinstance(resource, LocalFileResource):
+            factory = lambda: b64encode_file(resource.file)  # noqa: E731
+        elif isinstance(resource.data, (bytes, str)):
+            data = resource.data.encode() if isinstance(resource.data, str) else resource.data
+            factory = lambda: b64encode(data)  # noqa: E731
+        else:
+            raise TypeError(f"cannot encode {type(resource.data)!r}")
+
+        if (key := await media_key(resource)) is None:
+            return await factory()
+        return await self.get_or_create("base64", key, factory)
+
+    def discard(self, namespace: str, key: Hashable):
+        if (record := self._entries.pop((namespace, key), None)) is not None:
+            self.memory_usage -= record[1]
+
+    def clear(self):
+        self._entries.clear()
+        self.memory_usage = 0
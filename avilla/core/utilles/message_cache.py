@@ -1,25 +1,401 @@
 from __future__ import annotations
 
-from collections import deque
-from typing import TYPE_CHECKING
-from weakref import WeakValueDictionary
+import asyncio
+import pickle
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from pathlib import Path
+from typing import TYPE_CHECKING, Callable, Iterable
+
+from .fileio import run_io
 
 if TYPE_CHECKING:
     from avilla.core.message import Message
     from avilla.core.selector import Selector
 
 
-class MessageCacheDeque:
-    messages: deque[Message]
-    _endpoint: WeakValueDictionary[Selector, Message]
+def estimate_message_size(message: Message) -> int:
+    """粗略估计一条消息在内存中占用的字节数, 仅用于预算统计."""
+    size = 256 + len(message.id)
+    for element in message.content:
+        size += 64 + len(str(element))
+    return size
 
-    def __init__(self, cache_size: int) -> None:
-        self.messages = deque(maxlen=cache_size)
-        self._endpoint = WeakValueDictionary()
+
+@dataclass
+class _MessageEntry:
+    message: Message
+    size: int
+    created: float
+
+
+class MessageSpill:
+    """以 sqlite 保存被 `MessageStore` 按预算淘汰的消息.
+
+    各方法均为阻塞调用, 由 `MessageStore` 放入文件读写线程池执行; 连接由 `lock` 保护.
+    """
+
+    path: Path
+    connection: sqlite3.Connection
+    lock: threading.Lock
+
+    def __init__(self, path: Path) -> None:
+        self.path = path
+        self.lock = threading.Lock()
+        self.connection = sqlite3.connect(path, check_same_thread=False, isolation_level=None)
+        self.connection.execute("PRAGMA journal_mode=WAL")
+        self.connection.execute(
+            "CREATE TABLE IF NOT EXISTS messages ("
+            "selector TEXT PRIMARY KEY, scene TEXT, sender TEXT, reply TEXT, created REAL, payload BLOB)"
+        )
+        self.connection.execute("CREATE INDEX IF NOT EXISTS messages_scene ON messages (scene, created)")
+        self.connection.execute("CREATE INDEX IF NOT EXISTS messages_reply ON messages (reply)")
+
+    @staticmethod
+    def _row(entry: _MessageEntry) -> tuple | None:
+        message = entry.message
+        try:
+            payload = pickle.dumps(message)
+        except Exception:
+            return
+
+        return (
+            message.to_selector().display,
+            message.scene.display,
+            message.sender.display,
+            message.reply.display if message.reply is not None else None,
+            entry.created,
+            payload,
+        )
+
+    def write(self, entries: Iterable[_MessageEntry], discards: Iterable[Selector] = (), expire: float | None = None):
+        """在一个事务中写入一批消息, 并执行积压的删除与过期清理."""
+        rows = [row for row in map(self._row, entries) if row is not None]
+        with self.lock:
+            self.connection.execute("BEGIN")
+            try:
+                self.connection.executemany("INSERT OR REPLACE INTO messages VALUES (?, ?, ?, ?, ?, ?)", rows)
+                self.connection.executemany(
+                    "DELETE FROM messages WHERE selector = ?", [(i.display,) for i in discards]
+                )
+                if expire is not None:
+                    self.connection.execute("DELETE FROM messages WHERE created < ?", (expire,))
+            except BaseException:
+                self.connection.execute("ROLLBACK")
+                raise
+            self.connection.execute("COMMIT")
+
+    def _load(self, rows: Iterable[tuple[bytes]]) -> list[Message]:
+        return [pickle.loads(payload) for payload, in rows]
+
+    def _query(self, sql: str, params: tuple) -> list[Message]:
+        with self.lock:
+            rows = self.connection.execute(sql, params).fetchall()
+        return self._load(rows)
+
+    def get(self, message: Selector, since: float) -> Message | None:
+        rows = self._query(
+            "SELECT payload FROM messages WHERE selector = ? AND created >= ?", (message.display, since)
+        )
+        if rows:
+            return rows[0]
+
+    def latest(self, scene: Selector, limit: int, since: float) -> list[Message]:
+        return self._query(
+            "SELECT payload FROM messages WHERE scene = ? AND created >= ? ORDER BY created DESC LIMIT ?",
+            (scene.display, since, limit),
+        )
+
+    def replies(self, message: Selector, since: float) -> list[Message]:
+        return self._query(
+            "SELECT payload FROM messages WHERE reply = ? AND created >= ? ORDER BY created",
+            (message.display, since),
+        )
+
+    def close(self):
+        with self.lock:
+            self.connection.close()
+
+
+class MessageStore:
+    """按字节预算保存消息, 并以 scene / sender / reply 建立二级索引.
+
+    超出预算时按 LRU 淘汰; 超过 `ttl` 的消息视为失效.
+    若提供了 `spill`, 因预算被淘汰的消息会写入磁盘, 查询时作为后备;
+    写入先在内存中积攒, 再由后台任务成批交给文件读写线程池, `push` 本身不会阻塞事件循环.
+    """
+
+    max_bytes: int
+    max_count: int | None
+    ttl: float | None
+    spill: MessageSpill | None
+    sizeof: Callable[[Message], int]
+
+    size: int
+    _entries: OrderedDict[Selector, _MessageEntry]
+    _timeline: OrderedDict[Selector, None]
+    _by_scene: dict[Selector, OrderedDict[Selector, None]]
+    _by_sender: dict[Selector, OrderedDict[Selector, None]]
+    _by_reply: dict[Selector, OrderedDict[Selector, None]]
+    _pending: dict[Selector, _MessageEntry]
+    _writing: dict[Selector, _MessageEntry]
+    _pending_discards: set[Selector]
+    _pending_expire: float | None
+    _flush_task: asyncio.Task | None
+
+    def __init__(
+        self,
+        max_bytes: int = 4 * 1024 * 1024,
+        *,
+        max_count: int | None = None,
+        ttl: float | None = None,
+        spill: MessageSpill | None = None,
+        sizeof: Callable[[Message], int] = estimate_message_size,
+    ) -> None:
+        self.max_bytes = max_bytes
+        self.max_count = max_count
+        self.ttl = ttl
+        self.spill = spill
+        self.sizeof = sizeof
+
+        self.size = 0
+        self._entries = OrderedDict()
+        self._timeline = OrderedDict()
+        self._spill_expired_at = 0.0
+        self._by_scene = {}
+        self._by_sender = {}
+        self._by_reply = {}
+        self._pending = {}
+        self._writing = {}
+        self._pending_discards = set()
+        self._pending_expire = None
+        self._flush_task = None
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __contains__(self, message: Selector) -> bool:
+        """只检查内存 (含尚未落盘的条目); 需要查询磁盘时使用 `get`."""
+        message = message.plain()
+        if (entry := self._entries.get(message) or self._spilled(message)) is None:
+            return False
+        return not self._expired(entry)
+
+    def _spilled(self, message: Selector) -> _MessageEntry | None:
+        return self._pending.get(message) or self._writing.get(message)
+
+    def _take_batch(self):
+        batch = (list(self._pending.values()), list(self._pending_discards), self._pending_expire)
+        self._writing = self._pending
+        self._pending = {}
+        self._pending_discards = set()
+        self._pending_expire = None
+        return batch
+
+    def _schedule_flush(self):
+        if self.spill is None or (self._flush_task is not None and not self._flush_task.done()):
+            return
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            self._flush_sync()
+            return
+        self._flush_task = loop.create_task(self.flush())
+
+    def _flush_sync(self):
+        if self.spill is not None and (self._pending or self._pending_discards or self._pending_expire is not None):
+            self.spill.write(*self._take_batch())
+            self._writing = {}
+
+    async def flush(self):
+        """将积攒的写入、删除与过期清理交给线程池执行, 直到没有新的积压."""
+        while (spill := self.spill) is not None and (
+            self._pending or self._pending_discards or self._pending_expire is not None
+        ):
+            try:
+                await run_io(spill.write, *self._take_batch())
+            finally:
+                self._writing = {}
+
+    @property
+    def _since(self) -> float:
+        return time.time() - self.ttl if self.ttl is not None else 0.0
+
+    @staticmethod
+    def _index_add(index: dict[Selector, OrderedDict[Selector, None]], key: Selector, selector: Selector):
+        index.setdefault(key, OrderedDict())[selector] = None
+
+    @staticmethod
+    def _index_remove(index: dict[Selector, OrderedDict[Selector, None]], key: Selector, selector: Selector):
+        bucket = index.get(key)
+        if bucket is None:
+            return
+        bucket.pop(selector, None)
+        if not bucket:
+            del index[key]
 
     def push(self, message: Message):
-        self.messages.append(message)
-        self._endpoint[message.to_selector()] = message
+        selector = message.to_selector().plain()
+        if selector in self._entries:
+            self._remove(selector)
+
+        entry = _MessageEntry(message, self.sizeof(message), time.time())
+        self._entries[selector] = entry
+        self.size += entry.size
+        self._timeline[selector] = None
+        self._index_add(self._by_scene, message.scene.plain(), selector)
+        self._index_add(self._by_sender, message.sender.plain(), selector)
+        if message.reply is not None:
+            self._index_add(self._by_reply, message.reply.plain(), selector)
+
+        self.evict()
+
+    def _remove(self, selector: Selector) -> _MessageEntry:
+        entry = self._entries.pop(selector)
+        message = entry.message
+        self.size -= entry.size
+        del self._timeline[selector]
+        self._index_remove(self._by_scene, message.scene.plain(), selector)
+        self._index_remove(self._by_sender, message.sender.plain(), selector)
+        if message.reply is not None:
+            self._index_remove(self._by_reply, message.reply.plain(), selector)
+        return entry
+
+    def _expired(self, entry: _MessageEntry) -> bool:
+        return self.ttl is not None and time.time() - entry.created > self.ttl
+
+    def evict(self):
+        if self.ttl is not None:
+            since = self._since
+            # _entries 按访问顺序排列, 过期与否则按 _timeline (写入顺序) 判断
+            while self._timeline and self._entries[next(iter(self._timeline))].created < since:
+                self._remove(next(iter(self._timeline)))
+            if self.spill is not None and since - self._spill_expired_at > self.ttl / 10:
+                self._spill_expired_at = since
+                self._pending_expire = since
+
+        while self._entries and (
+            self.size > self.max_bytes or (self.max_count is not None and len(self._entries) > self.max_count)
+        ):
+            selector = next(iter(self._entries))
+            entry = self._remove(selector)
+            if self.spill is not None:
+                self._pending[selector] = entry
+                self._pending_discards.discard(selector)
+
+        if self._pending or self._pending_expire is not None:
+            self._schedule_flush()
+
+    async def get(self, message: Selector) -> Message | None:
+        message = message.plain()
+        entry = self._entries.get(message)
+        if entry is not None:
+            if self._expired(entry):
+                self._remove(message)
+                return
+            self._entries.move_to_end(message)
+            return entry.message
+
+        if (entry := self._spilled(message)) is not None:
+            return None if self._expired(entry) else entry.message
+
+        if self.spill is not None:
+            return await run_io(self.spill.get, message, self._since)
+
+    def discard(self, message: Selector):
+        message = message.plain()
+        if message in self._entries:
+            self._remove(message)
+        if self.spill is not None:
+            self._pending.pop(message, None)
+            self._writing.pop(message, None)
+            self._pending_discards.add(message)
+            self._schedule_flush()
+
+    def _collect(self, selectors: Iterable[Selector], limit: int | None = None) -> list[Message]:
+        result = []
+        for selector in list(selectors):
+            entry = self._entries[selector]
+            if self._expired(entry):
+                self._remove(selector)
+                continue
+            result.append(entry.message)
+            if limit is not None and len(result) >= limit:
+                break
+        return result
 
-    def get(self, message_selector: Selector):
-        return self._endpoint.get(message_selector)
+    def _spilled_where(self, predicate: Callable[[Message], bool]) -> list[Message]:
+        entries = [*self._pending.values(), *self._writing.values()]
+        return [i.message for i in entries if not self._expired(i) and predicate(i.message)]
+
+    @staticmethod
+    def _merge(result: list[Message], *others: Iterable[Message]) -> list[Message]:
+        known = {i.to_selector() for i in result}
+        for messages in others:
+            for message in messages:
+                if (selector := message.to_selector()) not in known:
+                    known.add(selector)
+                    result.append(message)
+        return result
+
+    async def latest(self, scene: Selector, limit: int = 20) -> list[Message]:
+        """返回 scene 中最近的 `limit` 条消息, 由新到旧排列."""
+        scene = scene.plain()
+        bucket = self._by_scene.get(scene)
+        result = self._collect(reversed(bucket), limit) if bucket else []
+
+        if self.spill is not None and len(result) < limit:
+            # LRU 淘汰不按时间顺序, 落盘的消息可能比内存中的更新
+            pending = self._spilled_where(lambda i: i.scene.plain() == scene)
+            spilled = await run_io(self.spill.latest, scene, limit, self._since)
+            result = self._merge(result, pending, spilled)
+            result = sorted(result, key=lambda i: i.time, reverse=True)[:limit]
+
+        return result
+
+    def by_sender(self, sender: Selector, limit: int | None = None) -> list[Message]:
+        """返回仍在内存中的、由 sender 发送的消息, 由新到旧排列."""
+        bucket = self._by_sender.get(sender.plain())
+        return self._collect(reversed(bucket), limit) if bucket else []
+
+    async def replies(self, message: Selector) -> list[Message]:
+        """返回回复了 message 的消息, 由旧到新排列."""
+        message = message.plain()
+        bucket = self._by_reply.get(message)
+        result = self._collect(bucket) if bucket else []
+
+        if self.spill is not None:
+            pending = self._spilled_where(lambda i: i.reply is not None and i.reply.plain() == message)
+            spilled = await run_io(self.spill.replies, message, self._since)
+            result = sorted(self._merge(result, pending, spilled), key=lambda i: i.time)
+
+        return result
+
+    def scenes(self) -> list[Selector]:
+        return list(self._by_scene)
+
+    def clear(self):
+        self._entries.clear()
+        self._timeline.clear()
+        self._by_scene.clear()
+        self._by_sender.clear()
+        self._by_reply.clear()
+        self.size = 0
+
+    def close(self):
+        self.clear()
+        if self.spill is not None:
+            # 关闭时把积压的写入同步落盘; 正在线程池中执行的一批由 spill.lock 保证先完成
+            self._flush_sync()
+            self.spill.close()
+            self.spill = None
+
+
+class MessageCacheDeque(MessageStore):
+    """兼容旧接口: 仅以消息条数为上限."""
+
+    def __init__(self, cache_size: int) -> None:
+        super().__init__(max_bytes=1 << 62, max_count=cache_size)
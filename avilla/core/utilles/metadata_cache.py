@@ -0,0 +1,174 @@
+from __future__ import annotations
+
+import asyncio
+import time
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING, Any, Awaitable, Callable, Dict, Tuple, Union
+
+if TYPE_CHECKING:
+    from avilla.core.metadata import Metadata, MetadataRoute
+    from avilla.core.selector import Selector
+
+    MetadataRouteKey = Union[type[Metadata], MetadataRoute]
+
+_CacheKey = Tuple["Selector", "Selector"]
+_PullKey = Tuple["Selector", "Selector", Any]
+
+
+def _default_route_ttl() -> Dict[Any, Union[float, None]]:
+    from avilla.standard.core.file import FileData
+
+    # 文件的下载链接通常只在约一分钟内有效
+    return {FileData: 0}
+
+
+@dataclass
+class MetadataCacheConfig:
+    enabled: bool = False
+    """缓存无法感知未通过事件告知的修改; 仅当协议端会推送相应的变更事件, 或可以容忍 TTL 内的过期数据时才应启用."""
+    ttl: float | None = 300
+    max_entries: int = 2048
+    """每个 route 保留的条目上限."""
+    route_ttl: Dict[Any, Union[float, None]] = field(default_factory=_default_route_ttl)
+    """针对特定 route 的 TTL; 设为 0 则不缓存该 route. 默认不缓存携带短期下载链接的 FileData."""
+    route_max_entries: Dict[Any, int] = field(default_factory=dict)
+
+
+def _route_cells(route: MetadataRouteKey) -> tuple[type[Metadata], ...]:
+    return route.cells if hasattr(route, "cells") else (route,)  # type: ignore
+
+
+def _startswith(target: Selector, prefix: Selector) -> bool:
+    items = tuple(target.items())
+    prefix_items = tuple(prefix.items())
+    return items[: len(prefix_items)] == prefix_items
+
+
+class MetadataCache:
+    """账号范围内跨事件的 metadata 缓存, 以 (account, target, route) 为键.
+
+    并发拉取同一个键时只会向协议端请求一次; 拉取期间发生的失效会使其结果不被写入缓存.
+    """
+
+    config: MetadataCacheConfig
+
+    _routes: dict[Any, OrderedDict[_CacheKey, tuple[Any, float]]]
+    _inflight: dict[_PullKey, asyncio.Task[Any]]
+    _epochs: dict[_PullKey, int]
+
+    def __init__(self, config: MetadataCacheConfig | None = None) -> None:
+        self.config = config or MetadataCacheConfig()
+        self._routes = {}
+        self._inflight = {}
+        self._epochs = {}
+
+    def ttl_of(self, route: MetadataRouteKey) -> float | None:
+        return self.config.route_ttl.get(route, self.config.ttl)
+
+    def enabled_for(self, route: MetadataRouteKey) -> bool:
+        return self.config.enabled and self.ttl_of(route) != 0
+
+    def get(self, account: Selector, target: Selector, route: MetadataRouteKey) -> Any | None:
+        account, target = account.plain(), target.plain()
+        entries = self._routes.get(route)
+        if entries is None or (record := entries.get((account, target))) is None:
+            return
+
+        value, expires = record
+        if expires < time.monotonic():
+            del entries[account, target]
+            return
+
+        entries.move_to_end((account, target))
+        return value
+
+    def set(self, account: Selector, target: Selector, route: MetadataRouteKey, value: Any):
+        if not self.enabled_for(route):
+            return
+        ttl = self.ttl_of(route)
+
+        account, target = account.plain(), target.plain()
+        entries = self._routes.setdefault(route, OrderedDict())
+        entries[account, target] = (value, time.monotonic() + ttl if ttl is not None else float("inf"))
+        entries.move_to_end((account, target))
+
+        limit = self.config.route_max_entries.get(route, self.config.max_entries)
+        while len(entries) > limit:
+            entries.popitem(last=False)
+
+    async def get_or_pull(
+        self,
+        account: Selector,
+        target: Selector,
+        route: MetadataRouteKey,
+        pull: Callable[[], Awaitable[Any]],
+        *,
+        flush: bool = False,
+    ) -> Any:
+        """flush 为 True 时失效已有的条目, 并发起新的拉取而不是等待进行中的拉取."""
+        if not self.enabled_for(route):
+            return await pull()
+
+        if flush:
+            self.invalidate(account, target, route)
+        elif (value := self.get(account, target, route)) is not None:
+            return value
+
+        key = (account.plain(), target.plain(), route)
+        if flush or (task := self._inflight.get(key)) is None:
+            task = self._inflight[key] = asyncio.create_task(self._pull(key, pull, self._epochs.get(key, 0)))
+            task.add_done_callback(lambda _: self._pull_done(key, task))
+        return await asyncio.shield(task)
+
+    async def _pull(self, key: _PullKey, pull: Callable[[], Awaitable[Any]], epoch: int):
+        value = await pull()
+        if value is not None and self._epochs.get(key, 0) == epoch:
+            self.set(*key, value)
+        return value
+
+    def _pull_done(self, key: _PullKey, task: asyncio.Task[Any]):
+        if self._inflight.get(key) is task:
+            del self._inflight[key]
+            self._epochs.pop(key, None)
+
+    def _bump(self, predicate: Callable[[_PullKey], bool]):
+        # 只有进行中的拉取需要感知失效, 因此只记录它们的 epoch
+        for key in self._inflight:
+            if predicate(key):
+                self._epochs[key] = self._epochs.get(key, 0) + 1
+
+    def invalidate(self, account: Selector, target: Selector, route: MetadataRouteKey | None = None):
+        """失效 target 上的 route; route 为 None 时失效 target 的全部条目.
+
+        包含被修改 metadata 的复合 route (如 `Summary >> Nick`) 也会一并失效.
+        """
+        key = (account.plain(), target.plain())
+        cells = set(_route_cells(route)) if route is not None else None
+
+        def matches(route_key: MetadataRouteKey) -> bool:
+            return cells is None or bool(cells.intersection(_route_cells(route_key)))
+
+        for route_key, entries in self._routes.items():
+            if matches(route_key):
+                entries.pop(key, None)
+        self._bump(lambda k: k[:2] == key and matches(k[2]))
+
+    def invalidate_prefix(self, account: Selector, prefix: Selector):
+        """失效 prefix 及其下属的所有 target, 用于成员退出、群解散等场合."""
+        account = account.plain()
+        for entries in self._routes.values():
+            for key in [k for k in entries if k[0] == account and _startswith(k[1], prefix)]:
+                del entries[key]
+        self._bump(lambda k: k[0] == account and _startswith(k[1], prefix))
+
+    def invalidate_account(self, account: Selector):
+        account = account.plain()
+        for entries in self._routes.values():
+            for key in [k for k in entries if k[0] == account]:
+                del entries[key]
+        self._bump(lambda k: k[0] == account)
+
+    def clear(self):
+        self._routes.clear()
+        self._bump(lambda _: True)
@@ -0,0 +1,302 @@
+from __future__ import annotations
+
+import asyncio
+import hashlib
+import mmap
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from contextlib import suppress
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, AsyncIterator, Awaitable, Callable
+
+from avilla.core.resource import LocalFileResource, RawResource, Resource
+
+from .fileio import run_io
+from .store import get_cache_dir
+
+
+def resource_cache_key(resource: Resource[Any]) -> str | None:
+    """生成资源的缓存键; 本地文件与内存中的数据没有缓存的必要, 返回 None."""
+    if isinstance(resource, (LocalFileResource, RawResource)):
+        return
+    url = getattr(resource, "url", None)
+    if isinstance(url, str) and url:
+        return url
+    try:
+        return resource.selector.display
+    except Exception:
+        return
+
+
+@dataclass
+class ResourceCacheConfig:
+    enabled: bool = False
+    """缓存键为 URL 或 selector, 不感知内容变化; 仅当资源 URL 不会复用于不同内容时才应启用."""
+    memory_bytes: int = 32 * 1024 * 1024
+    memory_item_bytes: int = 4 * 1024 * 1024
+    """单个资源超过此大小时不进入内存层, 只写入磁盘层."""
+    disk_bytes: int = 0
+    """磁盘层的预算, 为 0 时不启用磁盘层."""
+    ttl: float | None = 3600
+    directory: Path | None = None
+
+
+@dataclass
+class _MemoryEntry:
+    digest: str
+    data: bytes
+    created: float
+
+
+class _DiskTier:
+    """磁盘层; 各方法均为阻塞调用, 由 `ResourceCache` 放入文件读写线程池执行, 索引与 blob 的修改由 `lock` 串行化."""
+
+    directory: Path
+    connection: sqlite3.Connection
+    lock: threading.Lock
+
+    def __init__(self, directory: Path) -> None:
+        self.directory = directory
+        self.lock = threading.Lock()
+        (directory / "blobs").mkdir(parents=True, exist_ok=True)
+        self.connection = sqlite3.connect(directory / "index.sqlite3", check_same_thread=False, isolation_level=None)
+        self.connection.execute(
+            "CREATE TABLE IF NOT EXISTS resources ("
+            "key TEXT PRIMARY KEY, digest TEXT, size INTEGER, created REAL, accessed REAL)"
+        )
+        self.connection.execute("CREATE INDEX IF NOT EXISTS resources_accessed ON resources (accessed)")
+
+    def blob_path(self, digest: str) -> Path:
+        return self.directory / "blobs" / digest[:2] / digest
+
+    def lookup(self, key: str, since: float) -> tuple[str, int, float] | None:
+        with self.lock:
+            row = self.connection.execute(
+                "SELECT digest, size, created FROM resources WHERE key = ? AND created >= ?", (key, since)
+            ).fetchone()
+            if row is None or not self.blob_path(row[0]).exists():
+                return
+            self.connection.execute("UPDATE resources SET accessed = ? WHERE key = ?", (time.time(), key))
+            return row
+
+    def read(self, key: str, since: float) -> tuple[str, bytes, float] | None:
+        if (row := self.lookup(key, since)) is None:
+            return
+        digest, _, created = row
+        try:
+            return digest, self.blob_path(digest).read_bytes(), created
+        except OSError:
+            return
+
+    def store(self, key: str, digest: str, data: bytes, created: float):
+        path = self.blob_path(digest)
+        with self.lock:
+            if not path.exists():
+                path.parent.mkdir(exist_ok=True)
+                temp = path.with_suffix(".tmp")
+                temp.write_bytes(data)
+                temp.replace(path)
+            self.connection.execute(
+                "INSERT OR REPLACE INTO resources VALUES (?, ?, ?, ?, ?)", (key, digest, len(data), created, created)
+            )
+
+    def usage(self) -> int:
+        return self.connection.execute(
+            "SELECT COALESCE(SUM(size), 0) FROM (SELECT DISTINCT digest, size FROM resources)"
+        ).fetchone()[0]
+
+    def evict(self, budget: int, since: float):
+        """按 TTL 与预算删除索引条目, 并清理不再被引用的 blob."""
+        with self.lock:
+            self._evict(budget, since)
+
+    def _evict(self, budget: int, since: float):
+        self.connection.execute("DELETE FROM resources WHERE created < ?", (since,))
+        usage = self.usage()
+        if usage > budget:
+            for key, size in self.connection.execute("SELECT key, size FROM resources ORDER BY accessed").fetchall():
+                self.connection.execute("DELETE FROM resources WHERE key = ?", (key,))
+                usage -= size
+                if usage <= budget:
+                    break
+        alive = {i for i, in self.connection.execute("SELECT DISTINCT digest FROM resources")}
+        for path in (self.directory / "blobs").glob("*/*"):
+            if path.name not in alive:
+                with suppress(OSError):
+                    path.unlink()
+
+    def discard(self, key: str):
+        with self.lock:
+            self.connection.execute("DELETE FROM resources WHERE key = ?", (key,))
+
+    def close(self):
+        with self.lock:
+            self.connection.close()
+
+
+def _map_file(path: Path) -> memoryview:
+    with path.open("rb") as f:
+        if not path.stat().st_size:
+            return memoryview(b"")
+        return memoryview(mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ))
+
+
+async def iter_view(view: memoryview, chunk_size: int = 65536) -> AsyncIterator[bytes]:
+    """按块产出 view 的内容, 结束后释放 view."""
+    with view:
+        for offset in range(0, len(view), chunk_size):
+            yield bytes(view[offset : offset + chunk_size])
+            await asyncio.sleep(0)
+
+
+class ResourceCache:
+    """以内容哈希寻址的资源缓存, 包含内存 LRU 层与可选的磁盘层.
+
+    缓存键为资源的 URL 或 selector, 指向内容的 sha256; 内容相同的资源在两层中只保存一份.
+    """
+
+    config: ResourceCacheConfig
+    memory_usage: int
+
+    _memory: OrderedDict[str, _MemoryEntry]
+    _blobs: dict[str, tuple[bytes, int]]
+    _disk: _DiskTier | None
+    _inflight: dict[str, asyncio.Task[bytes]]
+
+    def __init__(self, config: ResourceCacheConfig | None = None) -> None:
+        self.config = config or ResourceCacheConfig()
+        self.memory_usage = 0
+        self._memory = OrderedDict()
+        self._blobs = {}
+        self._disk = None
+        self._inflight = {}
+        self._evicted_at = 0.0
+
+    async def disk(self) -> _DiskTier | None:
+        if self._disk is None and self.config.disk_bytes > 0:
+            disk = await run_io(_DiskTier, self.config.directory or get_cache_dir("resources"))
+            if self._disk is None:
+                self._disk = disk
+            else:
+                disk.close()
+        return self._disk
+
+    @property
+    def _since(self) -> float:
+        return time.time() - self.config.ttl if self.config.ttl is not None else 0.0
+
+    def _memory_get(self, key: str) -> bytes | None:
+        entry = self._memory.get(key)
+        if entry is None:
+            return
+        if entry.created < self._since:
+            self._memory_remove(key)
+            return
+        self._memory.move_to_end(key)
+        return entry.data
+
+    def _memory_remove(self, key: str):
+        entry = self._memory.pop(key)
+        data, refs = self._blobs[entry.digest]
+        if refs > 1:
+            self._blobs[entry.digest] = (data, refs - 1)
+        else:
+            del self._blobs[entry.digest]
+            self.memory_usage -= len(data)
+
+    def _memory_put(self, key: str, digest: str, data: bytes, created: float):
+        if len(data) > self.config.memory_item_bytes:
+            return
+        if key in self._memory:
+            self._memory_remove(key)
+        if digest in self._blobs:
+            # 复用已有的同内容对象
+            data, refs = self._blobs[digest]
+        else:
+            refs = 0
+            self.memory_usage += len(data)
+        self._blobs[digest] = (data, refs + 1)
+        self._memory[key] = _MemoryEntry(digest, data, created)
+
+        while self.memory_usage > self.config.memory_bytes and self._memory:
+            self._memory_remove(next(iter(self._memory)))
+
+    async def get(self, key: str) -> bytes | None:
+        data = self._memory_get(key)
+        if data is not None:
+            return data
+
+        if (disk := await self.disk()) is not None and (record := await run_io(disk.read, key, self._since)):
+            digest, data, created = record
+            self._memory_put(key, digest, data, created)
+            return data
+
+    async def put(self, key: str, data: bytes):
+        digest = hashlib.sha256(data).hexdigest()
+        created = time.time()
+        self._memory_put(key, digest, data, created)
+
+        if (disk := await self.disk()) is not None:
+            await run_io(disk.store, key, digest, data, created)
+            if created - self._evicted_at > 60:
+                self._evicted_at = created
+                await run_io(disk.evict, self.config.disk_bytes, self._since)
+
+    async def path(self, key: str) -> Path | None:
+        """返回磁盘层中对应内容的文件路径, 可直接交给需要文件路径的接口."""
+        if (disk := await self.disk()) is None or (record := await run_io(disk.lookup, key, self._since)) is None:
+            return
+        return disk.blob_path(record[0])
+
+    async def view(self, key: str) -> memoryview | None:
+        """零拷贝读取: 内存层直接返回 memoryview, 磁盘层通过 mmap 映射文件."""
+        entry = self._memory.get(key)
+        if entry is not None and entry.created >= self._since:
+            return memoryview(entry.data)
+
+        if (path := await self.path(key)) is None:
+            return
+        with suppress(OSError):
+            return await run_io(_map_file, path)
+
+    async def get_or_fetch(self, key: str, fetch: Callable[[], Awaitable[Any]]) -> Any:
+        """命中时直接返回缓存内容; 否则调用 fetch, 对同一键的并发请求只会调用一次."""
+        if (data := await self.get(key)) is not None:
+            return data
+
+        if (task := self._inflight.get(key)) is None:
+            task = self._inflight[key] = asyncio.create_task(self._fetch(key, fetch))
+            task.add_done_callback(lambda _: self._inflight.pop(key, None))
+        return await asyncio.shield(task)
+
+    async def _fetch(self, key: str, fetch: Callable[[], Awaitable[Any]]) -> Any:
+        data = await fetch()
+        if isinstance(data, (bytes, bytearray, memoryview)):
+            await self.put(key, bytes(data))
+        return data
+
+    async def stream(self, key: str, chunk_size: int = 65536) -> AsyncIterator[bytes]:
+        if (view := await self.view(key)) is None:
+            return
+        async for chunk in iter_view(view, chunk_size):
+            yield chunk
+
+    async def discard(self, key: str):
+        if key in self._memory:
+            self._memory_remove(key)
+        if (disk := await self.disk()) is not None:
+            await run_io(disk.discard, key)
+
+    def clear(self):
+        self._memory.clear()
+        self._blobs.clear()
+        self.memory_usage = 0
+
+    def close(self):
+        self.clear()
+        if self._disk is not None:
+            self._disk.close()
+            self._disk = None
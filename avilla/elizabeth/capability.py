@@ -1,6 +1,6 @@
 from __future__ import annotations
 
-from typing import TYPE_CHECKING, Any
+from typing import TYPE_CHECKING, Any, Awaitable
 
 from graia.amnesia.message import Element, MessageChain
 
@@ -18,31 +18,30 @@ class ElizabethCapability((m := ApplicationCollector())._):
         ...
 
     @Fn.complex({PredicateOverload(lambda _, raw: raw["type"]): ["raw_element"]})
-    async def deserialize_element(self, raw_element: dict) -> Element:  # type: ignore
+    def deserialize_element(self, raw_element: dict) -> Element | Awaitable[Element]:  # type: ignore
         ...
 
     @Fn.complex({TypeOverload(): ["element"]})
-    async def serialize_element(self, element: Any) -> dict:  # type: ignore
+    def serialize_element(self, element: Any) -> dict | Awaitable[dict]:  # type: ignore
         ...
 
     async def deserialize_chain(self, chain: list[dict]):
-        elements = []
-
-        for raw_element in chain:
-            elements.append(await self.deserialize_element(raw_element))
-
-        return MessageChain(elements)
+        return MessageChain(await self.staff.call_fn_many(ElizabethCapability.deserialize_element, chain))
 
     async def serialize_chain(self, chain: MessageChain):
-        elements = []
+        return await self.staff.call_fn_many(ElizabethCapability.serialize_element, chain)
 
-        for element in chain:
-            elements.append(await self.serialize_element(element))
+    async def handle_event(self, event: dict):
+        metrics = self.avilla.metrics
+        raw_type = event["type"] if metrics.enabled else ""
+        metrics.count_event("elizabeth", raw_type, "received")
 
-        return elements
+        if self.avilla.event_subscriptions.skippable(self.staff, ElizabethCapability.event_callback, event):
+            metrics.count_event("elizabeth", raw_type, "skipped")
+            return
 
-    async def handle_event(self, event: dict):
         maybe_event = await self.event_callback(event)
+        metrics.count_parsed("elizabeth", raw_type, maybe_event)
 
         if maybe_event is not None:
             self.avilla.event_record(maybe_event)
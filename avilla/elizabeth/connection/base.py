@@ -8,6 +8,7 @@ from loguru import logger
 from typing_extensions import Self
 
 from avilla.core.exceptions import InvalidAuthentication
+from avilla.core.ingestion import EventIngestion
 from avilla.core.ryanvk.staff import Staff
 from avilla.core.selector import Selector
 from avilla.elizabeth.capability import ElizabethCapability
@@ -27,15 +28,19 @@ class ElizabethNetworking:
     protocol: ElizabethProtocol
     response_waiters: dict[str, asyncio.Future]
     close_signal: asyncio.Event
+    ingestion: EventIngestion[tuple[ElizabethNetworking, dict]]
 
     account_id: int
     session_key: str | None = None
 
+    _staff: Staff | None = None
+
     def __init__(self, protocol: ElizabethProtocol):
         super().__init__()
         self.protocol = protocol
         self.response_waiters = {}
         self.close_signal = asyncio.Event()
+        self.ingestion = EventIngestion(self.event_parse_task)
 
     def get_staff_components(self):
         return {"connection": self, "protocol": self.protocol, "avilla": self.protocol.avilla}
@@ -44,8 +49,10 @@ class ElizabethNetworking:
         return [self.protocol.artifacts, self.protocol.avilla.global_artifacts]
 
     @property
-    def staff(self):
-        return Staff(self.get_staff_artifacts(), self.get_staff_components())
+    def staff(self) -> Staff:
+        if self._staff is None:
+            self._staff = Staff(self.get_staff_artifacts(), self.get_staff_components())
+        return self._staff
 
     def message_receive(self) -> AsyncIterator[tuple[Self, dict]]:
         ...
@@ -60,42 +67,58 @@ class ElizabethNetworking:
     async def send(self, payload: dict) -> None:
         ...
 
+    @staticmethod
+    def ingestion_scene(data: dict):
+        if isinstance(group := data.get("group"), dict):
+            return "group", group.get("id")
+        for key in ("sender", "member", "operator", "friend"):
+            if isinstance(entity := data.get(key), dict):
+                if isinstance(group := entity.get("group"), dict):
+                    return "group", group.get("id")
+                return "user", entity.get("id")
+
+    async def event_parse_task(self, item: tuple[ElizabethNetworking, dict]):
+        connection, data = item
+        event_type = data["type"]
+        with suppress(NotImplementedError):
+            await ElizabethCapability(connection.staff).handle_event(data)
+            return
+
+        logger.warning(f"received unsupported event {event_type}: {data}")
+
     async def message_handle(self):
-        async for connection, data in self.message_receive():
-            if "code" in data:
-                validate_response(data)
+        async with self.ingestion:
+            async for connection, data in self.message_receive():
+                if "code" in data:
+                    validate_response(data)
+
+                sync_id: str = data.get("syncId", "#")
+                body: dict | Exception = validate_response(data.get("data"), False)
+                if isinstance(body, Exception):
+                    if sync_id in self.response_waiters:
+                        self.response_waiters[sync_id].set_exception(body)
+                    continue
+
+                if "session" in body:
+                    self.session_key = body["session"]
+                    logger.success("session key got.")
+                    account_route = Selector().land("qq").account(str(self.account_id))
+                    account = self.protocol.avilla.accounts[account_route].account
+                    self.protocol.avilla.broadcast.postEvent(AccountAvailable(self.protocol.avilla, account))
+                    continue
 
-            sync_id: str = data.get("syncId", "#")
-            body: dict | Exception = validate_response(data.get("data"), False)
-            if isinstance(body, Exception):
                 if sync_id in self.response_waiters:
-                    self.response_waiters[sync_id].set_exception(body)
-                continue
-
-            if "session" in body:
-                self.session_key = body["session"]
-                logger.success("session key got.")
-                account_route = Selector().land("qq").account(str(self.account_id))
-                account = self.protocol.avilla.accounts[account_route].account
-                self.protocol.avilla.broadcast.postEvent(AccountAvailable(self.protocol.avilla, account))
-                continue
-
-            if sync_id in self.response_waiters:
-                self.response_waiters[sync_id].set_result(body)
-                continue
-
-            if "type" not in body:
-                continue
-
-            async def event_parse_task(data: dict):
-                event_type = data["type"]
-                with suppress(NotImplementedError):
-                    await ElizabethCapability(connection.staff).handle_event(data)
-                    return
+                    self.response_waiters[sync_id].set_result(body)
+                    continue
 
-                logger.warning(f"received unsupported event {event_type}: {data}")
+                if "type" not in body:
+                    continue
 
-            asyncio.create_task(event_parse_task(body))
+                await self.ingestion.put(
+                    (connection, body),
+                    scene=self.ingestion_scene(body),
+                    low_priority=not body["type"].endswith("Message"),
+                )
 
     async def connection_closed(self):
         self.session_key = None
@@ -122,21 +145,22 @@ class ElizabethNetworking:
         self.response_waiters[echo] = future
 
         try:
-            await self.wait_for_available()
-            await self.send(
-                {
-                    "subCommand": {
-                        "fetch": "get",
-                        "update": "post",
-                    }.get(method)
-                    or method,
-                    "syncId": echo,
-                    "command": action,
-                    "content": params or {},
-                    **({"sessionKey": self.session_key} if session else {}),
-                }
-            )
-            return await future
+            with self.protocol.avilla.metrics.time_rpc("elizabeth", action):
+                await self.wait_for_available()
+                await self.send(
+                    {
+                        "subCommand": {
+                            "fetch": "get",
+                            "update": "post",
+                        }.get(method)
+                        or method,
+                        "syncId": echo,
+                        "command": action,
+                        "content": params or {},
+                        **({"sessionKey": self.session_key} if session else {}),
+                    }
+                )
+                return await future
         finally:
             del self.response_waiters[echo]
 
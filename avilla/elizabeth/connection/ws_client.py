@@ -36,6 +36,7 @@ class ElizabethWsClientNetworking(ElizabethNetworking, Service):
     def __init__(self, protocol: ElizabethProtocol, config: ElizabethConfig) -> None:
         super().__init__(protocol)
         self.config = config
+        self.ingestion.config = config.ingestion
         self.account_id = self.config.qq
 
     @property
@@ -63,32 +64,33 @@ class ElizabethWsClientNetworking(ElizabethNetworking, Service):
         await self.connection.send_json(payload)
 
     async def call_http(self, method: CallMethod, action: str, params: dict | None = None) -> dict:
-        action = action.replace("_", "/")
-        if method in {"get", "fetch"}:
-            async with self.session.get((self.config.base_url / action).with_query(params or {})) as resp:
-                result = await resp.json()
-                return validate_response(result)
-
-        if method in {"post", "update"}:
-            async with self.session.post((self.config.base_url / action), json=params or {}) as resp:
-                result = await resp.json()
-                return validate_response(result)
-
-        if method == "multipart":
-            data = aiohttp.FormData(quote_fields=False)
-            if params is None:
-                raise TypeError("multipart requires params")
-            for k, v in params.items():
-                if isinstance(v, dict):
-                    data.add_field(k, v["value"], filename=v.get("filename"), content_type=v.get("content_type"))
-                else:
-                    data.add_field(k, v)
-
-            async with self.session.post((self.config.base_url / action), data=data) as resp:
-                result = await resp.json()
-                return validate_response(result)
-
-        raise ValueError(f"Unknown method {method}")
+        with self.protocol.avilla.metrics.time_rpc("elizabeth", action):
+            action = action.replace("_", "/")
+            if method in {"get", "fetch"}:
+                async with self.session.get((self.config.base_url / action).with_query(params or {})) as resp:
+                    result = await resp.json()
+                    return validate_response(result)
+
+            if method in {"post", "update"}:
+                async with self.session.post((self.config.base_url / action), json=params or {}) as resp:
+                    result = await resp.json()
+                    return validate_response(result)
+
+            if method == "multipart":
+                data = aiohttp.FormData(quote_fields=False)
+                if params is None:
+                    raise TypeError("multipart requires params")
+                for k, v in params.items():
+                    if isinstance(v, dict):
+                        data.add_field(k, v["value"], filename=v.get("filename"), content_type=v.get("content_type"))
+                    else:
+                        data.add_field(k, v)
+
+                async with self.session.post((self.config.base_url / action), data=data) as resp:
+                    result = await resp.json()
+                    return validate_response(result)
+
+            raise ValueError(f"Unknown method {method}")
 
     async def wait_for_available(self):
         await self.status.wait_for_available()
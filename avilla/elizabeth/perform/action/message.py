@@ -39,7 +39,7 @@ class ElizabethMessageActionPerform((m := AccountCollector["ElizabethProtocol",
             "sendGroupMessage",
             {
                 "target": int(target.pattern["group"]),
-                "messageChain": [await self.staff.call_fn(ElizabethCapability.serialize_element, i) for i in message],
+                "messageChain": await ElizabethCapability(self.staff).serialize_chain(message),
                 **({"quote": reply.pattern["message"]} if reply is not None else {}),
             },
         )
@@ -75,7 +75,7 @@ class ElizabethMessageActionPerform((m := AccountCollector["ElizabethProtocol",
             "sendFriendMessage",
             {
                 "target": int(target.pattern["friend"]),
-                "messageChain": [await self.staff.call_fn(ElizabethCapability.serialize_element, i) for i in message],
+                "messageChain": await ElizabethCapability(self.staff).serialize_chain(message),
                 **({"quote": reply.pattern["message"]} if reply is not None else {}),
             },
         )
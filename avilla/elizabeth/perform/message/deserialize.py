@@ -45,49 +45,49 @@ class ElizabethMessageDeserializePerform((m := ApplicationCollector())._):
     # LINK: https://github.com/microsoft/pyright/issues/5409
 
     @m.entity(ElizabethCapability.deserialize_element, raw_element="Plain")
-    async def text(self, raw_element: dict) -> Text:
+    def text(self, raw_element: dict) -> Text:
         return Text(raw_element["text"])
 
     @m.entity(ElizabethCapability.deserialize_element, raw_element="At")
-    async def at(self, raw_element: dict) -> Notice:
+    def at(self, raw_element: dict) -> Notice:
         if self.context:
             return Notice(self.context.scene.member(raw_element["target"]))
         return Notice(Selector().land("qq").member(raw_element["target"]))
 
     @m.entity(ElizabethCapability.deserialize_element, raw_element="AtAll")
-    async def at_all(self, raw_element: dict) -> NoticeAll:
+    def at_all(self, raw_element: dict) -> NoticeAll:
         return NoticeAll()
 
     @m.entity(ElizabethCapability.deserialize_element, raw_element="Face")
-    async def face(self, raw_element: dict) -> Face:
+    def face(self, raw_element: dict) -> Face:
         return Face(raw_element["faceId"], raw_element["name"])
 
     @m.entity(ElizabethCapability.deserialize_element, raw_element="MarketFace")
-    async def market_face(self, raw_element: dict) -> MarketFace:
+    def market_face(self, raw_element: dict) -> MarketFace:
         return MarketFace(raw_element["id"], raw_element["name"])
 
     @m.entity(ElizabethCapability.deserialize_element, raw_element="Xml")
-    async def xml(self, raw_element: dict) -> Xml:
+    def xml(self, raw_element: dict) -> Xml:
         return Xml(raw_element["xml"])
 
     @m.entity(ElizabethCapability.deserialize_element, raw_element="Json")
-    async def json(self, raw_element: dict) -> Json:
+    def json(self, raw_element: dict) -> Json:
         return Json(raw_element["json"])
 
     @m.entity(ElizabethCapability.deserialize_element, raw_element="App")
-    async def app(self, raw_element: dict) -> App:
+    def app(self, raw_element: dict) -> App:
         return App(raw_element["content"])
 
     @m.entity(ElizabethCapability.deserialize_element, raw_element="Poke")
-    async def poke(self, raw_element: dict) -> Poke:
+    def poke(self, raw_element: dict) -> Poke:
         return Poke(PokeKind(raw_element["name"]))
 
     @m.entity(ElizabethCapability.deserialize_element, raw_element="Dice")
-    async def dice(self, raw_element: dict) -> Dice:
+    def dice(self, raw_element: dict) -> Dice:
         return Dice(int(raw_element["value"]))
 
     @m.entity(ElizabethCapability.deserialize_element, raw_element="MusicShare")
-    async def music_share(self, raw_element: dict) -> MusicShare:
+    def music_share(self, raw_element: dict) -> MusicShare:
         return MusicShare(
             MusicShareKind(raw_element["kind"]),
             raw_element["title"],
@@ -99,7 +99,7 @@ class ElizabethMessageDeserializePerform((m := ApplicationCollector())._):
         )
 
     @m.entity(ElizabethCapability.deserialize_element, raw_element="File")
-    async def file(self, raw_element: dict) -> File:
+    def file(self, raw_element: dict) -> File:
         if self.context:
             selector = self.context.scene
         else:
@@ -115,7 +115,7 @@ class ElizabethMessageDeserializePerform((m := ApplicationCollector())._):
         )
 
     @m.entity(ElizabethCapability.deserialize_element, raw_element="Image")
-    async def image(self, raw_element: dict) -> Picture:
+    def image(self, raw_element: dict) -> Picture:
         if self.context:
             selector = self.context.scene
         else:
@@ -128,7 +128,7 @@ class ElizabethMessageDeserializePerform((m := ApplicationCollector())._):
         return Picture(resource)
 
     @m.entity(ElizabethCapability.deserialize_element, raw_element="FlashImage")
-    async def flash_image(self, raw_element: dict) -> FlashImage:
+    def flash_image(self, raw_element: dict) -> FlashImage:
         if self.context:
             selector = self.context.scene
         else:
@@ -141,7 +141,7 @@ class ElizabethMessageDeserializePerform((m := ApplicationCollector())._):
         return FlashImage(resource)
 
     @m.entity(ElizabethCapability.deserialize_element, raw_element="Voice")
-    async def voice(self, raw_element: dict) -> Audio:
+    def voice(self, raw_element: dict) -> Audio:
         if self.context:
             selector = self.context.scene
         else:
@@ -154,7 +154,7 @@ class ElizabethMessageDeserializePerform((m := ApplicationCollector())._):
         return Audio(resource, int(raw_element["length"]))
 
     @m.entity(ElizabethCapability.deserialize_element, raw_element="ShortVideo")
-    async def video(self, raw_element: dict) -> Video:
+    def video(self, raw_element: dict) -> Video:
         if self.context:
             selector = self.context.scene
         else:
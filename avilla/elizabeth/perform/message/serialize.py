@@ -32,43 +32,43 @@ class ElizabethMessageSerializePerform((m := AccountCollector["ElizabethProtocol
     # LINK: https://github.com/microsoft/pyright/issues/5409
 
     @m.entity(ElizabethCapability.serialize_element, element=Text)
-    async def text(self, element: Text) -> dict:
+    def text(self, element: Text) -> dict:
         return {"type": "Plain", "text": element.text}
 
     @m.entity(ElizabethCapability.serialize_element, element=Notice)
-    async def notice(self, element: Notice):
+    def notice(self, element: Notice):
         return {"type": "At", "target": int(element.target.last_value)}
 
     @m.entity(ElizabethCapability.serialize_element, element=NoticeAll)
-    async def notice_all(self, element: NoticeAll):
+    def notice_all(self, element: NoticeAll):
         return {"type": "AtAll"}
 
     @m.entity(ElizabethCapability.serialize_element, element=Face)
-    async def face(self, element: Face) -> dict:
+    def face(self, element: Face) -> dict:
         return {"type": "Face", "faceId": element.id, "name": element.name}
 
     @m.entity(ElizabethCapability.serialize_element, element=Json)
-    async def json(self, element: Json):
+    def json(self, element: Json):
         return {"type": "Json", "json": element.content}
 
     @m.entity(ElizabethCapability.serialize_element, element=Xml)
-    async def xml(self, element: Xml):
+    def xml(self, element: Xml):
         return {"type": "Xml", "xml": element.content}
 
     @m.entity(ElizabethCapability.serialize_element, element=App)
-    async def app(self, element: App):
+    def app(self, element: App):
         return {"type": "App", "content": element.content}
 
     @m.entity(ElizabethCapability.serialize_element, element=Poke)
-    async def poke(self, element: Poke):
+    def poke(self, element: Poke):
         return {"type": "Poke", "name": element.kind.value}
 
     @m.entity(ElizabethCapability.serialize_element, element=Dice)
-    async def dice(self, element: Dice):
+    def dice(self, element: Dice):
         return {"type": "Dice", "value": element.value}
 
     @m.entity(ElizabethCapability.serialize_element, element=MusicShare)
-    async def music_share(self, element: MusicShare):
+    def music_share(self, element: MusicShare):
         return {
             "type": "MusicShare",
             "kind": element.kind.value,
@@ -82,6 +82,9 @@ class ElizabethMessageSerializePerform((m := AccountCollector["ElizabethProtocol
 
     @m.entity(ElizabethCapability.serialize_element, element=Picture)
     async def image(self, element: Picture) -> dict:
+        return await self._image(element)
+
+    async def _image(self, element: Picture) -> dict:
         if isinstance(element.resource, ElizabethImageResource):
             return {
                 "type": "Image",
@@ -93,10 +96,8 @@ class ElizabethMessageSerializePerform((m := AccountCollector["ElizabethProtocol
                 "type": "Image",
                 "url": element.resource.url,
             }
-        elif isinstance(element.resource, LocalFileResource):
-            return {"type": "Image", "base64": base64.b64encode(element.resource.file.read_bytes()).decode("utf-8")}
-        elif isinstance(element.resource, RawResource):
-            return {"type": "Image", "base64": base64.b64encode(element.resource.data).decode("utf-8")}
+        elif isinstance(element.resource, (LocalFileResource, RawResource)):
+            return {"type": "Image", "base64": await self.protocol.avilla.media_cache.base64(element.resource)}
         else:
             return {
                 "type": "Image",
@@ -105,7 +106,7 @@ class ElizabethMessageSerializePerform((m := AccountCollector["ElizabethProtocol
 
     @m.entity(ElizabethCapability.serialize_element, element=FlashImage)
     async def flash_image(self, element: FlashImage):
-        raw = await self.image(element)
+        raw = await self._image(element)
         raw["type"] = "FlashImage"
         return raw
 
@@ -122,10 +123,8 @@ class ElizabethMessageSerializePerform((m := AccountCollector["ElizabethProtocol
                 "type": "Voice",
                 "url": element.resource.url,
             }
-        elif isinstance(element.resource, LocalFileResource):
-            return {"type": "Voice", "base64": base64.b64encode(element.resource.file.read_bytes()).decode("utf-8")}
-        elif isinstance(element.resource, RawResource):
-            return {"type": "Voice", "base64": base64.b64encode(element.resource.data).decode("utf-8")}
+        elif isinstance(element.resource, (LocalFileResource, RawResource)):
+            return {"type": "Voice", "base64": await self.protocol.avilla.media_cache.base64(element.resource)}
         else:
             return {
                 "type": "Voice",
@@ -133,7 +132,7 @@ class ElizabethMessageSerializePerform((m := AccountCollector["ElizabethProtocol
             }
 
     @m.entity(ElizabethCapability.serialize_element, element=Video)
-    async def video(self, element: Video):
+    def video(self, element: Video):
         if isinstance(element.resource, ElizabethVideoResource):
             return {
                 "type": "ShortVideo",
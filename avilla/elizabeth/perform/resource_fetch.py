@@ -2,8 +2,6 @@ from __future__ import annotations
 
 from typing import TYPE_CHECKING
 
-from aiohttp import ClientSession
-
 from avilla.core.builtins.capability import CoreCapability
 from avilla.core.exceptions import UnknownTarget
 from avilla.core.ryanvk.collector.protocol import ProtocolCollector
@@ -27,6 +25,4 @@ class ElizabethResourceFetchPerform((m := ProtocolCollector["ElizabethProtocol"]
     async def fetch_resource(self, resource: ElizabethResource) -> bytes:
         if resource.url is None:
             raise UnknownTarget
-        async with ClientSession() as session:
-            async with session.get(resource.url) as resp:
-                return await resp.read()
+        return await self.protocol.avilla.http_client.fetch(resource.url)
@@ -5,6 +5,7 @@ from dataclasses import dataclass, field
 from yarl import URL
 
 from avilla.core.application import Avilla
+from avilla.core.ingestion import IngestionConfig, OverflowPolicy
 from avilla.core.protocol import BaseProtocol, ProtocolConfig
 from graia.ryanvk import merge, ref
 
@@ -19,6 +20,12 @@ class ElizabethConfig(ProtocolConfig):
     port: int
     access_token: str
     base_url: URL = field(init=False)
+    ingestion: IngestionConfig = field(
+        # API 响应与事件共用同一条连接, 阻塞读取会导致等待响应的事件处理死锁.
+        default_factory=lambda: IngestionConfig(
+            overflow=OverflowPolicy.SHED_LOW_PRIORITY, fallback=OverflowPolicy.DROP_OLDEST
+        )
+    )
 
     def __post_init__(self):
         self.base_url = URL.build(scheme="http", host=self.host, port=self.port)
@@ -1,3 +1,4 @@
 from .protocol import OneBot11ForwardConfig as OneBot11ForwardConfig
+from .protocol import OneBot11HttpConfig as OneBot11HttpConfig
 from .protocol import OneBot11Protocol as OneBot11Protocol
 from .protocol import OneBot11ReverseConfig as OneBot11ReverseConfig
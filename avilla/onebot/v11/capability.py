@@ -1,6 +1,6 @@
 from __future__ import annotations
 
-from typing import Any
+from typing import Any, Awaitable
 
 from graia.amnesia.message import Element, MessageChain
 
@@ -29,11 +29,11 @@ class OneBot11Capability((m := ApplicationCollector())._):
         ...
 
     @Fn.complex({PredicateOverload(lambda _, raw: raw["type"]): ["raw_element"]})
-    async def deserialize_element(self, raw_element: dict) -> Element:  # type: ignore
+    def deserialize_element(self, raw_element: dict) -> Element | Awaitable[Element]:  # type: ignore
         ...
 
     @Fn.complex({TypeOverload(): ["element"]})
-    async def serialize_element(self, element: Any) -> dict:  # type: ignore
+    def serialize_element(self, element: Any) -> dict | Awaitable[dict]:  # type: ignore
         ...
 
     @Fn.complex({TargetOverload(): ["target"]})
@@ -42,23 +42,22 @@ class OneBot11Capability((m := ApplicationCollector())._):
         ...
 
     async def deserialize_chain(self, chain: list[dict]):
-        elements = []
-
-        for raw_element in chain:
-            elements.append(await self.deserialize_element(raw_element))
-
-        return MessageChain(elements)
+        return MessageChain(await self.staff.call_fn_many(OneBot11Capability.deserialize_element, chain))
 
     async def serialize_chain(self, chain: MessageChain):
-        elements = []
+        return await self.staff.call_fn_many(OneBot11Capability.serialize_element, chain)
 
-        for element in chain:
-            elements.append(await self.serialize_element(element))
+    async def handle_event(self, event: dict):
+        metrics = self.avilla.metrics
+        raw_type = onebot11_event_type(event) if metrics.enabled else ""
+        metrics.count_event("onebot11", raw_type, "received")
 
-        return elements
+        if self.avilla.event_subscriptions.skippable(self.staff, OneBot11Capability.event_callback, event):
+            metrics.count_event("onebot11", raw_type, "skipped")
+            return
 
-    async def handle_event(self, event: dict):
         maybe_event = await self.event_callback(event)
+        metrics.count_parsed("onebot11", raw_type, maybe_event)
 
         if maybe_event is not None:
             self.avilla.event_record(maybe_event)
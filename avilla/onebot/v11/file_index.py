@@ -0,0 +1,136 @@
+from __future__ import annotations
+
+import asyncio
+from dataclasses import replace
+from datetime import datetime, timedelta
+from typing import TYPE_CHECKING, Any, Callable, ClassVar, Coroutine, TypeVar
+
+from graia.amnesia.builtins.memcache import Memcache, MemcacheService
+
+from avilla.core.selector import Selector
+from avilla.onebot.v11.utils import file_parse, folder_parse
+from avilla.standard.core.file import FileData
+from avilla.standard.core.file.metadata import DownloadInfo
+
+if TYPE_CHECKING:
+    from avilla.onebot.v11.account import OneBot11Account
+
+T = TypeVar("T")
+
+INDEX_TTL = timedelta(minutes=5)
+# 群文件的下载链接会过期, 比索引更早失效
+URL_TTL = timedelta(minutes=1)
+
+
+class GroupFileIndex:
+    """账号下各个群的文件树索引, 以 file_id / folder_id 为键, 保存在 Memcache 中.
+
+    索引不含下载链接; 链接只为被拉取的文件请求, 并单独缓存.
+    """
+
+    _inflight: ClassVar[dict[str, asyncio.Task]] = {}
+
+    account: OneBot11Account
+    cache: Memcache
+
+    def __init__(self, account: OneBot11Account) -> None:
+        self.account = account
+        self.cache = account.protocol.avilla.launch_manager.get_component(MemcacheService).cache
+
+    def _prefix(self, group: str) -> str:
+        return f"onebot11/account({self.account.route['account']}).group({group})"
+
+    def index_key(self, group: str) -> str:
+        return f"{self._prefix(group)}.files"
+
+    def file_key(self, group: str, file: str) -> str:
+        return f"{self._prefix(group)}.file({file})"
+
+    async def _list(self, group: str, folder: FileData | None) -> dict | None:
+        if folder is None:
+            return await self.account.connection.call("get_group_root_files", {"group_id": int(group)})
+        return await self.account.connection.call(
+            "get_group_files_by_folder", {"group_id": int(group), "folder_id": folder.id}
+        )
+
+    async def _build(self, group: str) -> dict[str, FileData]:
+        entries: dict[str, FileData] = {}
+
+        async def walk(folder: FileData | None):
+            listing = await self._list(group, folder)
+            if not listing:
+                return
+            for raw in listing.get("files") or []:
+                data = file_parse(raw, "", folder)
+                entries[data.id] = data
+            folders = [folder_parse(raw, folder) for raw in listing.get("folders") or []]
+            for data in folders:
+                entries[data.id] = data
+            # 同一层的子文件夹并发列出
+            await asyncio.gather(*(walk(data) for data in folders))
+
+        await walk(None)
+        await self.cache.set(self.index_key(group), entries, INDEX_TTL)
+        return entries
+
+    async def _single_flight(self, key: str, factory: Callable[[], Coroutine[Any, Any, T]]) -> T:
+        if (task := self._inflight.get(key)) is None:
+            task = self._inflight[key] = asyncio.create_task(factory())
+            task.add_done_callback(lambda _: self._inflight.pop(key, None))
+        return await asyncio.shield(task)
+
+    async def refresh(self, group: str) -> dict[str, FileData]:
+        """重新列出整个文件树; 并发的刷新共享同一次请求."""
+        return await self._single_flight(self.index_key(group), lambda: self._build(group))
+
+    async def entries(self, group: str) -> dict[str, FileData]:
+        if (entries := await self.cache.get(self.index_key(group))) is not None:
+            return entries
+        return await self.refresh(group)
+
+    async def _resolve(self, group: str, data: FileData) -> FileData:
+        if not data.is_file:
+            return data
+        result = await self.account.connection.call(
+            "get_group_file_url",
+            {"group_id": int(group), "file_id": data.id, "busid": data.busid},
+        )
+        times = data.download_info.times if data.download_info else 0
+        return replace(data, download_info=DownloadInfo(times, result["url"] if result else ""))
+
+    async def get(self, group: str, file: str) -> FileData | None:
+        if (data := await self.cache.get(self.file_key(group, file))) is not None:
+            return data
+        return await self._single_flight(self.file_key(group, file), lambda: self._get(group, file))
+
+    async def _get(self, group: str, file: str) -> FileData | None:
+        if (cached := await self.cache.get(self.index_key(group))) is not None and file in cached:
+            data = cached[file]
+        else:
+            # 索引中没有时可能已经过时 (如上传到文件夹中), 重新列出一次
+            data = (await self.refresh(group)).get(file)
+        if data is None:
+            return
+        data = await self._resolve(group, data)
+        await self.cache.set(self.file_key(group, file), data, URL_TTL if data.is_file else INDEX_TTL)
+        return data
+
+    async def apply_upload(self, group: str, raw_file: dict, time: int | None = None):
+        """将 group_upload 通知中的文件并入已有的索引; 通知中不含所在文件夹, 视为根目录下的文件."""
+        if (entries := await self.cache.get(self.index_key(group))) is None:
+            return
+        data = FileData(
+            raw_file["id"],
+            Selector().land("qq").group(group),
+            raw_file["name"],
+            parent=None,
+            is_file=True,
+            is_dir=False,
+            upload_time=datetime.fromtimestamp(time) if time else None,
+            modify_time=None,
+            download_info=DownloadInfo(0, raw_file.get("url") or ""),
+            busid=raw_file.get("busid"),
+            size=raw_file.get("size"),
+        )
+        entries[data.id] = data
+        await self.cache.delete(self.file_key(group, data.id))
@@ -1,14 +1,21 @@
 from __future__ import annotations
 
 import asyncio
+import json
+import time
+from collections import defaultdict
 from contextlib import suppress
+from dataclasses import dataclass, field
+from itertools import count
 from typing import TYPE_CHECKING, AsyncIterator
 
 from loguru import logger
 from typing_extensions import Self
 
 from avilla.core.exceptions import ActionFailed
+from avilla.core.ingestion import EventIngestion
 from avilla.core.ryanvk.staff import Staff
+from avilla.core.utilles.histogram import LatencyHistogram
 from avilla.onebot.v11.capability import OneBot11Capability
 
 if TYPE_CHECKING:
@@ -16,11 +23,33 @@ if TYPE_CHECKING:
     from avilla.onebot.v11.protocol import OneBot11Protocol
 
 
+@dataclass
+class OneBot11CallConfig:
+    timeout: float = 30.0
+    max_inflight: int = 64
+    """同时等待响应的调用数上限, 超出时后续调用会等待空位."""
+    coalesce: bool = True
+    """合并并发的、参数相同的幂等调用 (如 get_group_member_info)."""
+    idempotent_actions: frozenset[str] = field(default_factory=frozenset)
+    """额外视为幂等的 action; 以 get_ 或 can_ 开头的 action 总是视为幂等."""
+
+    def is_idempotent(self, action: str) -> bool:
+        return action.startswith(("get_", "can_")) or action in self.idempotent_actions
+
+
 class OneBot11Networking:
     protocol: OneBot11Protocol
     accounts: dict[int, OneBot11Account]
     response_waiters: dict[str, asyncio.Future]
     close_signal: asyncio.Event
+    ingestion: EventIngestion[tuple[OneBot11Networking, dict]]
+
+    call_config: OneBot11CallConfig
+    file_uri_threshold: int | None = None
+    call_latency: defaultdict[str, LatencyHistogram]
+
+    _staff: Staff | None = None
+    _call_window: asyncio.Semaphore | None = None
 
     def __init__(self, protocol: OneBot11Protocol):
         super().__init__()
@@ -28,6 +57,11 @@ class OneBot11Networking:
         self.accounts = {}
         self.response_waiters = {}
         self.close_signal = asyncio.Event()
+        self.ingestion = EventIngestion(self.event_parse_task)
+        self.call_config = OneBot11CallConfig()
+        self.call_latency = defaultdict(LatencyHistogram)
+        self._echo = count()
+        self._coalescing: dict[tuple[str, str], asyncio.Task[dict | None]] = {}
 
     def get_staff_components(self):
         return {"connection": self, "protocol": self.protocol, "avilla": self.protocol.avilla}
@@ -36,8 +70,10 @@ class OneBot11Networking:
         return [self.protocol.artifacts, self.protocol.avilla.global_artifacts]
 
     @property
-    def staff(self):
-        return Staff(self.get_staff_artifacts(), self.get_staff_components())
+    def staff(self) -> Staff:
+        if self._staff is None:
+            self._staff = Staff(self.get_staff_artifacts(), self.get_staff_components())
+        return self._staff
 
     def message_receive(self) -> AsyncIterator[tuple[Self, dict]]:
         ...
@@ -52,41 +88,88 @@ class OneBot11Networking:
     async def send(self, payload: dict) -> None:
         ...
 
-    async def message_handle(self):
-        async for connection, data in self.message_receive():
-            if echo := data.get("echo"):
-                if future := self.response_waiters.get(echo):
-                    future.set_result(data)
-                continue
+    @staticmethod
+    def ingestion_scene(data: dict):
+        if "group_id" in data:
+            return data.get("self_id"), "group", data["group_id"]
+        if "user_id" in data:
+            return data.get("self_id"), "user", data["user_id"]
 
-            async def event_parse_task(data: dict):
-                with suppress(NotImplementedError):
-                    await OneBot11Capability(connection.staff).handle_event(data)
-                    return
+    async def event_parse_task(self, item: tuple[OneBot11Networking, dict]):
+        connection, data = item
+        with suppress(NotImplementedError):
+            await OneBot11Capability(connection.staff).handle_event(data)
+            return
 
-                logger.warning(f"received unsupported event: {data}")
+        logger.warning(f"received unsupported event: {data}")
 
-            asyncio.create_task(event_parse_task(data))
+    async def message_handle(self):
+        async with self.ingestion:
+            async for connection, data in self.message_receive():
+                if echo := data.get("echo"):
+                    if (future := self.response_waiters.get(echo)) and not future.done():
+                        future.set_result(data)
+                    continue
+
+                await self.ingestion.put(
+                    (connection, data),
+                    scene=self.ingestion_scene(data),
+                    low_priority=data.get("post_type") == "notice",
+                )
 
     async def connection_closed(self):
         self.close_signal.set()
 
+    @property
+    def call_window(self) -> asyncio.Semaphore:
+        if self._call_window is None:
+            self._call_window = asyncio.Semaphore(max(self.call_config.max_inflight, 1))
+        return self._call_window
+
     async def call(self, action: str, params: dict | None = None) -> dict | None:
         if not self.alive:
             raise RuntimeError("connection is not established")
 
+        params = params or {}
+        if not (self.call_config.coalesce and self.call_config.is_idempotent(action)):
+            return await self._call(action, params)
+
+        # 合并的调用共享同一个结果对象, 调用方不应修改它
+        key = (action, json.dumps(params, sort_keys=True, default=str))
+        if (task := self._coalescing.get(key)) is None:
+            task = self._coalescing[key] = asyncio.create_task(self._call(action, params))
+            task.add_done_callback(lambda _: self._coalescing.pop(key, None))
+        return await asyncio.shield(task)
+
+    async def _request(self, action: str, params: dict) -> dict:
+        """发出调用并返回完整的响应 (含 status 与 retcode); 默认经由 send 发送, 以 echo 匹配响应."""
+        echo = str(next(self._echo))
         future: asyncio.Future[dict] = asyncio.get_running_loop().create_future()
-        echo = str(hash(future))
         self.response_waiters[echo] = future
-
         try:
-            await self.wait_for_available()
-            await self.send({"action": action, "params": params or {}, "echo": echo})
-            result = await future
+            await self.send({"action": action, "params": params, "echo": echo})
+            try:
+                return await asyncio.wait_for(future, self.call_config.timeout)
+            except asyncio.TimeoutError:
+                raise ActionFailed(f"{action}: no response in {self.call_config.timeout}s") from None
         finally:
             del self.response_waiters[echo]
 
-        if result["status"] != "ok":
+    async def _call(self, action: str, params: dict) -> dict | None:
+        async with self.call_window:
+            start = time.perf_counter()
+            failed = True
+
+            try:
+                await self.wait_for_available()
+                result = await self._request(action, params)
+                failed = result["status"] != "ok"
+            finally:
+                elapsed = time.perf_counter() - start
+                self.call_latency[action].observe(elapsed, error=failed)
+                self.protocol.avilla.metrics.observe_rpc("onebot11", action, elapsed, error=failed)
+
+        if failed:
             raise ActionFailed(f"{result['retcode']}: {result}")
 
         return result.get("data")
@@ -0,0 +1,169 @@
+from __future__ import annotations
+
+import asyncio
+import hmac
+import json
+import time
+from contextlib import suppress
+from hashlib import sha1
+from typing import TYPE_CHECKING, cast
+
+import aiohttp
+from graia.amnesia.builtins.asgi import UvicornASGIService
+from launart import Service
+from launart.manager import Launart
+from loguru import logger
+from starlette.applications import Starlette
+from starlette.requests import Request
+from starlette.responses import Response
+from starlette.routing import Route
+
+from avilla.core.exceptions import ActionFailed
+from avilla.onebot.v11.capability import OneBot11Capability
+from avilla.onebot.v11.net.base import OneBot11Networking
+from avilla.standard.core.account import AccountUnregistered
+
+if TYPE_CHECKING:
+    from avilla.onebot.v11.account import OneBot11Account
+    from avilla.onebot.v11.protocol import OneBot11HttpConfig, OneBot11Protocol
+
+
+class OneBot11HttpNetworking(OneBot11Networking, Service):
+    """OneBot v11 的 HTTP API 与 HTTP POST 上报.
+
+    调用经由连接池中的 keep-alive 连接并发发出, 不与事件共用同一条连接;
+    上报挂载在 UvicornASGIService 上, 未配置 endpoint 时只用于调用.
+    """
+
+    stages: set[str] = {"preparing", "blocking", "cleanup"}
+
+    config: OneBot11HttpConfig
+    session: aiohttp.ClientSession | None = None
+
+    def __init__(self, protocol: OneBot11Protocol, config: OneBot11HttpConfig) -> None:
+        super().__init__(protocol)
+        self.config = config
+        self.ingestion.config = config.ingestion
+        self.call_config = config.call
+        self.file_uri_threshold = config.file_uri_threshold
+
+    @property
+    def id(self):
+        return f"onebot/v11/connection/http#{id(self)}"
+
+    @property
+    def required(self):
+        return {"asgi.service/uvicorn"} if self.config.endpoint is not None else set()
+
+    @property
+    def alive(self) -> bool:
+        return self.session is not None and not self.session.closed
+
+    async def wait_for_available(self):
+        await self.status.wait_for_available()
+
+    async def _request(self, action: str, params: dict) -> dict:
+        if self.session is None:
+            raise RuntimeError("connection is not established")
+        try:
+            async with self.session.post(self.config.api / action, json=params) as resp:
+                if resp.status != 200:
+                    raise ActionFailed(f"{action}: HTTP {resp.status} {await resp.text()}")
+                return await resp.json(content_type=None)
+        except asyncio.TimeoutError:
+            raise ActionFailed(f"{action}: no response in {self.call_config.timeout}s") from None
+
+    def _verify(self, request: Request, body: bytes) -> bool:
+        if self.config.secret is None:
+            return True
+        signature = request.headers.get("X-Signature", "")
+        expected = "sha1=" + hmac.new(self.config.secret.encode(), body, sha1).hexdigest()
+        return hmac.compare_digest(signature, expected)
+
+    async def register_account(self, self_id: int):
+        # HTTP 上报没有 lifecycle.connect, 以同样的事件注册账号
+        await OneBot11Capability(self.staff).handle_event(
+            {
+                "time": int(time.time()),
+                "self_id": self_id,
+                "post_type": "meta_event",
+                "meta_event_type": "lifecycle",
+                "sub_type": "connect",
+            }
+        )
+
+    async def event_handler(self, request: Request):
+        body = await request.body()
+        if not self._verify(request, body):
+            return Response(status_code=403)
+        try:
+            data = json.loads(body)
+        except ValueError:
+            return Response(status_code=400)
+
+        if (self_id := data.get("self_id")) is not None and self_id not in self.accounts:
+            await self.register_account(self_id)
+        # 队列已满时延迟响应, 由实现端承担背压
+        await self.ingestion.put(
+            (self, data),
+            scene=self.ingestion_scene(data),
+            low_priority=data.get("post_type") == "notice",
+        )
+        return Response(status_code=204)
+
+    async def login(self, manager: Launart):
+        while not manager.status.exiting:
+            try:
+                info = await self.call("get_login_info")
+            except Exception as e:
+                logger.error(f"{self} Failed to reach HTTP API: {e}")
+                logger.debug(f"{self} Will retry in 5 seconds...")
+                await asyncio.sleep(5)
+                continue
+            if info and (self_id := info.get("user_id")) is not None and self_id not in self.accounts:
+                await self.register_account(int(self_id))
+            return
+
+    async def unregister_accounts(self):
+        avilla = self.protocol.avilla
+        for n in list(avilla.accounts.keys()):
+            if not n.follows("land(qq).account") or int(n["account"]) not in self.accounts:
+                continue
+            account = cast("OneBot11Account", avilla.accounts[n].account)
+            account.status.enabled = False
+            await avilla.broadcast.postEvent(AccountUnregistered(avilla, account))
+            del avilla.accounts[n]
+        self.accounts.clear()
+
+    async def launch(self, manager: Launart):
+        async with self.stage("preparing"):
+            pool = self.config.pool
+            self.session = aiohttp.ClientSession(
+                connector=aiohttp.TCPConnector(
+                    limit=pool.limit,
+                    limit_per_host=pool.limit_per_host,
+                    ttl_dns_cache=pool.dns_cache_ttl,
+                    keepalive_timeout=pool.keepalive_timeout,
+                ),
+                headers={"Authorization": f"Bearer {access_token}"}
+                if (access_token := self.config.access_token) is not None
+                else None,
+                timeout=aiohttp.ClientTimeout(total=self.call_config.timeout),
+            )
+            if self.config.endpoint is not None:
+                asgi_service = manager.get_component(UvicornASGIService)
+                app = Starlette(routes=[Route("/", self.event_handler, methods=["POST"])])
+                asgi_service.middleware.mounts[self.config.endpoint.rstrip("/")] = app  # type: ignore
+
+        async with self.stage("blocking"):
+            await self.login(manager)
+            await manager.status.wait_for_sigexit()
+
+        async with self.stage("cleanup"):
+            if self.config.endpoint is not None:
+                with suppress(KeyError):
+                    del asgi_service.middleware.mounts[self.config.endpoint.rstrip("/")]
+            await self.unregister_accounts()
+            await self.ingestion.close()
+            await self.session.close()
+            self.session = None
@@ -30,6 +30,9 @@ class OneBot11WsClientNetworking(OneBot11Networking, Service):
     def __init__(self, protocol: OneBot11Protocol, config: OneBot11ForwardConfig) -> None:
         super().__init__(protocol)
         self.config = config
+        self.ingestion.config = config.ingestion
+        self.call_config = config.call
+        self.file_uri_threshold = config.file_uri_threshold
 
     @property
     def id(self):
@@ -83,6 +83,9 @@ class OneBot11WsServerNetworking(Service):
 
         await ws.accept()
         connection = OneBot11WsServerConnection(ws, self.protocol)
+        connection.ingestion.config = self.config.ingestion
+        connection.call_config = self.config.call
+        connection.file_uri_threshold = self.config.file_uri_threshold
         self.connections[account_id] = connection
 
         try:
@@ -1,11 +1,8 @@
 from __future__ import annotations
 
 import os
-from datetime import timedelta
 from typing import IO, TYPE_CHECKING
 
-from graia.amnesia.builtins.memcache import Memcache, MemcacheService
-
 from avilla.core.ryanvk.collector.account import AccountCollector
 from avilla.core.selector import Selector
 from avilla.standard.core.file import (
@@ -13,7 +10,7 @@ from avilla.standard.core.file import (
     FileCapability,
     FileDirectoryCapability
 )
-from avilla.onebot.v11.utils import file_parse, folder_parse
+from avilla.onebot.v11.file_index import GroupFileIndex
 from pathlib import Path
 from tempfile import NamedTemporaryFile
 
@@ -28,86 +25,9 @@ class OneBot11AnnouncementActionPerform((m := AccountCollector["OneBot11Protocol
 
     @m.pull("land.group.file", FileData)
     async def get_file(self, target: Selector, route: ...) -> FileData:
-        cache: Memcache = self.protocol.avilla.launch_manager.get_component(MemcacheService).cache
-        if file := await cache.get(
-            f"onebot11/account({self.account.route['account']}).group({target['group']}).file({target['file']})"
-        ):
-            return file
-
-        async def step(data: FileData):
-            res2 = await self.account.connection.call(
-                "get_group_files_by_folder",
-                {
-                    "group_id": int(target["group"]),
-                    "folder_id": data.id,
-                },
-            )
-            if not res2:
-                raise RuntimeError(f"File {target} not found.")
-            for file in res2["files"]:
-                _res = await self.account.connection.call(
-                    "get_group_file_url",
-                    {
-                        "group_id": int(target["group"]),
-                        "file_id": file["file_id"],
-                        "busid": file["busid"],
-                    },
-                )
-                filedata = file_parse(file, _res["url"] if _res else "", data)
-                if filedata.id == target["file"]:
-                    await cache.set(
-                        f"onebot11/account({self.account.route['account']}).group({target['group']}).file({target['file']})", filedata,
-                        timedelta(minutes=5),
-                    )
-                    return filedata
-            for _folder in res2["folders"]:
-                _folderdata = folder_parse(_folder, data)
-                if _folderdata.id == target["file"]:
-                    await cache.set(
-                        f"onebot11/account({self.account.route['account']}).group({target['group']}).file({target['file']})", _folderdata,
-                        timedelta(minutes=5),
-                    )
-                    return _folderdata
-                return await step(_folderdata)
+        if (data := await GroupFileIndex(self.account).get(target["group"], target["file"])) is None:
             raise RuntimeError(f"File {target} not found.")
-
-        res1 = await self.account.connection.call(
-            "get_group_root_files",
-            {
-                "group_id": int(target["group"]),
-            },
-        )
-        if not res1:
-            raise RuntimeError(f"File {target} not found.")
-        for file in res1["files"]:
-            _res = await self.account.connection.call(
-                "get_group_file_url",
-                {
-                    "group_id": int(target["group"]),
-                    "file_id": file["file_id"],
-                    "busid": file["busid"],
-                },
-            )
-            filedata = file_parse(file, _res["url"] if _res else "")
-            if filedata.id == target["file"]:
-                await cache.set(
-                    f"onebot11/account({self.account.route['account']}).group({target['group']}).file({target['file']})", filedata,
-                    timedelta(minutes=5),
-                )
-                return filedata
-
-        for folder in res1["folders"]:
-            folderdata = folder_parse(folder)
-            if folderdata.id == target["file"]:
-                await cache.set(
-                    f"onebot11/account({self.account.route['account']}).group({target['group']}).file({target['file']})", folderdata,
-                    timedelta(minutes=5),
-                )
-                return folderdata
-            return await step(folderdata)
-
-        raise RuntimeError(f"File {target} not found.")
-
+        return data
 
     @m.entity(FileCapability.upload, target="land.group")
     async def upload_group_file(
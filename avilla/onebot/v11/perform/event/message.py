@@ -8,6 +8,7 @@ from avilla.core.context import Context
 from avilla.core.elements import Reference
 from avilla.core.message import Message
 from avilla.core.selector import Selector
+from avilla.core.subscription import produces
 from avilla.onebot.v11.capability import OneBot11Capability
 from avilla.onebot.v11.collector.connection import ConnectionCollector
 from avilla.standard.core.message import MessageReceived, MessageRevoked, MessageSent
@@ -18,6 +19,7 @@ class OneBot11EventMessagePerform((m := ConnectionCollector())._):
     m.identify = "message"
 
     @m.entity(OneBot11Capability.event_callback, raw_event="message.private.friend")
+    @produces(MessageReceived)
     async def private_friend(self, raw_event: dict):
         self_id = raw_event["self_id"]
         account = self.connection.accounts.get(self_id)
@@ -53,6 +55,7 @@ class OneBot11EventMessagePerform((m := ConnectionCollector())._):
         )
 
     @m.entity(OneBot11Capability.event_callback, raw_event="message.private.group")
+    @produces(MessageReceived)
     async def private_group(self, raw_event: dict):
         self_id = raw_event["self_id"]
         account = self.connection.accounts.get(self_id)
@@ -90,6 +93,7 @@ class OneBot11EventMessagePerform((m := ConnectionCollector())._):
 
     @m.entity(OneBot11Capability.event_callback, raw_event="message.group.normal")
     @m.entity(OneBot11Capability.event_callback, raw_event="message.group.notice")
+    @produces(MessageReceived)
     async def group(self, raw_event: dict):
         self_id = raw_event["self_id"]
         account = self.connection.accounts.get(self_id)
@@ -125,6 +129,7 @@ class OneBot11EventMessagePerform((m := ConnectionCollector())._):
         )
 
     @m.entity(OneBot11Capability.event_callback, raw_event="message.private.other")
+    @produces(MessageReceived)
     async def private_other(self, raw_event: dict):
         self_id = raw_event["self_id"]
         account = self.connection.accounts.get(self_id)
@@ -159,6 +164,7 @@ class OneBot11EventMessagePerform((m := ConnectionCollector())._):
         )
 
     @m.entity(OneBot11Capability.event_callback, raw_event="message.group.anonymous")
+    @produces(MessageReceived)
     async def group_anonymous(self, raw_event: dict):
         self_id = raw_event["self_id"]
         account = self.connection.accounts.get(self_id)
@@ -194,6 +200,7 @@ class OneBot11EventMessagePerform((m := ConnectionCollector())._):
         )
 
     @m.entity(OneBot11Capability.event_callback, raw_event="message_sent.group.normal")
+    @produces(MessageSent)
     async def message_sent(self, raw_event: dict):
         self_id = raw_event["self_id"]
         account = self.connection.accounts.get(self_id)
@@ -225,6 +232,7 @@ class OneBot11EventMessagePerform((m := ConnectionCollector())._):
         )
 
     @m.entity(OneBot11Capability.event_callback, raw_event="notice.group_recall")
+    @produces(MessageRevoked)
     async def group_message_recall(self, raw_event: dict):
         self_id = raw_event["self_id"]
         account = self.connection.accounts.get(self_id)
@@ -240,6 +248,7 @@ class OneBot11EventMessagePerform((m := ConnectionCollector())._):
         return MessageRevoked(context, message, operator, sender)
 
     @m.entity(OneBot11Capability.event_callback, raw_event="notice.friend_recall")
+    @produces(MessageRevoked)
     async def friend_message_recall(self, raw_event: dict):
         self_id = raw_event["self_id"]
         account = self.connection.accounts.get(self_id)
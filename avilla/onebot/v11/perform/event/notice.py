@@ -14,8 +14,10 @@ from avilla.core.event import (
     SceneDestroyed,
 )
 from avilla.core.selector import Selector
+from avilla.core.subscription import produces
 from avilla.onebot.v11.capability import OneBot11Capability
 from avilla.onebot.v11.collector.connection import ConnectionCollector
+from avilla.onebot.v11.file_index import GroupFileIndex
 from avilla.standard.core.activity import ActivityTrigged
 from avilla.standard.core.privilege import MuteInfo, Privilege
 from avilla.standard.core.file import FileReceived
@@ -28,6 +30,7 @@ class OneBot11EventNoticePerform((m := ConnectionCollector())._):
     m.identify = "notice"
 
     @m.entity(OneBot11Capability.event_callback, raw_event="notice.group_admin.set")
+    @produces(MetadataModified)
     async def group_admin_set(self, raw_event: dict):
         self_id = raw_event["self_id"]
         account = self.connection.accounts.get(self_id)
@@ -56,6 +59,7 @@ class OneBot11EventNoticePerform((m := ConnectionCollector())._):
         )
 
     @m.entity(OneBot11Capability.event_callback, raw_event="notice.group_admin.unset")
+    @produces(MetadataModified)
     async def group_admin_unset(self, raw_event: dict):
         self_id = raw_event["self_id"]
         account = self.connection.accounts.get(self_id)
@@ -84,6 +88,7 @@ class OneBot11EventNoticePerform((m := ConnectionCollector())._):
         )
 
     @m.entity(OneBot11Capability.event_callback, raw_event="notice.group_decrease.leave")
+    @produces(SceneDestroyed)
     async def member_leave(self, raw_event: dict):
         self_id = raw_event["self_id"]
         account = self.connection.accounts.get(self_id)
@@ -97,6 +102,7 @@ class OneBot11EventNoticePerform((m := ConnectionCollector())._):
         return SceneDestroyed(context, True, True)
 
     @m.entity(OneBot11Capability.event_callback, raw_event="notice.group_decrease.kick")
+    @produces(SceneDestroyed)
     async def member_kick(self, raw_event: dict):
         self_id = raw_event["self_id"]
         account = self.connection.accounts.get(self_id)
@@ -110,6 +116,7 @@ class OneBot11EventNoticePerform((m := ConnectionCollector())._):
         return SceneDestroyed(context, False, True)
 
     @m.entity(OneBot11Capability.event_callback, raw_event="notice.group_decrease.kick_me")
+    @produces(SceneDestroyed)
     async def member_kick_me(self, raw_event: dict):
         self_id = raw_event["self_id"]
         account = self.connection.accounts.get(self_id)
@@ -123,6 +130,7 @@ class OneBot11EventNoticePerform((m := ConnectionCollector())._):
         return SceneDestroyed(context, False, False)
 
     @m.entity(OneBot11Capability.event_callback, raw_event="notice.group_increase.approve")
+    @produces(SceneCreated)
     async def member_increase_approve(self, raw_event: dict):
         self_id = raw_event["self_id"]
         account = self.connection.accounts.get(self_id)
@@ -142,6 +150,7 @@ class OneBot11EventNoticePerform((m := ConnectionCollector())._):
         return SceneCreated(context)
 
     @m.entity(OneBot11Capability.event_callback, raw_event="notice.group_increase.invite")
+    @produces(SceneCreated)
     async def member_increase_invite(self, raw_event: dict):
         self_id = raw_event["self_id"]
         account = self.connection.accounts.get(self_id)
@@ -155,6 +164,7 @@ class OneBot11EventNoticePerform((m := ConnectionCollector())._):
         return SceneCreated(context)
 
     @m.entity(OneBot11Capability.event_callback, raw_event="notice.group_ban.ban")
+    @produces(MetadataModified)
     async def member_muted(self, raw_event: dict):
         self_id = raw_event["self_id"]
         account = self.connection.accounts.get(self_id)
@@ -184,6 +194,7 @@ class OneBot11EventNoticePerform((m := ConnectionCollector())._):
         )
 
     @m.entity(OneBot11Capability.event_callback, raw_event="notice.group_ban.lift_ban")
+    @produces(MetadataModified)
     async def member_unmuted(self, raw_event: dict):
         self_id = raw_event["self_id"]
         account = self.connection.accounts.get(self_id)
@@ -213,6 +224,7 @@ class OneBot11EventNoticePerform((m := ConnectionCollector())._):
         )
 
     @m.entity(OneBot11Capability.event_callback, raw_event="notice.friend_add")
+    @produces(DirectSessionCreated)
     async def friend_add(self, raw_event: dict):
         self_id = raw_event["self_id"]
         account = self.connection.accounts.get(self_id)
@@ -224,6 +236,7 @@ class OneBot11EventNoticePerform((m := ConnectionCollector())._):
         return DirectSessionCreated(context)
 
     @m.entity(OneBot11Capability.event_callback, raw_event="notice.notify.poke")
+    @produces(ActivityTrigged)
     async def nudge_received(self, raw_event: dict):
         self_id = raw_event["self_id"]
         account = self.connection.accounts.get(self_id)
@@ -243,6 +256,7 @@ class OneBot11EventNoticePerform((m := ConnectionCollector())._):
             return ActivityTrigged(context, "nudge", friend, friend.nudge("_"), friend)
 
     @m.entity(OneBot11Capability.event_callback, raw_event="notice.notify.lucky_king")
+    @produces(PocketLuckyKingNoticed)
     async def lucky_king_received(self, raw_event: dict):
         self_id = raw_event["self_id"]
         account = self.connection.accounts.get(self_id)
@@ -257,6 +271,7 @@ class OneBot11EventNoticePerform((m := ConnectionCollector())._):
         return PocketLuckyKingNoticed(context)
 
     @m.entity(OneBot11Capability.event_callback, raw_event="notice.notify.honor")
+    @produces(MetadataModified)
     async def honor(self, raw_event: dict):
         self_id = raw_event["self_id"]
         account = self.connection.accounts.get(self_id)
@@ -274,6 +289,7 @@ class OneBot11EventNoticePerform((m := ConnectionCollector())._):
             {Honor.inh().name: ModifyDetail("set", raw_event["honor_type"])},
         )
 
+    # 不标注 produces: 即使没有监听 FileReceived, 也需要将新文件并入群文件索引
     @m.entity(OneBot11Capability.event_callback, raw_event="notice.group_upload")
     async def file_upload(self, raw_event: dict):
         self_id = raw_event["self_id"]
@@ -282,6 +298,7 @@ class OneBot11EventNoticePerform((m := ConnectionCollector())._):
             logger.warning(f"Unknown account {self_id} sent message {raw_event}")
             return
 
+        await GroupFileIndex(account).apply_upload(str(raw_event["group_id"]), raw_event["file"], raw_event.get("time"))
         group = Selector().land(account.route["land"]).group(str(raw_event["group_id"]))
         user = group.member(str(raw_event["user_id"]))
         context = Context(account, group, user, group, group.member(str(self_id)))
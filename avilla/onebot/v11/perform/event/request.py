@@ -7,6 +7,7 @@ from loguru import logger
 from avilla.core.context import Context
 from avilla.core.request import Request
 from avilla.core.selector import Selector
+from avilla.core.subscription import produces
 from avilla.onebot.v11.capability import OneBot11Capability
 from avilla.onebot.v11.collector.connection import ConnectionCollector
 from avilla.standard.core.request import RequestEvent
@@ -17,6 +18,7 @@ class OneBot11EventRequestPerform((m := ConnectionCollector())._):
     m.identify = "request"
 
     @m.entity(OneBot11Capability.event_callback, raw_event="request.friend")
+    @produces(RequestEvent)
     async def friend(self, raw_event: dict):
         self_id = raw_event["self_id"]
         account = self.connection.accounts.get(self_id)
@@ -46,6 +48,7 @@ class OneBot11EventRequestPerform((m := ConnectionCollector())._):
 
     @m.entity(OneBot11Capability.event_callback, raw_event="request.group.add")
     @m.entity(OneBot11Capability.event_callback, raw_event="request.group.invite")
+    @produces(RequestEvent)
     async def group(self, raw_event: dict):
         self_id = raw_event["self_id"]
         account = self.connection.accounts.get(self_id)
@@ -50,15 +50,15 @@ class OneBot11MessageDeserializePerform((m := ApplicationCollector())._):
     # LINK: https://github.com/microsoft/pyright/issues/5409
 
     @m.entity(OneBot11Capability.deserialize_element, raw_element="text")
-    async def text(self, raw_element: dict) -> Text:
+    def text(self, raw_element: dict) -> Text:
         return Text(raw_element["data"]["text"])
 
     @m.entity(OneBot11Capability.deserialize_element, raw_element="face")
-    async def face(self, raw_element: dict) -> Face:
+    def face(self, raw_element: dict) -> Face:
         return Face(raw_element["data"]["id"])
 
     @m.entity(OneBot11Capability.deserialize_element, raw_element="image")
-    async def image(self, raw_element: dict) -> Picture | FlashImage:
+    def image(self, raw_element: dict) -> Picture | FlashImage:
         data: dict = raw_element["data"]
         if self.context:
             id_ = self.context.scene.file(data["file"])
@@ -68,7 +68,7 @@ class OneBot11MessageDeserializePerform((m := ApplicationCollector())._):
         return FlashImage(resource) if raw_element.get("type") == "flash" else Picture(resource)
 
     @m.entity(OneBot11Capability.deserialize_element, raw_element="record")
-    async def record(self, raw_element: dict) -> Audio:
+    def record(self, raw_element: dict) -> Audio:
         data: dict = raw_element["data"]
         if "url" in data.keys():
             if self.context:
@@ -80,7 +80,7 @@ class OneBot11MessageDeserializePerform((m := ApplicationCollector())._):
         return Audio(data["path"])
 
     @m.entity(OneBot11Capability.deserialize_element, raw_element="video")
-    async def video(self, raw_element: dict) -> Video:
+    def video(self, raw_element: dict) -> Video:
         data: dict = raw_element["data"]
         if self.context:
             id_ = self.context.scene.file(data["file"])
@@ -89,7 +89,7 @@ class OneBot11MessageDeserializePerform((m := ApplicationCollector())._):
         return Video(OneBot11VideoResource(id_, data["file"], data["url"]))
 
     @m.entity(OneBot11Capability.deserialize_element, raw_element="at")
-    async def at(self, raw_element: dict) -> Notice | NoticeAll:
+    def at(self, raw_element: dict) -> Notice | NoticeAll:
         if raw_element["data"]["qq"] == "all":
             return NoticeAll()
         if self.context:
@@ -97,29 +97,29 @@ class OneBot11MessageDeserializePerform((m := ApplicationCollector())._):
         return Notice(Selector().land("qq").member(raw_element["data"]["qq"]))
 
     @m.entity(OneBot11Capability.deserialize_element, raw_element="reply")
-    async def reply(self, raw_element: dict):
+    def reply(self, raw_element: dict):
         if self.context:
             return Reference(self.context.scene.message(raw_element["data"]["id"]))
         return Reference(Selector().land("qq").message(raw_element["data"]["id"]))
 
     @m.entity(OneBot11Capability.deserialize_element, raw_element="dice")
-    async def dice(self, raw_element: dict):
+    def dice(self, raw_element: dict):
         return Dice()
 
     @m.entity(OneBot11Capability.deserialize_element, raw_element="shake")
-    async def shake(self, raw_element: dict):
+    def shake(self, raw_element: dict):
         return Poke()
 
     @m.entity(OneBot11Capability.deserialize_element, raw_element="json")
-    async def json(self, raw_element: dict):
+    def json(self, raw_element: dict):
         return Json(raw_element["data"]["content"])
 
     @m.entity(OneBot11Capability.deserialize_element, raw_element="xml")
-    async def xml(self, raw_element: dict):
+    def xml(self, raw_element: dict):
         return Xml(raw_element["data"]["content"])
 
     @m.entity(OneBot11Capability.deserialize_element, raw_element="share")
-    async def share(self, raw_element: dict):
+    def share(self, raw_element: dict):
         return Share(
             raw_element["data"]["url"],
             raw_element["data"]["title"],
@@ -151,7 +151,7 @@ class OneBot11MessageDeserializePerform((m := ApplicationCollector())._):
         return elem
 
     @m.entity(OneBot11Capability.deserialize_element, raw_element="file")
-    async def file(self, raw_element: dict) -> File:
+    def file(self, raw_element: dict) -> File:
         data = raw_element["data"]
         if "file_id" in data:
             if self.context:
@@ -168,7 +168,7 @@ class OneBot11MessageDeserializePerform((m := ApplicationCollector())._):
         return File(resource)
 
     @m.entity(OneBot11Capability.deserialize_element, raw_element="mface")
-    async def mface(self, raw_element: dict) -> MarketFace:
+    def mface(self, raw_element: dict) -> MarketFace:
         # 由于OneBot11并未规定商城表情的格式，此处采用了LLOneBot的格式
         # https://github.com/LLOneBot/LLOneBot/pull/205
         _id = "::".join(
@@ -1,6 +1,5 @@
 from __future__ import annotations
 
-import base64
 from typing import TYPE_CHECKING, cast
 
 from avilla.core.elements import (
@@ -15,6 +14,7 @@ from avilla.core.elements import (
 )
 from avilla.core.resource import LocalFileResource, RawResource, UrlResource
 from avilla.core.ryanvk.collector.account import AccountCollector
+from avilla.core.utilles.fileio import b64encode, file_size
 from avilla.onebot.v11.capability import OneBot11Capability
 from avilla.onebot.v11.resource import (
     OneBot11ImageResource,
@@ -45,16 +45,26 @@ class OneBot11MessageSerializePerform((m := AccountCollector["OneBot11Protocol",
 
     # LINK: https://github.com/microsoft/pyright/issues/5409
 
+    async def local_file(self, resource: LocalFileResource) -> str:
+        threshold = self.account.connection.file_uri_threshold
+        if threshold is not None and await file_size(resource.file) > threshold:
+            # 大文件不内联进 JSON, 交给 OneBot 实现自行读取
+            return resource.file.absolute().as_uri()
+        return "base64://" + await self.protocol.avilla.media_cache.base64(resource)
+
     @m.entity(OneBot11Capability.serialize_element, element=Text)
-    async def text(self, element: Text) -> dict:
+    def text(self, element: Text) -> dict:
         return {"type": "text", "data": {"text": element.text}}
 
     @m.entity(OneBot11Capability.serialize_element, element=Face)
-    async def face(self, element: Face) -> dict:
+    def face(self, element: Face) -> dict:
         return {"type": "face", "data": {"id": int(element.id)}}
 
     @m.entity(OneBot11Capability.serialize_element, element=Picture)
     async def picture(self, element: Picture) -> dict:
+        return await self._picture(element)
+
+    async def _picture(self, element: Picture) -> dict:
         if isinstance(element.resource, OneBot11ImageResource):
             return {
                 "type": "image",
@@ -71,15 +81,14 @@ class OneBot11MessageSerializePerform((m := AccountCollector["OneBot11Protocol",
                 },
             }
         elif isinstance(element.resource, LocalFileResource):
-            data = base64.b64encode(element.resource.file.read_bytes()).decode("utf-8")
             return {
                 "type": "image",
                 "data": {
-                    "file": "base64://" + data,
+                    "file": await self.local_file(element.resource),
                 },
             }
         elif isinstance(element.resource, RawResource):
-            data = base64.b64encode(element.resource.data).decode("utf-8")
+            data = await self.protocol.avilla.media_cache.base64(element.resource)
             return {
                 "type": "image",
                 "data": {
@@ -87,13 +96,11 @@ class OneBot11MessageSerializePerform((m := AccountCollector["OneBot11Protocol",
                 },
             }
         else:
+            data = await b64encode(cast(bytes, await self.account.staff.fetch_resource(element.resource)))
             return {
                 "type": "image",
                 "data": {
-                    "file": "base64://"
-                    + base64.b64encode(cast(bytes, await self.account.staff.fetch_resource(element.resource))).decode(
-                        "utf-8"
-                    ),
+                    "file": "base64://" + data,
                 },
             }
 
@@ -115,15 +122,14 @@ class OneBot11MessageSerializePerform((m := AccountCollector["OneBot11Protocol",
                 },
             }
         elif isinstance(element.resource, LocalFileResource):
-            data = base64.b64encode(element.resource.file.read_bytes()).decode("utf-8")
             return {
                 "type": "record",
                 "data": {
-                    "file": "base64://" + data,
+                    "file": await self.local_file(element.resource),
                 },
             }
         elif isinstance(element.resource, RawResource):
-            data = base64.b64encode(element.resource.data).decode("utf-8")
+            data = await self.protocol.avilla.media_cache.base64(element.resource)
             return {
                 "type": "record",
                 "data": {
@@ -131,13 +137,11 @@ class OneBot11MessageSerializePerform((m := AccountCollector["OneBot11Protocol",
                 },
             }
         else:
+            data = await b64encode(cast(bytes, await self.account.staff.fetch_resource(element.resource)))
             return {
                 "type": "record",
                 "data": {
-                    "file": "base64://"
-                    + base64.b64encode(cast(bytes, await self.account.staff.fetch_resource(element.resource))).decode(
-                        "utf-8"
-                    ),
+                    "file": "base64://" + data,
                 },
             }
 
@@ -159,15 +163,14 @@ class OneBot11MessageSerializePerform((m := AccountCollector["OneBot11Protocol",
                 },
             }
         elif isinstance(element.resource, LocalFileResource):
-            data = base64.b64encode(element.resource.file.read_bytes()).decode("utf-8")
             return {
                 "type": "video",
                 "data": {
-                    "file": "base64://" + data,
+                    "file": await self.local_file(element.resource),
                 },
             }
         elif isinstance(element.resource, RawResource):
-            data = base64.b64encode(element.resource.data).decode("utf-8")
+            data = await self.protocol.avilla.media_cache.base64(element.resource)
             return {
                 "type": "video",
                 "data": {
@@ -175,36 +178,34 @@ class OneBot11MessageSerializePerform((m := AccountCollector["OneBot11Protocol",
                 },
             }
         else:
+            data = await b64encode(cast(bytes, await self.account.staff.fetch_resource(element.resource)))
             return {
                 "type": "video",
                 "data": {
-                    "file": "base64://"
-                    + base64.b64encode(cast(bytes, await self.account.staff.fetch_resource(element.resource))).decode(
-                        "utf-8"
-                    ),
+                    "file": "base64://" + data,
                 },
             }
 
     @m.entity(OneBot11Capability.serialize_element, element=FlashImage)
     async def flash_image(self, element: FlashImage):
-        raw = await self.picture(element)
+        raw = await self._picture(element)
         raw["data"]["type"] = "flash"
         return raw
 
     @m.entity(OneBot11Capability.serialize_element, element=Notice)
-    async def notice(self, element: Notice):
+    def notice(self, element: Notice):
         return {"type": "at", "data": {"qq": element.target["member"]}}
 
     @m.entity(OneBot11Capability.serialize_element, element=NoticeAll)
-    async def notice_all(self, element: NoticeAll):
+    def notice_all(self, element: NoticeAll):
         return {"type": "at", "data": {"qq": "all"}}
 
     @m.entity(OneBot11Capability.serialize_element, element=Dice)
-    async def dice(self, element: Dice):
+    def dice(self, element: Dice):
         return {"type": "dice", "data": {}}
 
     @m.entity(OneBot11Capability.serialize_element, element=MusicShare)
-    async def music_share(self, element: MusicShare):
+    def music_share(self, element: MusicShare):
         raw = {
             "type": "music",
             "data": {
@@ -221,23 +222,23 @@ class OneBot11MessageSerializePerform((m := AccountCollector["OneBot11Protocol",
         return raw
 
     @m.entity(OneBot11Capability.serialize_element, element=Gift)
-    async def gift(self, element: Gift):
+    def gift(self, element: Gift):
         return {"type": "gift", "data": {"id": element.kind.value, "qq": element.target["member"]}}
 
     @m.entity(OneBot11Capability.serialize_element, element=Json)
-    async def json(self, element: Json):
+    def json(self, element: Json):
         return {"type": "json", "data": {"data": element.content}}
 
     @m.entity(OneBot11Capability.serialize_element, element=Xml)
-    async def xml(self, element: Xml):
+    def xml(self, element: Xml):
         return {"type": "xml", "data": {"data": element.content}}
 
     @m.entity(OneBot11Capability.serialize_element, element=App)
-    async def app(self, element: App):
+    def app(self, element: App):
         return {"type": "json", "data": {"data": element.content}}
 
     @m.entity(OneBot11Capability.serialize_element, element=Share)
-    async def share(self, element: Share):
+    def share(self, element: Share):
         res = {
             "type": "share",
             "data": {
@@ -252,17 +253,17 @@ class OneBot11MessageSerializePerform((m := AccountCollector["OneBot11Protocol",
         return res
 
     @m.entity(OneBot11Capability.serialize_element, element=Poke)
-    async def poke(self, element: Poke):
+    def poke(self, element: Poke):
         return {"type": "shake", "data": {}}
 
     # TODO
 
     @m.entity(OneBot11Capability.serialize_element, element=Reference)
-    async def reply(self, element: Reference):
+    def reply(self, element: Reference):
         return {"type": "reply", "data": {"id": element.message["message"]}}
 
     @m.entity(OneBot11Capability.serialize_element, element=MarketFace)
-    async def market_face(self, element: MarketFace):
+    def market_face(self, element: MarketFace):
         # 由于OneBot11并未规定商城表情的格式，此处采用了LLOneBot的格式
         # https://github.com/LLOneBot/LLOneBot/pull/205
         emoji_package_id, emoji_id, key = element.id.split('::')
@@ -1,28 +1,60 @@
 from __future__ import annotations
 
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 
 from yarl import URL
 
 from avilla.core.application import Avilla
+from avilla.core.http import HttpClientConfig
+from avilla.core.ingestion import IngestionConfig, OverflowPolicy
 from avilla.core.protocol import BaseProtocol
 from graia.ryanvk import merge, ref
 
+from .net.base import OneBot11CallConfig
+from .net.http import OneBot11HttpNetworking
 from .net.ws_client import OneBot11WsClientNetworking
 from .net.ws_server import OneBot11WsServerNetworking
 from .service import OneBot11Service
 
 
+def _default_ingestion_config():
+    # API 响应与事件共用同一条连接, 阻塞读取会导致等待响应的事件处理死锁.
+    return IngestionConfig(overflow=OverflowPolicy.SHED_LOW_PRIORITY, fallback=OverflowPolicy.DROP_OLDEST)
+
+
 @dataclass
 class OneBot11ForwardConfig:
     endpoint: URL
     access_token: str | None = None
+    ingestion: IngestionConfig = field(default_factory=_default_ingestion_config)
+    call: OneBot11CallConfig = field(default_factory=OneBot11CallConfig)
+    file_uri_threshold: int | None = None
+    """本地文件超过此字节数时以 file:// URI 发送而非内联 base64, 需要 OneBot 实现能访问同一文件系统."""
 
 
 @dataclass
 class OneBot11ReverseConfig:
     endpoint: str
     access_token: str | None = None
+    ingestion: IngestionConfig = field(default_factory=_default_ingestion_config)
+    call: OneBot11CallConfig = field(default_factory=OneBot11CallConfig)
+    file_uri_threshold: int | None = None
+
+
+@dataclass
+class OneBot11HttpConfig:
+    api: URL
+    """实现端 HTTP API 的地址."""
+    endpoint: str | None = None
+    """接收 HTTP POST 上报的路径, 挂载到 UvicornASGIService 上; 为 None 时只用于调用 API."""
+    access_token: str | None = None
+    secret: str | None = None
+    """上报的签名密钥, 用于校验 X-Signature."""
+    # 调用不经过上报的连接, 队列已满时可以放心地阻塞上报请求
+    ingestion: IngestionConfig = field(default_factory=IngestionConfig)
+    call: OneBot11CallConfig = field(default_factory=OneBot11CallConfig)
+    file_uri_threshold: int | None = None
+    pool: HttpClientConfig = field(default_factory=lambda: HttpClientConfig(limit_per_host=64))
 
 
 def _import_performs():
@@ -78,11 +110,13 @@ class OneBot11Protocol(BaseProtocol):
 
         avilla.launch_manager.add_component(self.service)
 
-    def configure(self, config: OneBot11ForwardConfig | OneBot11ReverseConfig):
+    def configure(self, config: OneBot11ForwardConfig | OneBot11ReverseConfig | OneBot11HttpConfig):
         if isinstance(config, OneBot11ForwardConfig):
             self.service.connections.append(OneBot11WsClientNetworking(self, config))
         elif isinstance(config, OneBot11ReverseConfig):
             self.service.connections.append(OneBot11WsServerNetworking(self, config))
+        elif isinstance(config, OneBot11HttpConfig):
+            self.service.connections.append(OneBot11HttpNetworking(self, config))
         else:
             raise TypeError("Invalid config type")
         return self
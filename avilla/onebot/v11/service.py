@@ -4,6 +4,7 @@ from typing import TYPE_CHECKING
 
 from launart import Launart, Service, any_completed
 
+from avilla.onebot.v11.net.http import OneBot11HttpNetworking
 from avilla.onebot.v11.net.ws_client import OneBot11WsClientNetworking
 from avilla.onebot.v11.net.ws_server import OneBot11WsServerNetworking
 
@@ -16,7 +17,7 @@ class OneBot11Service(Service):
     required: set[str] = set()
     stages: set[str] = {"preparing", "blocking", "cleanup"}
 
-    connections: list[OneBot11WsClientNetworking | OneBot11WsServerNetworking]
+    connections: list[OneBot11WsClientNetworking | OneBot11WsServerNetworking | OneBot11HttpNetworking]
     protocol: OneBot11Protocol
 
     def __init__(self, protocol: OneBot11Protocol):
@@ -20,7 +20,8 @@ def file_parse(raw: dict, url: str, parent: FileData | None = None):
             raw["download_times"],
             url,
         ),
-        busid=raw["busid"]
+        busid=raw["busid"],
+        size=raw.get("file_size"),
     )
 
 
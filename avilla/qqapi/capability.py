@@ -1,6 +1,6 @@
 from __future__ import annotations
 
-from typing import Any, Literal
+from typing import Any, Awaitable, Literal
 
 from graia.amnesia.message import Element, MessageChain
 
@@ -11,6 +11,7 @@ from avilla.core.selector import Selector
 from avilla.standard.core.application.event import AvillaLifecycleEvent
 from graia.ryanvk import Fn, PredicateOverload, SimpleOverload, TypeOverload
 
+from .audit import MessageAudited, audit_result
 from .utils import handle_text
 
 
@@ -20,11 +21,11 @@ class QQAPICapability((m := ApplicationCollector())._):
         ...
 
     @Fn.complex({PredicateOverload(lambda _, raw: raw["type"]): ["raw_element"]})
-    async def deserialize_element(self, raw_element: dict) -> Element:
+    def deserialize_element(self, raw_element: dict) -> Element | Awaitable[Element]:
         ...
 
     @Fn.complex({TypeOverload(): ["element"]})
-    async def serialize_element(self, element: Any) -> str | tuple[str, Any]:
+    def serialize_element(self, element: Any) -> str | tuple[str, Any] | Awaitable[str | tuple[str, Any]]:
         ...
 
     @Fn.complex({TargetOverload(): ["target"]})
@@ -45,32 +46,28 @@ class QQAPICapability((m := ApplicationCollector())._):
         ...
 
     async def deserialize(self, event: dict):
-        elements = []
+        raw_elements = []
 
         if message_reference := event.get("message_reference"):
-            elements.append(await self.deserialize_element({"type": "message_reference", **message_reference}))
+            raw_elements.append({"type": "message_reference", **message_reference})
         if event.get("mention_everyone", False):
-            elements.append(await self.deserialize_element({"type": "mention_everyone"}))
+            raw_elements.append({"type": "mention_everyone"})
         if "content" in event:
-            for i in handle_text(event["content"]):
-                elements.append(await self.deserialize_element(i))
+            raw_elements.extend(handle_text(event["content"]))
         if attachments := event.get("attachments"):
-            for i in attachments:
-                elements.append(await self.deserialize_element({"type": "attachment", **i}))
+            raw_elements.extend({"type": "attachment", **i} for i in attachments)
         if embeds := event.get("embeds"):
-            for i in embeds:
-                elements.append(await self.deserialize_element({"type": "embed", **i}))
+            raw_elements.extend({"type": "embed", **i} for i in embeds)
         if ark := event.get("ark"):
-            elements.append(await self.deserialize_element({"type": "ark", **ark}))
+            raw_elements.append({"type": "ark", **ark})
 
-        return MessageChain(elements)
+        return MessageChain(await self.staff.call_fn_many(QQAPICapability.deserialize_element, raw_elements))
 
     async def serialize(self, message: MessageChain):
         res = {}
         content = ""
 
-        for element in message:
-            elem = await self.serialize_element(element)
+        for elem in await self.staff.call_fn_many(QQAPICapability.serialize_element, message):
             if isinstance(elem, str):
                 content += elem
             else:
@@ -80,7 +77,18 @@ class QQAPICapability((m := ApplicationCollector())._):
         return res
 
     async def handle_event(self, etype: str, event: dict):
+        metrics = self.avilla.metrics
+        metrics.count_event("qqapi", etype, "received")
+
+        if self.avilla.event_subscriptions.skippable(self.staff, QQAPICapability.event_callback, etype, event):
+            metrics.count_event("qqapi", etype, "skipped")
+            return
+
         maybe_event = await self.event_callback(etype, event)
+        metrics.count_parsed("qqapi", etype, maybe_event)
 
         if maybe_event is not None:
+            if isinstance(maybe_event, MessageAudited):
+                audit_result.add_result(maybe_event)
+            self.avilla.event_record(maybe_event)
             self.avilla.broadcast.postEvent(maybe_event)
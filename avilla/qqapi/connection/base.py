@@ -2,17 +2,16 @@ from __future__ import annotations
 
 import asyncio
 from contextlib import suppress
-from datetime import datetime
 from typing import TYPE_CHECKING, AsyncIterator, Literal
 
 from loguru import logger
 from typing_extensions import Self
 
+from avilla.core.ingestion import EventIngestion
 from avilla.core.ryanvk.staff import Staff
-from avilla.qqapi.audit import MessageAudited, audit_result
 from avilla.qqapi.capability import QQAPICapability
 
-from .util import Opcode, Payload
+from .util import Opcode, Payload, ShardState
 
 if TYPE_CHECKING:
     from avilla.qqapi.protocol import QQAPIProtocol
@@ -23,24 +22,20 @@ CallMethod = Literal["get", "post", "fetch", "update", "multipart", "put", "dele
 class QQAPINetworking:
     protocol: QQAPIProtocol
     response_waiters: dict[str, asyncio.Future]
-    close_signal: asyncio.Event
+    shards: dict[tuple[int, int], ShardState]
+    ingestion: EventIngestion[tuple[Self, Payload]]
 
     account_id: str
     self_info: dict
-    sequence: int | None
-    session_id: str | None
-    _access_token: str | None
-    _expires_in: datetime | None
+
+    _staff: Staff | None = None
 
     def __init__(self, protocol: QQAPIProtocol):
         super().__init__()
         self.protocol = protocol
         self.response_waiters = {}
-        self.close_signal = asyncio.Event()
-        self.session_id = None
-        self.sequence = None
-        self._access_token = None
-        self._expires_in = None
+        self.shards = {}
+        self.ingestion = EventIngestion(self.event_parse_task)
 
     def get_staff_components(self):
         return {"connection": self, "protocol": self.protocol, "avilla": self.protocol.avilla}
@@ -49,8 +44,10 @@ class QQAPINetworking:
         return [self.protocol.artifacts, self.protocol.avilla.global_artifacts]
 
     @property
-    def staff(self):
-        return Staff(self.get_staff_artifacts(), self.get_staff_components())
+    def staff(self) -> Staff:
+        if self._staff is None:
+            self._staff = Staff(self.get_staff_artifacts(), self.get_staff_components())
+        return self._staff
 
     def message_receive(self, shard: tuple[int, int]) -> AsyncIterator[tuple[Self, dict]]:
         ...
@@ -65,33 +62,53 @@ class QQAPINetworking:
     async def send(self, payload: dict, shard: tuple[int, int]) -> None:
         ...
 
+    @staticmethod
+    def ingestion_scene(payload: Payload):
+        data = payload.data or {}
+        for key in ("group_openid", "channel_id", "guild_id"):
+            if key in data:
+                return key, data[key]
+        if "author" in data and "id" in data["author"]:
+            return "author", data["author"]["id"]
+
+    async def event_parse_task(self, item: tuple[Self, Payload]):
+        connection, payload = item
+        event_type = payload.type
+        if not event_type:
+            raise ValueError("event type is None")
+        with suppress(NotImplementedError):
+            await QQAPICapability(connection.staff).handle_event(event_type.lower(), payload.data)
+            return
+        logger.warning(f"received unsupported event {event_type.lower()}: {payload.data}")
+
     async def message_handle(self, shard: tuple[int, int]):
+        # 多个 shard 共用同一个 ingestion, worker 在首次入队时启动, 于 cleanup 阶段关闭
+        state = self.shards[shard]
         async for connection, data in self.message_receive(shard):
             if data["op"] != Opcode.DISPATCH:
                 logger.debug(f"received other payload: {data}")
                 continue
             payload = Payload(**data)
-            connection.sequence = payload.sequence  # type: ignore
-
-            async def event_parse_task(_data: Payload):
-                event_type = _data.type
-                if not event_type:
-                    raise ValueError("event type is None")
-                with suppress(NotImplementedError):
-                    event = await QQAPICapability(connection.staff).event_callback(event_type.lower(), _data.data)
-                    if event is not None:
-                        if isinstance(event, MessageAudited):
-                            audit_result.add_result(event)
-                        await self.protocol.post_event(event)  # type: ignore
-                    return
-                logger.warning(f"received unsupported event {event_type.lower()}: {_data.data}")
-                return
-
-            asyncio.create_task(event_parse_task(payload))
-
-    async def connection_closed(self):
-        self.session_id = None
-        self.close_signal.set()
+            if payload.sequence is not None:
+                # resume 后服务端补发的事件可能与已收到的重叠
+                if state.sequence is not None and payload.sequence <= state.sequence:
+                    continue
+                state.sequence = payload.sequence
+            if payload.type == "RESUMED":
+                logger.info(f"shard {shard} resumed at sequence {state.sequence}")
+                continue
+            state.enqueuing = True
+            try:
+                await self.ingestion.put(
+                    (connection, payload),
+                    scene=self.ingestion_scene(payload),
+                    low_priority="MESSAGE" not in (payload.type or ""),
+                )
+            finally:
+                state.enqueuing = False
+
+    async def connection_closed(self, shard: tuple[int, int]):
+        self.shards[shard].close_signal.set()
 
     async def call_http(self, method: CallMethod, action: str, params: dict | None = None) -> dict:
         ...
@@ -1,10 +1,13 @@
 from __future__ import annotations
 
-from dataclasses import dataclass
+import asyncio
+import time
+from dataclasses import dataclass, field
 from enum import Enum
-from typing import Literal
+from typing import Awaitable, Callable, Literal
 
 from aiohttp import ClientResponse
+from loguru import logger
 
 from avilla.qqapi.exception import (
     ActionFailed,
@@ -39,6 +42,48 @@ async def validate_response(resp: ClientResponse):
 
 CallMethod = Literal["get", "post", "fetch", "update", "multipart"]
 
+# 其后一段为 ID 的路径段; 由 ID 替换为占位符后的路径作为限频的路由
+_ID_SEGMENTS = {
+    "channels",
+    "groups",
+    "users",
+    "dms",
+    "guilds",
+    "members",
+    "messages",
+    "roles",
+    "reactions",
+    "pins",
+    "schedules",
+    "announces",
+    "files",
+}
+
+
+def rate_limit_key(method: str, action: str) -> tuple[str, str | None]:
+    """返回 (路由, 目标); 目标为路径中的第一个 ID, 即子频道、群、用户或频道."""
+    segments = action.strip("/").split("/")
+    target = None
+    for index in range(1, len(segments)):
+        if segments[index - 1] in _ID_SEGMENTS and not segments[index].startswith("@"):
+            if target is None:
+                target = segments[index]
+            segments[index] = "{}"
+    return f"{method} {'/'.join(segments)}", target
+
+
+def retry_after(exc: Exception) -> float | None:
+    """HTTP 429 时返回服务端要求的等待秒数, 未给出时为 1 秒; 不是限频时返回 None"""
+    if not isinstance(exc, RateLimitException):
+        return None
+    for key in ("Retry-After", "X-RateLimit-Retry-After"):
+        if (value := exc.headers.get(key)) is not None:
+            try:
+                return max(float(value), 0.0)
+            except ValueError:
+                pass
+    return 1.0
+
 
 class Opcode(int, Enum):
     DISPATCH = 0
@@ -74,3 +119,98 @@ class Payload:
     @property
     def type(self) -> str | None:
         return self.t
+
+
+# https://bot.q.qq.com/wiki/develop/api/gateway/error/error.html
+# 以这些代码关闭的连接无法继续 resume, 需要重新 identify
+INVALID_SESSION_CLOSE_CODES = {4006, 4007, *range(4900, 4914)}
+
+
+@dataclass
+class ShardState:
+    """单个 shard 的会话状态; 断线后据此 resume, 由服务端补发 sequence 之后的事件."""
+
+    session_id: str | None = None
+    sequence: int | None = None
+    heartbeat_acked: bool = True
+    enqueuing: bool = False
+    """读取循环正等待事件入队; 此时 ACK 尚未被读出, 不能据此判断连接僵死."""
+    close_signal: asyncio.Event = field(default_factory=asyncio.Event)
+
+    @property
+    def resumable(self) -> bool:
+        return self.session_id is not None and self.sequence is not None
+
+    def invalidate(self):
+        self.session_id = None
+        self.sequence = None
+
+
+class AccessToken:
+    """群机器人的 access token.
+
+    在过期前于后台主动刷新, 并发的调用共享同一次进行中的刷新; 已知过期的 token 不会被交给调用方.
+    """
+
+    # 过期前 60 秒内获取才会得到新的 token, 旧 token 在此期间仍然有效
+    REFRESH_AHEAD = 50
+    # 为请求的传输耗时留出余量, 剩余有效期不足时视为已过期
+    MARGIN = 5
+
+    token: str | None
+    expires_at: float
+
+    def __init__(self, fetch: Callable[[], Awaitable[tuple[str, int]]]) -> None:
+        self._fetch = fetch
+        self.token = None
+        self.expires_at = 0.0
+        self._inflight: asyncio.Task[str] | None = None
+        self._refresher: asyncio.Task | None = None
+
+    @property
+    def valid(self) -> bool:
+        return self.token is not None and time.monotonic() < self.expires_at - self.MARGIN
+
+    async def get(self) -> str:
+        if self.valid:
+            return self.token  # type: ignore
+        return await self.refresh()
+
+    async def refresh(self) -> str:
+        if self._inflight is None:
+            self._inflight = asyncio.create_task(self._refresh())
+        # 取消某个调用方不应取消其他调用方共享的刷新
+        return await asyncio.shield(self._inflight)
+
+    def invalidate(self, token: str):
+        """服务端拒绝了 token 时调用; 只丢弃该 token, 以免覆盖其他调用方已刷新的 token"""
+        if self.token == token:
+            self.token = None
+
+    async def _refresh(self) -> str:
+        try:
+            token, expires_in = await self._fetch()
+            self.token = token
+            self.expires_at = time.monotonic() + expires_in
+            self._schedule(max(expires_in - self.REFRESH_AHEAD, self.MARGIN))
+            return token
+        finally:
+            self._inflight = None
+
+    def _schedule(self, delay: float):
+        if self._refresher is not None:
+            self._refresher.cancel()
+        self._refresher = asyncio.create_task(self._refresh_later(delay))
+
+    async def _refresh_later(self, delay: float):
+        await asyncio.sleep(delay)
+        try:
+            await self.refresh()
+        except Exception as e:
+            logger.warning(f"Failed to refresh access token in background: {e!r}, will retry")
+            self._schedule(self.MARGIN)
+
+    def close(self):
+        if self._refresher is not None:
+            self._refresher.cancel()
+            self._refresher = None
@@ -5,7 +5,6 @@ import json
 import sys
 from contextlib import suppress
 from dataclasses import asdict
-from datetime import datetime, timedelta, timezone
 from typing import TYPE_CHECKING, cast
 
 import aiohttp
@@ -15,6 +14,7 @@ from launart.utilles import any_completed
 from loguru import logger
 
 from avilla.core.account import AccountInfo
+from avilla.core.ratelimit import RateLimiter
 from avilla.core.selector import Selector
 from avilla.qqapi.account import QQAPIAccount
 from avilla.qqapi.const import PLATFORM
@@ -27,7 +27,16 @@ from avilla.standard.core.account import (
 )
 
 from .base import CallMethod, QQAPINetworking
-from .util import Opcode, Payload, validate_response
+from .util import (
+    INVALID_SESSION_CLOSE_CODES,
+    AccessToken,
+    Opcode,
+    Payload,
+    ShardState,
+    rate_limit_key,
+    retry_after,
+    validate_response,
+)
 
 if TYPE_CHECKING:
     from avilla.qqapi.protocol import QQAPIConfig, QQAPIProtocol
@@ -40,6 +49,8 @@ class QQAPIWsClientNetworking(QQAPINetworking, Service):
     config: QQAPIConfig
     connections: dict[tuple[int, int], aiohttp.ClientWebSocketResponse]
     session: aiohttp.ClientSession
+    access_token: AccessToken
+    rate_limiter: RateLimiter
 
     @property
     def id(self):
@@ -51,26 +62,27 @@ class QQAPIWsClientNetworking(QQAPINetworking, Service):
         if any([not config.id, not config.token, not config.secret]):
             raise ValueError("config is not complete")
         self.connections = {}
+        self.ingestion.config = config.ingestion
+        self.access_token = AccessToken(self._fetch_access_token)
+        self.rate_limiter = RateLimiter(config.rate_limit, name=f"qqapi#{config.id}")
+
+    async def _fetch_access_token(self) -> tuple[str, int]:
+        async with self.session.post(
+            self.config.auth_base,
+            json={
+                "appId": self.config.id,
+                "clientSecret": self.config.secret,
+            },
+        ) as resp:
+            if resp.status != 200 or not resp.content:
+                raise NetworkError(
+                    f"Get authorization failed with status code {resp.status}." " Please check your config."
+                )
+            data = await resp.json()
+        return cast(str, data["access_token"]), int(data["expires_in"])
 
     async def get_access_token(self) -> str:
-        if self._access_token is None or (
-            self._expires_in and datetime.now(timezone.utc) > self._expires_in - timedelta(seconds=30)
-        ):
-            async with self.session.post(
-                self.config.auth_base,
-                json={
-                    "appId": self.config.id,
-                    "clientSecret": self.config.secret,
-                },
-            ) as resp:
-                if resp.status != 200 or not resp.content:
-                    raise NetworkError(
-                        f"Get authorization failed with status code {resp.status}." " Please check your config."
-                    )
-                data = await resp.json()
-            self._access_token = cast(str, data["access_token"])
-            self._expires_in = datetime.now(timezone.utc) + timedelta(seconds=int(data["expires_in"]))
-        return self._access_token
+        return await self.access_token.get()
 
     async def _get_authorization_header(self) -> str:
         """获取当前 Bot 的鉴权信息"""
@@ -88,33 +100,38 @@ class QQAPIWsClientNetworking(QQAPINetworking, Service):
     async def message_receive(self, shard: tuple[int, int]):
         if (connection := self.connections.get(shard)) is None:
             raise RuntimeError("connection is not established")
+        state = self.shards[shard]
 
         async for msg in connection:
             # logger.debug(f"{msg=}")
 
             if msg.type in {aiohttp.WSMsgType.CLOSE, aiohttp.WSMsgType.ERROR, aiohttp.WSMsgType.CLOSED}:
-                self.close_signal.set()
                 break
             elif msg.type == aiohttp.WSMsgType.TEXT:
                 data: dict = json.loads(cast(str, msg.data))
                 if data["op"] == Opcode.RECONNECT:
-                    logger.warning("Received reconnect event from server, will reconnect in 5 seconds...")
+                    logger.warning("Received reconnect event from server, will resume")
                     break
                 if data["op"] == Opcode.INVALID_SESSION:
-                    self.session_id = None
-                    self.sequence = None
-                    logger.warning("Received invalid session event from server, will try to resume")
+                    if not data.get("d"):
+                        state.invalidate()
+                    logger.warning("Received invalid session event from server, will reconnect")
                     break
                 if data["op"] == Opcode.HEARTBEAT_ACK:
+                    state.heartbeat_acked = True
+                    continue
+                if data["op"] == Opcode.HEARTBEAT:
+                    with suppress(Exception):
+                        await self.send({"op": Opcode.HEARTBEAT, "d": state.sequence}, shard)
                     continue
                 yield self, data
-        else:
-            await self.connection_closed()
+        await self.connection_closed(shard)
 
-    async def connection_closed(self):
-        self.session_id = None
-        self.sequence = None
-        self.close_signal.set()
+    async def connection_closed(self, shard: tuple[int, int]):
+        connection = self.connections.get(shard)
+        if connection is not None and connection.close_code in INVALID_SESSION_CLOSE_CODES:
+            self.shards[shard].invalidate()
+        await super().connection_closed(shard)
 
     async def send(self, payload: dict, shard: tuple[int, int]):
         if (connection := self.connections.get(shard)) is None:
@@ -184,14 +201,15 @@ class QQAPIWsClientNetworking(QQAPINetworking, Service):
 
         raise ValueError(f"unknown method {method}")
 
-    async def call_http(self, method: CallMethod, action: str, params: dict | None = None) -> dict:
+    async def _authorized_call_http(self, method: CallMethod, action: str, params: dict | None = None) -> dict:
         headers = await self.get_authorization_header()
         try:
             return await self._call_http(method, action, headers, params)
         except UnauthorizedException as e:
             if not self.config.is_group_bot:
                 raise
-            self._access_token = None
+            # 仅丢弃被拒绝的 token; 其他调用方可能已经完成了刷新
+            self.access_token.invalidate(headers["Authorization"].removeprefix("QQBot "))
             try:
                 headers = await self.get_authorization_header()
             except Exception:
@@ -201,6 +219,14 @@ class QQAPIWsClientNetworking(QQAPINetworking, Service):
             except Exception as e1:
                 raise e1 from None
 
+    async def call_http(self, method: CallMethod, action: str, params: dict | None = None) -> dict:
+        route, target = rate_limit_key(method, action)
+        # 以路由而非带 ID 的路径作为标签, 避免指标数量随目标增长
+        with self.protocol.avilla.metrics.time_rpc("qqapi", route):
+            return await self.rate_limiter.run(
+                route, target, lambda: self._authorized_call_http(method, action, params), retry_after
+            )
+
     async def wait_for_available(self):
         await self.status.wait_for_available()
 
@@ -235,7 +261,9 @@ class QQAPIWsClientNetworking(QQAPINetworking, Service):
         """鉴权连接"""
         if not (connection := self.connections.get(shard)):
             raise RuntimeError("connection is not established")
-        if not self.session_id:
+        state = self.shards[shard]
+        resuming = state.resumable
+        if not resuming:
             payload = Payload(
                 op=Opcode.IDENTIFY,
                 d={
@@ -254,8 +282,8 @@ class QQAPIWsClientNetworking(QQAPINetworking, Service):
                 op=Opcode.RESUME,
                 d={
                     "token": await self._get_authorization_header(),
-                    "session_id": self.session_id,
-                    "seq": self.sequence,
+                    "session_id": state.session_id,
+                    "seq": state.sequence,
                 },
             )
 
@@ -265,7 +293,7 @@ class QQAPIWsClientNetworking(QQAPINetworking, Service):
             logger.error(f"Error while sending {payload.opcode.name.title()} event: {e}")
             return False
 
-        if not self.session_id:
+        if not resuming:
             # https://bot.q.qq.com/wiki/develop/api/gateway/reference.html#_2-%E9%89%B4%E6%9D%83%E8%BF%9E%E6%8E%A5
             # 鉴权成功之后，后台会下发一个 Ready Event
             payload = Payload(**await connection.receive_json())
@@ -275,8 +303,8 @@ class QQAPIWsClientNetworking(QQAPINetworking, Service):
             if not (payload.opcode == Opcode.DISPATCH and payload.type == "READY" and payload.data):
                 logger.error(f"Received unexpected payload: {payload}")
                 return False
-            self.sequence = payload.sequence
-            self.session_id = payload.data["session_id"]
+            state.sequence = payload.sequence
+            state.session_id = payload.data["session_id"]
             self.self_info = payload.data["user"]
             self.account_id = payload.data["user"]["id"]
             account_route = Selector().land("qq").account(self.account_id)
@@ -294,22 +322,34 @@ class QQAPIWsClientNetworking(QQAPINetworking, Service):
             account.connection = self
             self.protocol.avilla.broadcast.postEvent(AccountRegistered(self.protocol.avilla, account))
         else:
-            account = self.protocol.service.accounts[self.account_id]
+            # 服务端随后补发断线期间的事件, 并以 RESUMED 事件结束
+            account_route = Selector().land("qq").account(self.account_id)
+            account = cast(QQAPIAccount, self.protocol.avilla.accounts[account_route].account)
+            self.protocol.service.accounts[self.account_id] = account
             account.connection = self
         self.protocol.avilla.broadcast.postEvent(AccountAvailable(self.protocol.avilla, account))
         return True
 
     async def _heartbeat(self, heartbeat_interval: int, shard: tuple[int, int]):
-        """心跳"""
+        """心跳; 上一次心跳未收到 ACK 时视为僵死连接, 关闭后 resume"""
+        state = self.shards[shard]
         while True:
-            if self.session_id:
-                with suppress(Exception):
-                    await self.send({"op": 1, "d": self.sequence}, shard=shard)
+            if not state.heartbeat_acked and not state.enqueuing:
+                logger.warning(f"{self} shard {shard} missed heartbeat ACK, reconnecting...")
+                if (connection := self.connections.get(shard)) is not None:
+                    await connection.close(code=4000)
+                state.close_signal.set()
+                return
+            state.heartbeat_acked = False
+            with suppress(Exception):
+                await self.send({"op": Opcode.HEARTBEAT, "d": state.sequence}, shard=shard)
             await asyncio.sleep(heartbeat_interval / 1000)
 
     async def connection_daemon(
         self, manager: Launart, session: aiohttp.ClientSession, url: str, shard: tuple[int, int]
     ):
+        state = self.shards.setdefault(shard, ShardState())
+        failures = 0
         while not manager.status.exiting:
             try:
                 async with session.ws_connect(url, timeout=30) as conn:
@@ -317,15 +357,14 @@ class QQAPIWsClientNetworking(QQAPINetworking, Service):
                     logger.info(f"{self.id} Websocket client connected")
                     heartbeat_interval = await self._hello(shard)
                     if not heartbeat_interval:
-                        await asyncio.sleep(3)
-                        continue
-                    result = await self._authenticate(shard)
-                    if not result:
-                        await asyncio.sleep(3)
-                        continue
+                        raise NetworkError("server hello not received")
+                    if not await self._authenticate(shard):
+                        raise NetworkError("authentication failed")
+                    failures = 0
                     account_route = Selector().land("qq").account(self.account_id)
-                    self.close_signal.clear()
-                    close_task = asyncio.create_task(self.close_signal.wait())
+                    state.close_signal.clear()
+                    state.heartbeat_acked = True
+                    close_task = asyncio.create_task(state.close_signal.wait())
                     receiver_task = asyncio.create_task(self.message_handle(shard))
                     sigexit_task = asyncio.create_task(manager.status.wait_for_sigexit())
                     heartbeat_task = asyncio.create_task(self._heartbeat(heartbeat_interval, shard))
@@ -335,12 +374,11 @@ class QQAPIWsClientNetworking(QQAPINetworking, Service):
                         receiver_task,
                         heartbeat_task,
                     )
+                    for task in pending:
+                        task.cancel()
                     if sigexit_task in done:
                         logger.info(f"{self} Websocket client exiting...")
                         await conn.close()
-                        self.close_signal.set()
-                        receiver_task.cancel()
-                        heartbeat_task.cancel()
                         with suppress(KeyError):
                             del self.connections[shard]
                             await self.protocol.avilla.broadcast.postEvent(
@@ -351,11 +389,8 @@ class QQAPIWsClientNetworking(QQAPINetworking, Service):
                             del self.protocol.service.accounts[self.account_id]
                             del self.protocol.avilla.accounts[account_route]
                         return
-                    if close_task in done:
-                        receiver_task.cancel()
-                        heartbeat_task.cancel()
-                        logger.warning(f"{self} Connection closed by server, will reconnect in 5 seconds...")
-
+                    del self.connections[shard]
+                    if not self.alive:
                         with suppress(KeyError):
                             await self.protocol.avilla.broadcast.postEvent(
                                 AccountUnavailable(
@@ -364,13 +399,18 @@ class QQAPIWsClientNetworking(QQAPINetworking, Service):
                             )
                             del self.protocol.service.accounts[self.account_id]
                             # del self.protocol.avilla.accounts[account_route]
-                        await asyncio.sleep(5)
-                        logger.info(f"{self} Reconnecting...")
-                        continue
             except Exception as e:
-                logger.error(f"{self} Error while connecting: {e}")
-                await asyncio.sleep(5)
-                logger.info(f"{self} Reconnecting...")
+                logger.error(f"{self} Error while connecting: {e!r}")
+                failures += 1
+                self.connections.pop(shard, None)
+            if manager.status.exiting:
+                return
+            # 会话仍可 resume 时立即重连; 否则需重新 identify, 受 session_start_limit 限制, 等待后再连
+            if failures or not state.resumable:
+                delay = min(5 * 2 ** max(failures - 1, 0), 60)
+                logger.warning(f"{self} Connection closed, will reconnect in {delay} seconds...")
+                await asyncio.sleep(delay)
+            logger.info(f"{self} Reconnecting{' (resume)' if state.resumable else ''}...")
 
     async def launch(self, manager: Launart):
         async with self.stage("preparing"):
@@ -399,8 +439,10 @@ class QQAPIWsClientNetworking(QQAPINetworking, Service):
             await any_completed(*tasks)
 
         async with self.stage("cleanup"):
+            self.access_token.close()
             await self.session.close()
             for task in tasks:
                 task.cancel()
             await asyncio.wait(tasks, return_when=asyncio.ALL_COMPLETED)
+            await self.ingestion.close()
             self.connections.clear()
@@ -1,6 +1,5 @@
 from __future__ import annotations
 
-from base64 import b64encode
 from datetime import datetime, timedelta, timezone
 from typing import TYPE_CHECKING, Any
 
@@ -12,6 +11,8 @@ from avilla.core import Context, CoreCapability, Message
 from avilla.core.exceptions import ActionFailed
 from avilla.core.ryanvk.collector.account import AccountCollector
 from avilla.core.selector import Selector
+from avilla.core.utilles.fileio import b64encode
+from avilla.core.utilles.media_cache import content_key
 from avilla.qqapi.capability import QQAPICapability
 from avilla.qqapi.exception import AuditException
 from avilla.qqapi.utils import form_data, unescape
@@ -34,6 +35,48 @@ class QQAPIMessageActionPerform((m := AccountCollector["QQAPIProtocol", "QQAPIAc
 
     context: OptionalAccess[Context] = OptionalAccess()
 
+    async def _post_file(
+        self,
+        target: Selector,
+        path: str,
+        file_type: int,
+        url: str | None,
+        srv_send_msg: bool,
+        file_data: str | bytes | None,
+    ) -> dict:
+        media_cache = self.protocol.avilla.media_cache
+        content = file_data if file_data is not None else url
+        key = await content_key(content) if content is not None else None
+        if isinstance(file_data, bytes):
+            data: bytes = file_data
+            file_data = await media_cache.get_or_create("base64", f"sha256:{key}", lambda: b64encode(data))
+
+        async def upload():
+            result = await self.account.connection.call_http(
+                "post",
+                path,
+                {
+                    "file_type": file_type,
+                    "url": url,
+                    "srv_send_msg": srv_send_msg,
+                    "file_data": file_data,
+                },
+            )
+            if result is None:
+                raise ActionFailed(f"Failed to post file to {target.last_value}")
+            return result
+
+        if srv_send_msg or key is None:
+            # 直接发送时每次都是一条新消息, 不能复用
+            return await upload()
+        # file_info 只能在上传时的群或私聊中使用, 因此以场景区分
+        return await media_cache.get_or_create(
+            "qqapi/file_info",
+            (self.account.route, target, file_type, key),
+            upload,
+            ttl=lambda result: result.get("ttl") or None,
+        )
+
     @m.entity(QQAPICapability.post_file, target="land.group")
     async def post_group_file(
         self,
@@ -43,21 +86,9 @@ class QQAPIMessageActionPerform((m := AccountCollector["QQAPIProtocol", "QQAPIAc
         srv_send_msg: bool = True,
         file_data: str | bytes | None = None,
     ) -> dict:
-        if isinstance(file_data, bytes):
-            file_data = b64encode(file_data).decode()
-        result = await self.account.connection.call_http(
-            "post",
-            f"v2/groups/{target.pattern['group']}/files",
-            {
-                "file_type": file_type,
-                "url": url,
-                "srv_send_msg": srv_send_msg,
-                "file_data": file_data,
-            },
+        return await self._post_file(
+            target, f"v2/groups/{target.pattern['group']}/files", file_type, url, srv_send_msg, file_data
         )
-        if result is None:
-            raise ActionFailed(f"Failed to post file to {target.pattern['group']}")
-        return result
 
     @m.entity(QQAPICapability.post_file, target="land.friend")
     async def post_friend_file(
@@ -68,21 +99,9 @@ class QQAPIMessageActionPerform((m := AccountCollector["QQAPIProtocol", "QQAPIAc
         srv_send_msg: bool = True,
         file_data: str | bytes | None = None,
     ) -> dict:
-        if isinstance(file_data, bytes):
-            file_data = b64encode(file_data).decode()
-        result = await self.account.connection.call_http(
-            "post",
-            f"v2/users/{target.pattern['friend']}/files",
-            {
-                "file_type": file_type,
-                "url": url,
-                "srv_send_msg": srv_send_msg,
-                "file_data": file_data,
-            },
+        return await self._post_file(
+            target, f"v2/users/{target.pattern['friend']}/files", file_type, url, srv_send_msg, file_data
         )
-        if result is None:
-            raise ActionFailed(f"Failed to post file to {target.pattern['friend']}")
-        return result
 
     @staticmethod
     def _extract_qq_media(msg: dict) -> dict[str, Any]:
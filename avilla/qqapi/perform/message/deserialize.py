@@ -36,15 +36,15 @@ class QQAPIMessageDeserializePerform((m := ApplicationCollector())._):
     context: OptionalAccess[Context] = OptionalAccess()
 
     @m.entity(QQAPICapability.deserialize_element, raw_element="text")
-    async def text(self, raw_element: dict) -> Text:
+    def text(self, raw_element: dict) -> Text:
         return Text(raw_element["text"])
 
     @m.entity(QQAPICapability.deserialize_element, raw_element="emoji")
-    async def emoji(self, raw_element: dict) -> Face:
+    def emoji(self, raw_element: dict) -> Face:
         return Face(raw_element["id"])
 
     @m.entity(QQAPICapability.deserialize_element, raw_element="attachment")
-    async def attachment(self, raw_element: dict):
+    def attachment(self, raw_element: dict):
         if "content_type" not in raw_element:
             resource = QQAPIImageResource(Selector().land("qqguild").picture(url := raw_element["url"]), "image", url)
             return Picture(resource)
@@ -94,13 +94,13 @@ class QQAPIMessageDeserializePerform((m := ApplicationCollector())._):
         return Picture(resource)
 
     @m.entity(QQAPICapability.deserialize_element, raw_element="mention_user")
-    async def mention(self, raw_element: dict) -> Notice:
+    def mention(self, raw_element: dict) -> Notice:
         if self.context:
             return Notice(self.context.scene.member(raw_element["user_id"]))
         return Notice(Selector().land("qqguild").member(raw_element["user_id"]))
 
     @m.entity(QQAPICapability.deserialize_element, raw_element="mention_channel")
-    async def mention_channel(self, raw_element: dict) -> Notice:
+    def mention_channel(self, raw_element: dict) -> Notice:
         if self.context:
             return Notice(
                 Selector().land("qqguild").guild(self.context.scene["guild"]).channel(raw_element["channel_id"])
@@ -108,17 +108,17 @@ class QQAPIMessageDeserializePerform((m := ApplicationCollector())._):
         return Notice(Selector().land("qqguild").channel(raw_element["channel_id"]))
 
     @m.entity(QQAPICapability.deserialize_element, raw_element="mention_everyone")
-    async def mention_everyone(self, raw_element: dict) -> NoticeAll:
+    def mention_everyone(self, raw_element: dict) -> NoticeAll:
         return NoticeAll()
 
     @m.entity(QQAPICapability.deserialize_element, raw_element="message_reference")
-    async def message_reference(self, raw_element: dict) -> Reference:
+    def message_reference(self, raw_element: dict) -> Reference:
         if self.context:
             return Reference(self.context.scene.message(raw_element["message_id"]))
         return Reference(Selector().land("qqguild").message(raw_element["message_id"]))
 
     @m.entity(QQAPICapability.deserialize_element, raw_element="embed")
-    async def embed(self, raw_element: dict) -> Embed:
+    def embed(self, raw_element: dict) -> Embed:
         return Embed(
             raw_element["title"],
             raw_element.get("prompt"),
@@ -127,7 +127,7 @@ class QQAPIMessageDeserializePerform((m := ApplicationCollector())._):
         )
 
     @m.entity(QQAPICapability.deserialize_element, raw_element="ark")
-    async def ark(self, raw_element: dict) -> Ark:
+    def ark(self, raw_element: dict) -> Ark:
         kvs: list[ArkKv] = []
         for i in raw_element.get("kv", []):
             if i.get("value"):
@@ -6,6 +6,7 @@ from typing import TYPE_CHECKING
 from avilla.core.elements import Audio, Face, File, Notice, NoticeAll, Picture, Text, Video
 from avilla.core.resource import LocalFileResource, RawResource, UrlResource
 from avilla.core.ryanvk.collector.account import AccountCollector
+from avilla.core.utilles.fileio import read_file
 from avilla.qqapi.capability import QQAPICapability
 from avilla.qqapi.element import Ark, Embed, Keyboard, Markdown, Reference
 from avilla.qqapi.resource import (
@@ -28,21 +29,21 @@ class QQAPIMessageSerializePerform((m := AccountCollector["QQAPIProtocol", "QQAP
     # LINK: https://github.com/microsoft/pyright/issues/5409
 
     @m.entity(QQAPICapability.serialize_element, element=Text)
-    async def text(self, element: Text):
+    def text(self, element: Text):
         return escape(element.text)
 
     @m.entity(QQAPICapability.serialize_element, element=Face)
-    async def face(self, element: Face):
+    def face(self, element: Face):
         return f"<emoji:{element.id}>"
 
     @m.entity(QQAPICapability.serialize_element, element=Notice)
-    async def notice(self, element: Notice):
+    def notice(self, element: Notice):
         if element.target.last_key == "channel":
             return f"<#{element.target['channel']}>"
         return f"<@{element.target['member']}>"
 
     @m.entity(QQAPICapability.serialize_element, element=NoticeAll)
-    async def notice_all(self, element: NoticeAll):
+    def notice_all(self, element: NoticeAll):
         return "@everyone"
 
     @m.entity(QQAPICapability.serialize_element, element=Picture)
@@ -50,7 +51,7 @@ class QQAPIMessageSerializePerform((m := AccountCollector["QQAPIProtocol", "QQAP
         if isinstance(element.resource, (QQAPIImageResource, UrlResource)):
             return "media", ("image", element.resource.url)
         if isinstance(element.resource, LocalFileResource):
-            return "file_image", element.resource.file.read_bytes()
+            return "file_image", await read_file(element.resource.file)
         if isinstance(element.resource, RawResource):
             return "file_image", element.resource.data
         return "file_image", await self.account.staff.fetch_resource(element.resource)
@@ -60,7 +61,7 @@ class QQAPIMessageSerializePerform((m := AccountCollector["QQAPIProtocol", "QQAP
         if isinstance(element.resource, (QQAPIAudioResource, UrlResource)):
             return "media", ("audio", element.resource.url)
         if isinstance(element.resource, LocalFileResource):
-            return "file_audio", element.resource.file.read_bytes()
+            return "file_audio", await read_file(element.resource.file)
         if isinstance(element.resource, RawResource):
             return "file_audio", element.resource.data
         return "file_audio", await self.account.staff.fetch_resource(element.resource)
@@ -70,7 +71,7 @@ class QQAPIMessageSerializePerform((m := AccountCollector["QQAPIProtocol", "QQAP
         if isinstance(element.resource, (QQAPIVideoResource, UrlResource)):
             return "media", ("video", element.resource.url)
         if isinstance(element.resource, LocalFileResource):
-            return "file_video", element.resource.file.read_bytes()
+            return "file_video", await read_file(element.resource.file)
         if isinstance(element.resource, RawResource):
             return "file_video", element.resource.data
         return "file_video", await self.account.staff.fetch_resource(element.resource)
@@ -80,20 +81,20 @@ class QQAPIMessageSerializePerform((m := AccountCollector["QQAPIProtocol", "QQAP
         if isinstance(element.resource, (QQAPIFileResource, UrlResource)):
             return "media", ("file", element.resource.url)
         if isinstance(element.resource, LocalFileResource):
-            return "file_file", element.resource.file.read_bytes()
+            return "file_file", await read_file(element.resource.file)
         if isinstance(element.resource, RawResource):
             return "file_file", element.resource.data
         return "file_file", await self.account.staff.fetch_resource(element.resource)
 
     @m.entity(QQAPICapability.serialize_element, element=Reference)
-    async def reference(self, element: Reference):
+    def reference(self, element: Reference):
         return "message_reference", {
             "message_id": element.message["message"],
             "ignore_get_message_error": element.ignore_get_message_error,
         }
 
     @m.entity(QQAPICapability.serialize_element, element=Embed)
-    async def embed(self, element: Embed):
+    def embed(self, element: Embed):
         res = {
             "title": element.title,
             "prompt": element.prompt,
@@ -103,7 +104,7 @@ class QQAPIMessageSerializePerform((m := AccountCollector["QQAPIProtocol", "QQAP
         return "embed", {k: v for k, v in res.items() if v}
 
     @m.entity(QQAPICapability.serialize_element, element=Ark)
-    async def ark(self, element: Ark):
+    def ark(self, element: Ark):
         return "ark", {
             "template_id": element.template_id,
             "kv": [
@@ -122,7 +123,7 @@ class QQAPIMessageSerializePerform((m := AccountCollector["QQAPIProtocol", "QQAP
         }
 
     @m.entity(QQAPICapability.serialize_element, element=Markdown)
-    async def markdown(self, element: Markdown):
+    def markdown(self, element: Markdown):
         if element.params:
             param = [{"key": k, "values": v} for k, v in element.params.items()]
         else:
@@ -134,7 +135,7 @@ class QQAPIMessageSerializePerform((m := AccountCollector["QQAPIProtocol", "QQAP
         }
 
     @m.entity(QQAPICapability.serialize_element, element=Keyboard)
-    async def keyboard(self, element: Keyboard):
+    def keyboard(self, element: Keyboard):
         content = {"rows": []}
         for row in element.content or []:
             buttons = {"buttons": []}
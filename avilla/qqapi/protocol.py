@@ -6,7 +6,9 @@ from loguru import logger
 from yarl import URL
 
 from avilla.core.application import Avilla
+from avilla.core.ingestion import IngestionConfig
 from avilla.core.protocol import BaseProtocol, ProtocolConfig
+from avilla.core.ratelimit import RateLimitConfig
 from graia.ryanvk import merge, ref
 
 from .connection.ws_client import QQAPIWsClientNetworking
@@ -70,6 +72,8 @@ class QQAPIConfig(ProtocolConfig):
     api_base: URL = URL("https://api.sgroup.qq.com/")
     sandbox_api_base: URL = URL("https://sandbox.api.sgroup.qq.com")
     auth_base: URL = URL("https://bots.qq.com/app/getAppAccessToken")
+    ingestion: IngestionConfig = field(default_factory=IngestionConfig)
+    rate_limit: RateLimitConfig = field(default_factory=RateLimitConfig)
 
     def get_api_base(self) -> URL:
         return URL(self.sandbox_api_base) if self.is_sandbox else URL(self.api_base)
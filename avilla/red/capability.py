@@ -1,6 +1,6 @@
 from __future__ import annotations
 
-from typing import Any
+from typing import Any, Awaitable
 
 from graia.amnesia.message import Element, MessageChain
 
@@ -19,11 +19,11 @@ class RedCapability((m := ApplicationCollector())._):
         ...
 
     @Fn.complex({PredicateOverload(lambda _, raw: raw["type"]): ["element"]})
-    async def deserialize_element(self, element: dict) -> Element:  # type: ignore
+    def deserialize_element(self, element: dict) -> Element | Awaitable[Element]:  # type: ignore
         ...
 
     @Fn.complex({TypeOverload(): ["element"]})
-    async def serialize_element(self, element: Any) -> dict:  # type: ignore
+    def serialize_element(self, element: Any) -> dict | Awaitable[dict]:  # type: ignore
         ...
 
     @Fn.complex({TypeOverload(): ["element"]})
@@ -35,23 +35,21 @@ class RedCapability((m := ApplicationCollector())._):
         ...
 
     async def deserialize(self, elements: list[dict]):
-        _elements = []
-
-        for raw_element in elements:
-            _elements.append(await self.deserialize_element(raw_element))
-
-        return MessageChain(_elements)
+        return MessageChain(await self.staff.call_fn_many(RedCapability.deserialize_element, elements))
 
     async def serialize(self, message: MessageChain):
-        chain = []
+        return await self.staff.call_fn_many(RedCapability.serialize_element, message)
 
-        for element in message:
-            chain.append(await self.serialize_element(element))
+    async def handle_event(self, event_type: str, payload: dict):
+        metrics = self.avilla.metrics
+        metrics.count_event("red", event_type, "received")
 
-        return chain
+        if self.avilla.event_subscriptions.skippable(self.staff, RedCapability.event_callback, event_type, payload):
+            metrics.count_event("red", event_type, "skipped")
+            return
 
-    async def handle_event(self, event_type: str, payload: dict):
         maybe_event = await self.event_callback(event_type, payload)
+        metrics.count_parsed("red", event_type, maybe_event)
 
         if maybe_event is not None:
             self.avilla.event_record(maybe_event)
@@ -7,6 +7,7 @@ from typing import TYPE_CHECKING, AsyncIterator, Literal, overload
 from loguru import logger
 from typing_extensions import Self
 
+from avilla.core.ingestion import EventIngestion
 from avilla.core.ryanvk.staff import Staff
 from avilla.red.account import RedAccount
 from avilla.red.capability import RedCapability
@@ -20,12 +21,16 @@ class RedNetworking:
     protocol: RedProtocol
     account: RedAccount | None
     close_signal: asyncio.Event
+    ingestion: EventIngestion[tuple[RedNetworking, str, dict]]
+
+    _staff: Staff | None = None
 
     def __init__(self, protocol: RedProtocol):
         super().__init__()
         self.protocol = protocol
         self.account = None
         self.close_signal = asyncio.Event()
+        self.ingestion = EventIngestion(self.event_parse_task)
 
     def get_staff_components(self):
         return {"connection": self, "protocol": self.protocol, "avilla": self.protocol.avilla}
@@ -34,8 +39,10 @@ class RedNetworking:
         return [self.protocol.artifacts, self.protocol.avilla.global_artifacts]
 
     @property
-    def staff(self):
-        return Staff(self.get_staff_artifacts(), self.get_staff_components())
+    def staff(self) -> Staff:
+        if self._staff is None:
+            self._staff = Staff(self.get_staff_artifacts(), self.get_staff_components())
+        return self._staff
 
     def message_receive(self) -> AsyncIterator[tuple[Self, dict]]:
         ...
@@ -50,62 +57,66 @@ class RedNetworking:
     async def send(self, payload: dict) -> None:
         ...
 
+    async def event_parse_task(self, item: tuple[RedNetworking, str, dict]):
+        connection, event_type, payload = item
+        with suppress(NotImplementedError):
+            await RedCapability(connection.staff).handle_event(event_type, payload)
+            return
+        logger.warning(f"received unsupported event {event_type}: {payload}")
+
     async def message_handle(self):
-        async for connection, data in self.message_receive():
-            event_type = data["type"]
-            if not data["payload"]:
-                logger.warning(f"received empty event {event_type}")
-                continue
-
-            async def event_parse_task(t: str, payload: dict):
-                with suppress(NotImplementedError):
-                    await RedCapability(connection.staff).handle_event(t, payload)
-                    return
-                logger.warning(f"received unsupported event {t}: {payload}")
-
-            def handle_message(message: dict):
-                types = get_msg_types(message)
-                if types.msg == MsgType.system and types.send == "system":
-                    if (
-                        message["subMsgType"] == 8
-                        and message["elements"][0]["elementType"] == 8
-                        and message["elements"][0]["grayTipElement"]["subElementType"] == 4
-                        and message["elements"][0]["grayTipElement"]["groupElement"]["type"] == 1
-                    ):
-                        asyncio.create_task(event_parse_task("group::member::add", message))
-                    elif (
-                        message["subMsgType"] == 8
-                        and message["elements"][0]["elementType"] == 8
-                        and message["elements"][0]["grayTipElement"]["subElementType"] == 4
-                        and message["elements"][0]["grayTipElement"]["groupElement"]["type"] == 8
-                    ):
-                        asyncio.create_task(event_parse_task("group::member::mute", message))
-                    elif (
-                        message["subMsgType"] == 8
-                        and message["elements"][0]["elementType"] == 8
-                        and message["elements"][0]["grayTipElement"]["subElementType"] == 4
-                        and message["elements"][0]["grayTipElement"]["groupElement"]["type"] == 5
-                    ):
-                        asyncio.create_task(event_parse_task("group::name_update", message))
-                    elif (
-                        message["subMsgType"] == 12
-                        and message["elements"][0]["elementType"] == 8
-                        and message["elements"][0]["grayTipElement"]["subElementType"] == 12
-                        and message["elements"][0]["grayTipElement"]["xmlElement"]["busiType"] == "1"
-                        and message["elements"][0]["grayTipElement"]["xmlElement"]["busiId"] == "10145"
-                    ):
-                        asyncio.create_task(event_parse_task("group::member::legacy::add::invited", message))
-                    else:
-                        logger.warning(f"received unsupported event: {message}")
-                        return
+        async with self.ingestion:
+            async for connection, data in self.message_receive():
+                event_type = data["type"]
+                if not data["payload"]:
+                    logger.warning(f"received empty event {event_type}")
+                    continue
+
+                if event_type == "message::recv":
+                    for msg in data["payload"]:
+                        await self.handle_message(connection, msg)
                 else:
-                    asyncio.create_task(event_parse_task("message::recv", message))
-
-            if event_type == "message::recv":
-                for msg in data["payload"]:
-                    handle_message(msg)
+                    await self.ingestion.put((connection, event_type, data["payload"]), low_priority=True)
+
+    async def handle_message(self, connection: RedNetworking, message: dict):
+        scene = message.get("peerUin") or message.get("peerUid")
+        types = get_msg_types(message)
+        if types.msg == MsgType.system and types.send == "system":
+            if (
+                message["subMsgType"] == 8
+                and message["elements"][0]["elementType"] == 8
+                and message["elements"][0]["grayTipElement"]["subElementType"] == 4
+                and message["elements"][0]["grayTipElement"]["groupElement"]["type"] == 1
+            ):
+                event_type = "group::member::add"
+            elif (
+                message["subMsgType"] == 8
+                and message["elements"][0]["elementType"] == 8
+                and message["elements"][0]["grayTipElement"]["subElementType"] == 4
+                and message["elements"][0]["grayTipElement"]["groupElement"]["type"] == 8
+            ):
+                event_type = "group::member::mute"
+            elif (
+                message["subMsgType"] == 8
+                and message["elements"][0]["elementType"] == 8
+                and message["elements"][0]["grayTipElement"]["subElementType"] == 4
+                and message["elements"][0]["grayTipElement"]["groupElement"]["type"] == 5
+            ):
+                event_type = "group::name_update"
+            elif (
+                message["subMsgType"] == 12
+                and message["elements"][0]["elementType"] == 8
+                and message["elements"][0]["grayTipElement"]["subElementType"] == 12
+                and message["elements"][0]["grayTipElement"]["xmlElement"]["busiType"] == "1"
+                and message["elements"][0]["grayTipElement"]["xmlElement"]["busiId"] == "10145"
+            ):
+                event_type = "group::member::legacy::add::invited"
             else:
-                asyncio.create_task(event_parse_task(event_type, data["payload"]))
+                logger.warning(f"received unsupported event: {message}")
+                return
+            await self.ingestion.put((connection, event_type, message), scene=scene, low_priority=True)
+        else:
+            await self.ingestion.put((connection, "message::recv", message), scene=scene)
 
     async def connection_closed(self):
         self.close_signal.set()
@@ -116,7 +127,6 @@ class RedNetworking:
 
         await self.wait_for_available()
         await self.send({"type": action, "payload": params or {}})
-        return
 
     @overload
     async def call_http(
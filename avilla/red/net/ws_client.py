@@ -29,6 +29,7 @@ class RedWsClientNetworking(RedNetworking, Service):
     def __init__(self, protocol: RedProtocol, config: RedConfig) -> None:
         super().__init__(protocol)
         self.config = config
+        self.ingestion.config = config.ingestion
 
     @property
     def id(self):
@@ -57,37 +58,38 @@ class RedWsClientNetworking(RedNetworking, Service):
     async def call_http(
         self, method: Literal["get", "post", "multipart"], action: str, params: dict | None = None, raw: bool = False
     ):
-        action = action.replace("_", "/")
-        if method == "get":
-            async with self.session.get(
-                (self.config.http_endpoint / action).with_query(params or {}),
-                headers={"Authorization": f"Bearer {self.config.access_token}"},
-            ) as resp:
-                return (await resp.content.read()) if raw else await resp.json(content_type=None)
-        if method == "post":
-            async with self.session.post(
-                (self.config.http_endpoint / action),
-                json=params or {},
-                headers={"Authorization": f"Bearer {self.config.access_token}"},
-            ) as resp:
-                return (await resp.content.read()) if raw else await resp.json(content_type=None)
-        if method == "multipart":
-            data = aiohttp.FormData(quote_fields=False)
-            if params is None:
-                raise TypeError("multipart requires params")
-            for k, v in params.items():
-                if isinstance(v, dict):
-                    data.add_field(k, v["value"], filename=v.get("filename"), content_type=v.get("content_type"))
-                else:
-                    data.add_field(k, v)
-
-            async with self.session.post(
-                (self.config.http_endpoint / action),
-                data=data,
-                headers={"Authorization": f"Bearer {self.config.access_token}"},
-            ) as resp:
-                return (await resp.content.read()) if raw else await resp.json(content_type=None)
-        raise ValueError(f"Unknown method {method}")
+        with self.protocol.avilla.metrics.time_rpc("red", action):
+            action = action.replace("_", "/")
+            if method == "get":
+                async with self.session.get(
+                    (self.config.http_endpoint / action).with_query(params or {}),
+                    headers={"Authorization": f"Bearer {self.config.access_token}"},
+                ) as resp:
+                    return (await resp.content.read()) if raw else await resp.json(content_type=None)
+            if method == "post":
+                async with self.session.post(
+                    (self.config.http_endpoint / action),
+                    json=params or {},
+                    headers={"Authorization": f"Bearer {self.config.access_token}"},
+                ) as resp:
+                    return (await resp.content.read()) if raw else await resp.json(content_type=None)
+            if method == "multipart":
+                data = aiohttp.FormData(quote_fields=False)
+                if params is None:
+                    raise TypeError("multipart requires params")
+                for k, v in params.items():
+                    if isinstance(v, dict):
+                        data.add_field(k, v["value"], filename=v.get("filename"), content_type=v.get("content_type"))
+                    else:
+                        data.add_field(k, v)
+
+                async with self.session.post(
+                    (self.config.http_endpoint / action),
+                    data=data,
+                    headers={"Authorization": f"Bearer {self.config.access_token}"},
+                ) as resp:
+                    return (await resp.content.read()) if raw else await resp.json(content_type=None)
+            raise ValueError(f"Unknown method {method}")
 
     async def wait_for_available(self):
         await self.status.wait_for_available()
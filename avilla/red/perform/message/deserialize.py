@@ -50,7 +50,7 @@ class RedMessageDeserializePerform((m := ApplicationCollector())._):
     account: OptionalAccess[RedAccount] = OptionalAccess()
 
     @m.entity(RedCapability.deserialize_element, element="text")
-    async def text(self, element: dict) -> Text | Notice | NoticeAll:
+    def text(self, element: dict) -> Text | Notice | NoticeAll:
         if not element["atType"]:
             return Text(element["content"])
         if element["atType"] == 1:
@@ -66,13 +66,13 @@ class RedMessageDeserializePerform((m := ApplicationCollector())._):
         )
 
     @m.entity(RedCapability.deserialize_element, element="face")
-    async def face(self, element: dict) -> Face | Poke:
+    def face(self, element: dict) -> Face | Poke:
         if element["faceType"] == 5:
             return Poke(PokeKind.ChuoYiChuo)
         return Face(element["faceIndex"], element["faceText"])
 
     @m.entity(RedCapability.deserialize_element, element="pic")
-    async def pic(self, element: dict) -> Picture:
+    def pic(self, element: dict) -> Picture:
         resource = RedImageResource(
             self.context,  # type: ignore
             Selector().land("qq").picture(md5 := element["md5HexStr"]),
@@ -88,17 +88,17 @@ class RedMessageDeserializePerform((m := ApplicationCollector())._):
         return Picture(resource)
 
     @m.entity(RedCapability.deserialize_element, element="marketFace")
-    async def market_face(self, element: dict) -> MarketFace:
+    def market_face(self, element: dict) -> MarketFace:
         return MarketFace(
             f"{element['emojiId']}/{element['key']}/{element['emojiPackageId']}",
         )
 
     @m.entity(RedCapability.deserialize_element, element="ark")
-    async def ark(self, element: dict) -> App:
+    def ark(self, element: dict) -> App:
         return App(element["bytesData"])
 
     @m.entity(RedCapability.deserialize_element, element="file")
-    async def file(self, element: dict) -> File:
+    def file(self, element: dict) -> File:
         return File(
             RedFileResource(
                 self.context,  # type: ignore
@@ -112,7 +112,7 @@ class RedMessageDeserializePerform((m := ApplicationCollector())._):
         )
 
     @m.entity(RedCapability.deserialize_element, element="ptt")
-    async def ptt(self, element: dict) -> Audio:
+    def ptt(self, element: dict) -> Audio:
         return Audio(
             RedVoiceResource(
                 self.context,  # type: ignore
@@ -128,11 +128,11 @@ class RedMessageDeserializePerform((m := ApplicationCollector())._):
         )
 
     @m.entity(RedCapability.deserialize_element, element="grayTip")
-    async def gray_tip(self, element: dict) -> Unknown:
+    def gray_tip(self, element: dict) -> Unknown:
         return Unknown("grayTip", element)
 
     @m.entity(RedCapability.deserialize_element, element="multiForwardMsg")
-    async def forward(self, element: dict) -> Forward:
+    def forward(self, element: dict) -> Forward:
         root = HTMLParser(element["xmlContent"])
         title = root.css_first("source").attributes["name"]
         summary = root.css_first("summary").text()
@@ -148,7 +148,7 @@ class RedMessageDeserializePerform((m := ApplicationCollector())._):
         )
 
     @m.entity(RedCapability.deserialize_element, element="video")
-    async def video(self, element: dict) -> Video:
+    def video(self, element: dict) -> Video:
         return Video(
             RedVideoResource(
                 self.context,  # type: ignore
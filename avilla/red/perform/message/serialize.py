@@ -2,12 +2,13 @@ from __future__ import annotations
 
 import random
 from pathlib import Path
-from typing import TYPE_CHECKING, Any
+from typing import IO, TYPE_CHECKING, Any
 
 from avilla.core.builtins.resource_fetch import CoreResourceFetchPerform
 from avilla.core.elements import Audio, Face, Notice, NoticeAll, Picture, Text
-from avilla.core.resource import LocalFileResource, RawResource, UrlResource
+from avilla.core.resource import LocalFileResource, RawResource, Resource, UrlResource
 from avilla.core.ryanvk.collector.account import AccountCollector
+from avilla.core.utilles.fileio import open_file, run_io
 from avilla.red.capability import RedCapability
 from avilla.standard.qq.elements import MarketFace
 
@@ -22,16 +23,43 @@ class RedMessageSerializePerform((m := AccountCollector["RedProtocol", "RedAccou
 
     # LINK: https://github.com/microsoft/pyright/issues/5409
 
+    async def upload(self, resource: Resource, filename: str) -> dict:
+        file: IO[bytes] | None = None
+        if isinstance(resource, LocalFileResource):
+            # 本地文件以文件对象交给 aiohttp, 上传时分块读取, 不整个读入内存
+            data = file = await open_file(resource.file)
+        elif isinstance(resource, RawResource):
+            data = await CoreResourceFetchPerform(self.account.staff).fetch_raw(resource)
+        elif isinstance(resource, UrlResource):
+            data = await CoreResourceFetchPerform(self.account.staff).fetch_url(resource)
+        else:
+            data = await self.account.staff.fetch_resource(resource)
+        try:
+            return await self.account.websocket_client.call_http(
+                "multipart",
+                "api/upload",
+                {
+                    "file": {
+                        "value": data,
+                        "content_type": None,
+                        "filename": filename,
+                    }
+                },
+            )
+        finally:
+            if file is not None:
+                await run_io(file.close)
+
     @m.entity(RedCapability.serialize_element, element=Text)
-    async def text(self, element: Text) -> dict:
+    def text(self, element: Text) -> dict:
         return {"elementType": 1, "textElement": {"content": element.text}}
 
     @m.entity(RedCapability.serialize_element, element=Face)
-    async def face(self, element: Face) -> dict:
+    def face(self, element: Face) -> dict:
         return {"elementType": 6, "faceElement": {"faceIndex": element.id}}
 
     @m.entity(RedCapability.serialize_element, element=Notice)
-    async def notice(self, element: Notice) -> dict:
+    def notice(self, element: Notice) -> dict:
         return {
             "elementType": 1,
             "textElement": {
@@ -42,30 +70,12 @@ class RedMessageSerializePerform((m := AccountCollector["RedProtocol", "RedAccou
         }
 
     @m.entity(RedCapability.serialize_element, element=NoticeAll)
-    async def notice_all(self, element: NoticeAll) -> dict:
+    def notice_all(self, element: NoticeAll) -> dict:
         return {"elementType": 1, "textElement": {"atType": 1}}
 
     @m.entity(RedCapability.serialize_element, element=Picture)
     async def picture(self, element: Picture) -> dict:
-        if isinstance(element.resource, RawResource):
-            data = await CoreResourceFetchPerform(self.account.staff).fetch_raw(element.resource)
-        elif isinstance(element.resource, UrlResource):
-            data = await CoreResourceFetchPerform(self.account.staff).fetch_url(element.resource)
-        elif isinstance(element.resource, LocalFileResource):
-            data = await CoreResourceFetchPerform(self.account.staff).fetch_localfile(element.resource)
-        else:
-            data = await self.account.staff.fetch_resource(element.resource)
-        resp = await self.account.websocket_client.call_http(
-            "multipart",
-            "api/upload",
-            {
-                "file": {
-                    "value": data,
-                    "content_type": None,
-                    "filename": "file_image",
-                }
-            },
-        )
+        resp = await self.upload(element.resource, "file_image")
         file = Path(resp["ntFilePath"])
         return {
             "elementType": 2,
@@ -81,7 +91,7 @@ class RedMessageSerializePerform((m := AccountCollector["RedProtocol", "RedAccou
         }
 
     @m.entity(RedCapability.serialize_element, element=MarketFace)
-    async def market_face(self, element: MarketFace) -> dict:
+    def market_face(self, element: MarketFace) -> dict:
         emoji_id, key, emoji_package_id = element.id.split("/")
         return {
             "elementType": 11,
@@ -94,25 +104,7 @@ class RedMessageSerializePerform((m := AccountCollector["RedProtocol", "RedAccou
 
     @m.entity(RedCapability.serialize_element, element=Audio)
     async def audio(self, element: Audio) -> dict:
-        if isinstance(element.resource, RawResource):
-            data = await CoreResourceFetchPerform(self.account.staff).fetch_raw(element.resource)
-        elif isinstance(element.resource, UrlResource):
-            data = await CoreResourceFetchPerform(self.account.staff).fetch_url(element.resource)
-        elif isinstance(element.resource, LocalFileResource):
-            data = await CoreResourceFetchPerform(self.account.staff).fetch_localfile(element.resource)
-        else:
-            data = await self.account.staff.fetch_resource(element.resource)
-        resp = await self.account.websocket_client.call_http(
-            "multipart",
-            "api/upload",
-            {
-                "file": {
-                    "value": data,
-                    "content_type": None,
-                    "filename": "file_audio",
-                }
-            },
-        )
+        resp = await self.upload(element.resource, "file_audio")
         file = Path(resp["ntFilePath"])
         return {
             "elementType": 4,
@@ -145,25 +137,7 @@ class RedMessageSerializePerform((m := AccountCollector["RedProtocol", "RedAccou
 
     @m.entity(RedCapability.forward_export, element=Picture)
     async def forward_picture(self, element: Picture) -> dict:
-        if isinstance(element.resource, RawResource):
-            data = await CoreResourceFetchPerform(self.account.staff).fetch_raw(element.resource)
-        elif isinstance(element.resource, UrlResource):
-            data = await CoreResourceFetchPerform(self.account.staff).fetch_url(element.resource)
-        elif isinstance(element.resource, LocalFileResource):
-            data = await CoreResourceFetchPerform(self.account.staff).fetch_localfile(element.resource)
-        else:
-            data = await self.account.staff.fetch_resource(element.resource)
-        resp = await self.account.websocket_client.call_http(
-            "multipart",
-            "api/upload",
-            {
-                "file": {
-                    "value": data,
-                    "content_type": None,
-                    "filename": "file_image",
-                }
-            },
-        )
+        resp = await self.upload(element.resource, "file_image")
         md5 = resp["md5"]
         file = Path(resp["ntFilePath"])
         pid = f"{{{md5[:8].upper()}-{md5[8:12].upper()}-{md5[12:16].upper()}-{md5[16:20].upper()}-{md5[20:].upper()}}}{file.suffix}"  # noqa: E501
@@ -3,10 +3,9 @@ from __future__ import annotations
 from contextlib import suppress
 from typing import TYPE_CHECKING
 
-from aiohttp import ClientSession
-
 from avilla.core.builtins.capability import CoreCapability
 from avilla.core.ryanvk.collector.protocol import ProtocolCollector
+from avilla.core.utilles.fileio import read_file
 from avilla.red.resource import (
     RedFileResource,
     RedImageResource,
@@ -32,15 +31,12 @@ class RedResourceFetchPerform((m := ProtocolCollector["RedProtocol"]())._):
         if (
             isinstance(resource, (RedImageResource, RedVoiceResource, RedVideoResource))
             and resource.path
-            and resource.path.exists()
         ):
-            with resource.path.open("rb") as f:
-                return f.read()
+            with suppress(FileNotFoundError):
+                return await read_file(resource.path)
         if isinstance(resource, RedImageResource):
             with suppress(Exception):
-                async with ClientSession() as session:
-                    async with session.get(resource.url) as resp:
-                        return await resp.read()
+                return await self.protocol.avilla.http_client.fetch(resource.url)
         if TYPE_CHECKING:
             assert isinstance(resource.ctx.account, RedAccount)
         return await resource.ctx.account.websocket_client.call_http(
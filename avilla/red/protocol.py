@@ -5,6 +5,7 @@ from dataclasses import InitVar, dataclass, field
 from yarl import URL
 
 from avilla.core.application import Avilla
+from avilla.core.ingestion import IngestionConfig
 from avilla.core.protocol import BaseProtocol, ProtocolConfig
 from graia.ryanvk import merge, ref
 
@@ -20,6 +21,7 @@ class RedConfig(ProtocolConfig):
     _http_host: InitVar[str | None] = None
     endpoint: URL = field(init=False)
     http_endpoint: URL = field(init=False)
+    ingestion: IngestionConfig = field(default_factory=IngestionConfig)
 
     def __post_init__(self, _http_host: str | None):
         if not self.access_token:
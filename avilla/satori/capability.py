@@ -1,6 +1,6 @@
 from __future__ import annotations
 
-from typing import Any
+from typing import Any, Awaitable
 
 from graia.amnesia.message import Element, MessageChain
 from satori.parser import parse
@@ -19,31 +19,31 @@ class SatoriCapability((m := ApplicationCollector())._):
         ...
 
     @Fn.complex({TypeOverload(): ["raw_element"]})
-    async def deserialize_element(self, raw_element: Any) -> Element:
+    def deserialize_element(self, raw_element: Any) -> Element | Awaitable[Element]:
         ...
 
     @Fn.complex({TypeOverload(): ["element"]})
-    async def serialize_element(self, element: Any) -> str:
+    def serialize_element(self, element: Any) -> str | Awaitable[str]:
         ...
 
     async def deserialize(self, content: str):
-        elements = []
-
-        for raw_element in transform(parse(content)):
-            elements.append(await self.deserialize_element(raw_element))
-
-        return MessageChain(elements)
+        raw_elements = transform(parse(content))
+        return MessageChain(await self.staff.call_fn_many(SatoriCapability.deserialize_element, raw_elements))
 
     async def serialize(self, message: MessageChain):
-        chain = []
+        return "".join(await self.staff.call_fn_many(SatoriCapability.serialize_element, message))
 
-        for element in message:
-            chain.append(await self.serialize_element(element))
+    async def handle_event(self, event: Event):
+        metrics = self.avilla.metrics
+        raw_type = event.type if metrics.enabled else ""
+        metrics.count_event("satori", raw_type, "received")
 
-        return "".join(chain)
+        if self.avilla.event_subscriptions.skippable(self.staff, SatoriCapability.event_callback, event):
+            metrics.count_event("satori", raw_type, "skipped")
+            return
 
-    async def handle_event(self, event: Event):
         maybe_event = await self.event_callback(event)
+        metrics.count_parsed("satori", raw_type, maybe_event)
 
         if maybe_event is not None:
             if isinstance(maybe_event, list):
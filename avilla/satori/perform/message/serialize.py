@@ -22,7 +22,7 @@ class SatoriMessageSerializePerform((m := AccountCollector["SatoriProtocol", "Sa
     # LINK: https://github.com/microsoft/pyright/issues/5409
 
     @m.entity(SatoriCapability.serialize_element, element=Text)
-    async def text(self, element: Text) -> str:
+    def text(self, element: Text) -> str:
         text = escape(element.text)
         text.replace("\n", "<br/>")
         if not element.style:
@@ -57,7 +57,7 @@ class SatoriMessageSerializePerform((m := AccountCollector["SatoriProtocol", "Sa
         return text
 
     @m.entity(SatoriCapability.serialize_element, element=Notice)
-    async def notice(self, element: Notice) -> str:
+    def notice(self, element: Notice) -> str:
         if "role" in element.target.pattern:
             return f'<at role="{element.target.pattern["role"]}"/>'
         if "channel" in element.target.pattern:
@@ -65,37 +65,37 @@ class SatoriMessageSerializePerform((m := AccountCollector["SatoriProtocol", "Sa
         return f'<at id="{element.target["member"]}" name="{element.display or element.target["member"]}"/>'
 
     @m.entity(SatoriCapability.serialize_element, element=NoticeAll)
-    async def notice_all(self, element: NoticeAll) -> str:
+    def notice_all(self, element: NoticeAll) -> str:
         return '<at type="all"/>'
 
     @m.entity(SatoriCapability.serialize_element, element=Picture)
-    async def picture(self, element: Picture) -> str:
+    def picture(self, element: Picture) -> str:
         res = element.resource
         if not isinstance(res, SatoriResource):
             raise NotImplementedError("Only SatoriResource is supported.")
         return f'<img src="{res.src}" {"cache" if res.cache else ""}/>'
 
     @m.entity(SatoriCapability.serialize_element, element=Audio)
-    async def audio(self, element: Audio) -> str:
+    def audio(self, element: Audio) -> str:
         res = element.resource
         if not isinstance(res, SatoriResource):
             raise NotImplementedError("Only SatoriResource is supported.")
         return f'<audio src="{res.src}" {"cache" if res.cache else ""}/>'
 
     @m.entity(SatoriCapability.serialize_element, element=Video)
-    async def video(self, element: Video) -> str:
+    def video(self, element: Video) -> str:
         res = element.resource
         if not isinstance(res, SatoriResource):
             raise NotImplementedError("Only SatoriResource is supported.")
         return f'<video src="{res.src}" {"cache" if res.cache else ""}/>'
 
     @m.entity(SatoriCapability.serialize_element, element=File)
-    async def file(self, element: File) -> str:
+    def file(self, element: File) -> str:
         res = element.resource
         if not isinstance(res, SatoriResource):
             raise NotImplementedError("Only SatoriResource is supported.")
         return f'<file src="{res.src}" {"cache" if res.cache else ""}/>'
 
     @m.entity(SatoriCapability.serialize_element, element=Button)
-    async def button(self, element: Button) -> str:
+    def button(self, element: Button) -> str:
         return str(element)
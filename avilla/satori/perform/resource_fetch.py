@@ -1,12 +1,12 @@
 from __future__ import annotations
 
 from base64 import b64decode
+from pathlib import Path
 from typing import TYPE_CHECKING
 
-from aiohttp import ClientSession
-
 from avilla.core.builtins.capability import CoreCapability
 from avilla.core.ryanvk.collector.protocol import ProtocolCollector
+from avilla.core.utilles.fileio import read_file
 from avilla.satori.resource import (
     SatoriAudioResource,
     SatoriFileResource,
@@ -29,10 +29,7 @@ class SatoriResourceFetchPerform((m := ProtocolCollector["SatoriProtocol"]())._)
     @m.entity(CoreCapability.fetch, resource=SatoriFileResource)  # type: ignore
     async def fetch_resource(self, resource: SatoriResource) -> bytes:
         if resource.src.startswith("file://"):
-            with open(resource.src[7:], "rb") as f:
-                return f.read()
+            return await read_file(Path(resource.src[7:]))
         if resource.src.startswith("data:"):
             return b64decode(resource.src[5:].split(";", 1)[1][7:])
-        async with ClientSession() as session:
-            async with session.get(resource.src) as resp:
-                return await resp.read()
+        return await self.protocol.avilla.http_client.fetch(resource.src)
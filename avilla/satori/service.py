@@ -1,6 +1,6 @@
 from __future__ import annotations
 
-import asyncio
+import weakref
 from contextlib import suppress
 from typing import TYPE_CHECKING
 
@@ -10,6 +10,7 @@ from satori.client import App
 from satori.model import Event, LoginStatus
 
 from avilla.core.account import AccountInfo
+from avilla.core.ingestion import EventIngestion
 from avilla.standard.core.account import (
     AccountAvailable,
     AccountRegistered,
@@ -32,10 +33,16 @@ class SatoriService(App):
 
     protocol: SatoriProtocol
     _accounts: dict[str, SatoriAccount]
+    ingestion: EventIngestion[tuple[Account, Event]]
+    _metered: weakref.WeakSet
+
+    _staff: Staff | None = None
 
     def __init__(self, protocol: SatoriProtocol):
         self.protocol = protocol
         self._accounts = {}
+        self.ingestion = EventIngestion(self.event_parse_task)
+        self._metered = weakref.WeakSet()
         super().__init__()
         self.register(self.handle_event)
         self.lifecycle(self.handle_lifecycle)
@@ -47,18 +54,42 @@ class SatoriService(App):
         return [self.protocol.artifacts, self.protocol.avilla.global_artifacts]
 
     @property
-    def staff(self):
-        return Staff(self.get_staff_artifacts(), self.get_staff_components())
+    def staff(self) -> Staff:
+        if self._staff is None:
+            self._staff = Staff(self.get_staff_artifacts(), self.get_staff_components())
+        return self._staff
+
+    async def event_parse_task(self, item: tuple[Account, Event]):
+        connection, raw = item
+        with suppress(NotImplementedError):
+            await SatoriCapability(self.staff.ext({"connection": connection})).handle_event(raw)
+            return
+
+        logger.warning(f"received unsupported event {raw.type}: {raw}")
 
     async def handle_event(self, account: Account, event: Event):
-        async def event_parse_task(connection: Account, raw: Event):
-            with suppress(NotImplementedError):
-                await SatoriCapability(self.staff.ext({"connection": connection})).handle_event(raw)
-                return
+        # App 没有可供挂载的生命周期, worker 在首次入队时启动
+        await self.ingestion.put(
+            (account, event),
+            scene=(account.self_id, event.channel.id) if event.channel else None,
+            low_priority=not event.type.startswith("message"),
+        )
+
+    def meter_calls(self, account: Account):
+        """Satori 的接口调用都经由 session.call_api, 启用指标时为其记录耗时."""
+        metrics = self.protocol.avilla.metrics
+        session = account.session
+        if not metrics.enabled or session in self._metered:
+            return
+
+        call_api = session.call_api
 
-            logger.warning(f"received unsupported event {raw.type}: {raw}")
+        async def metered_call_api(action, params: dict | None = None) -> dict:
+            with metrics.time_rpc("satori", getattr(action, "value", action)):
+                return await call_api(action, params)
 
-        asyncio.create_task(event_parse_task(account, event))
+        session.call_api = metered_call_api
+        self._metered.add(session)
 
     async def handle_lifecycle(self, account: Account, state: LoginStatus):
         if state == LoginStatus.ONLINE:
@@ -70,10 +101,12 @@ class SatoriService(App):
             self.protocol.avilla.broadcast.postEvent(AccountRegistered(self.protocol.avilla, _account))
             self._accounts[account.identity] = _account
             _account.client = account
+            self.meter_calls(account)
         elif state == LoginStatus.CONNECT:
             _account = self._accounts[account.identity]
             self.protocol.avilla.broadcast.postEvent(AccountAvailable(self.protocol.avilla, _account))
             _account.client = account
+            self.meter_calls(account)
             _account.status.enabled = True
         elif state == LoginStatus.DISCONNECT:
             _account = self._accounts[account.identity]
@@ -1,9 +1,11 @@
 """Twilight: 混合式消息链处理器"""
 import abc
+import bisect
 import contextlib
 import enum
 import inspect
 import re
+import weakref
 from argparse import Action, HelpFormatter
 from typing import (
     TYPE_CHECKING,
@@ -17,6 +19,7 @@ from typing import (
     List,
     Literal,
     Optional,
+    Set,
     Tuple,
     Type,
     TypedDict,
@@ -49,15 +52,15 @@ from .typing import (
     get_origin,
 )
 from .util import (
+    ChainTokens,
     ElementType,
     MessageChainType,
     TwilightHelpManager,
     TwilightParser,
     Unmatched,
     _from_mapping_string,
-    _to_mapping_str,
     elem_mapping_ctx,
-    split,
+    tokenize_chain,
     transform_regex,
 )
 
@@ -530,6 +533,25 @@ class TwilightMatcher:
                     self.dispatch_ref[m.dest] = m
 
         self._regex_pattern: re.Pattern = re.compile("".join(regex_str_list))
+        self.literal_prefixes: Optional[Tuple[str, ...]] = self._get_literal_prefixes()
+        if self.literal_prefixes is not None:
+            _matcher_index.register(self)
+
+    def _get_literal_prefixes(self) -> Optional[Tuple[str, ...]]:
+        """求出能匹配的消息必然具有的字面量前缀之一; 无法确定时返回 None.
+
+        含 ArgumentMatch 时正则只作用于去除参数后的部分, 因此也返回 None.
+        """
+        if self._dest_map or not self.match_ref[RegexMatch]:
+            return None
+        first = self.match_ref[RegexMatch][0]
+        if first.optional or first._flags:
+            return None
+        if type(first) is FullMatch:
+            return (first.pattern,)
+        if type(first) is UnionMatch and all(isinstance(i, str) for i in first.pattern):
+            return tuple(re.sub(r"\\(.)", r"\1", cast(str, i), flags=re.S) for i in first.pattern)
+        return None
 
     def match(
         self, arguments: List[str], elem_mapping: Dict[str, Element]
@@ -626,6 +648,40 @@ class TwilightMatcher:
         return repr(list(self._group_map.values()) + list(self._dest_map.values()))  # type: ignore
 
 
+class _MatcherIndex:
+    """按字面量前缀索引所有 TwilightMatcher, 对每条消息只需一次查找即可得出全部候选."""
+
+    def __init__(self) -> None:
+        self._prefixes: Dict[str, "weakref.WeakSet[TwilightMatcher]"] = {}
+        self._lengths: List[int] = []
+        self._last: Optional[Tuple[str, Set[int]]] = None
+
+    def register(self, matcher: TwilightMatcher) -> None:
+        for prefix in matcher.literal_prefixes or ():
+            self._prefixes.setdefault(prefix, weakref.WeakSet()).add(matcher)
+            if len(prefix) not in self._lengths:
+                bisect.insort(self._lengths, len(prefix))
+        self._last = None
+
+    def candidates(self, joined: str) -> Set[int]:
+        if self._last is not None and self._last[0] == joined:
+            return self._last[1]
+        result: Set[int] = set()
+        for length in self._lengths:
+            if length > len(joined):
+                break
+            if bucket := self._prefixes.get(joined[:length]):
+                result.update(map(id, bucket))
+        self._last = (joined, result)
+        return result
+
+    def may_match(self, matcher: TwilightMatcher, joined: str) -> bool:
+        return matcher.literal_prefixes is None or id(matcher) in self.candidates(joined)
+
+
+_matcher_index = _MatcherIndex()
+
+
 class _TwilightHelpArgs(TypedDict):
     usage: str
     description: str
@@ -674,14 +730,20 @@ class Twilight(Generic[T_Sparkle], BaseDispatcher):
         Returns:
             T_Sparkle: 生成的 Sparkle 对象.
         """
-        mapping_str, elem_mapping = _to_mapping_str(chain, **self.map_param)
-        token = elem_mapping_ctx.set(elem_mapping)
-        arguments: List[str] = split(mapping_str, keep_quote=True)
-        res, match = self.matcher.match(arguments, elem_mapping)
+        tokens = tokenize_chain(chain, **self.map_param)
+        if not _matcher_index.may_match(self.matcher, tokens.joined):
+            raise ValueError(f"{tokens.joined} not matching {self.matcher.literal_prefixes}")
+        return self._generate(tokens, storage)
+
+    def _generate(self, tokens: ChainTokens, storage: Optional[Dict[str, Any]] = None) -> T_Sparkle:
+        token = elem_mapping_ctx.set(tokens.elem_mapping)
+        try:
+            res, match = self.matcher.match(tokens.arguments, tokens.elem_mapping)
+        finally:
+            elem_mapping_ctx.reset(token)
         if storage:
             storage["__parser_regex_match_obj__"] = match
-            storage["__parser_regex_match_map__"] = elem_mapping
-        elem_mapping_ctx.reset(token)
+            storage["__parser_regex_match_map__"] = tokens.elem_mapping
         return cast(T_Sparkle, Sparkle(res))
 
     @classmethod
@@ -810,10 +872,13 @@ class Twilight(Generic[T_Sparkle], BaseDispatcher):
             chain = await interface.lookup_by_directly(DeriveDispatcher(), "twilight_derive", self.preprocessor, None)
         else:
             chain = await interface.lookup_param("message_chain", MessageChain, None)
-        with contextlib.suppress(Exception):
-            local_storage[f"{__name__}:result"] = self.generate(chain, local_storage)
-            local_storage[f"{__name__}:twilight"] = self
-            return
+        tokens = tokenize_chain(chain, **self.map_param)
+        # 预筛不通过时直接停止, 省去构造异常的开销
+        if _matcher_index.may_match(self.matcher, tokens.joined):
+            with contextlib.suppress(Exception):
+                local_storage[f"{__name__}:result"] = self._generate(tokens, local_storage)
+                local_storage[f"{__name__}:twilight"] = self
+                return
         interface.stop()
 
     async def catch(self, interface: DispatcherInterface):
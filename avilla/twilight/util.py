@@ -2,6 +2,7 @@
 import argparse
 import inspect
 import re
+from collections import OrderedDict
 from contextvars import ContextVar
 from typing import (
     TYPE_CHECKING,
@@ -11,8 +12,10 @@ from typing import (
     Final,
     List,
     Literal,
+    NamedTuple,
     NoReturn,
     Optional,
+    Tuple,
     Type,
     TypeVar,
     Union,
@@ -328,6 +331,40 @@ def _to_mapping_str(
     return "".join(elem_str_list), elem_mapping
 
 
+class ChainTokens(NamedTuple):
+    """消息链切分后的形式, 由 `tokenize_chain` 生成, 各 Twilight 共享, 不应修改."""
+
+    mapping_str: str
+    elem_mapping: Dict[str, Element]
+    arguments: List[str]
+    joined: str
+
+
+_tokens_cache: "OrderedDict[Tuple[int, tuple], Tuple[MessageChain, Tuple[int, ...], ChainTokens]]" = OrderedDict()
+
+
+def tokenize_chain(chain: MessageChain, **map_param: bool) -> ChainTokens:
+    """转换并切分消息链, 结果按消息链与参数缓存.
+
+    同一条消息会依次经过每个 Twilight, 缓存使其只需转换一次.
+    缓存持有消息链的引用, 并记录元素的 id, 以免 id 复用或元素被替换后命中旧的结果.
+    """
+    key = (id(chain), tuple(map_param.items()))
+    elements = tuple(map(id, chain.content))
+    cached = _tokens_cache.get(key)
+    if cached is not None and cached[0] is chain and cached[1] == elements:
+        return cached[2]
+
+    mapping_str, elem_mapping = _to_mapping_str(chain, **map_param)
+    arguments = split(mapping_str, keep_quote=True)
+    tokens = ChainTokens(mapping_str, elem_mapping, arguments, " ".join(arguments))
+    _tokens_cache[key] = (chain, elements, tokens)
+    _tokens_cache.move_to_end(key)
+    if len(_tokens_cache) > 16:
+        _tokens_cache.popitem(last=False)
+    return tokens
+
+
 __element_pattern = re.compile("(\x02\\w+\x03)")
 
 
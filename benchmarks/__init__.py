@@ -0,0 +1 @@
+"""Avilla 的性能基准, 以 `python -m benchmarks.<name>` 运行."""
@@ -0,0 +1,11 @@
+"""端到端吞吐基准: 经由本地的协议替身, 把事件流送入真实的 networking 类并走完整个分发流程.
+
+替身是在本机监听的 aiohttp 服务, 模拟各协议实现端的握手、事件推送与接口响应; Avilla 以完整的 Launart
+生命周期运行, 事件依次经过连接、EventIngestion、事件解析 (Staff 与各类 Overload)、Context 构造与 Broadcast 分发.
+
+    python -m benchmarks.e2e [--protocol onebot11 ...] [--scenario burst ...] [--memory] [--profile] [--json]
+    python -m benchmarks.e2e --protocol onebot11 --replay events.jsonl
+
+报告每秒处理的事件数、从推送到监听器被调用的 p50/p99 延迟、`send_message` 的往返耗时,
+以及 (--memory) 每万条事件留存与峰值的内存.
+"""
@@ -0,0 +1,121 @@
+from __future__ import annotations
+
+import argparse
+import asyncio
+import importlib
+import json
+import subprocess
+import sys
+from dataclasses import asdict
+from pathlib import Path
+
+from loguru import logger
+
+from .harness import Report, Run, StandIn
+from .scenarios import SCENARIOS
+
+STANDINS = {
+    "onebot11": "benchmarks.e2e.onebot11:OneBot11StandIn",
+    "satori": "benchmarks.e2e.satori:SatoriStandIn",
+    "red": "benchmarks.e2e.red:RedStandIn",
+    "elizabeth": "benchmarks.e2e.elizabeth:ElizabethStandIn",
+    "qqapi": "benchmarks.e2e.qqapi:QQAPIStandIn",
+}
+
+
+def load_standin(name: str) -> type[StandIn] | None:
+    module, _, attr = STANDINS[name].partition(":")
+    try:
+        return getattr(importlib.import_module(module), attr)
+    except ImportError as e:
+        # 如 satori-python 未安装
+        print(f"skipping {name}: {e}", file=sys.stderr)
+
+
+def print_report(report: Report):
+    memory = (
+        f" {report.retained_kb_per_10k:>10.0f} {report.peak_kb_per_10k:>10.0f}"
+        if report.retained_kb_per_10k is not None
+        else ""
+    )
+    print(
+        f"{report.protocol:<10} {report.scenario:<12} {report.received:>7}/{report.pushed:<7} {report.dropped:>6} "
+        f"{report.events_per_second:>9.0f} {report.p50_ms:>8.2f} {report.p99_ms:>8.2f} "
+        f"{report.rpc_p50_ms:>8.2f} {report.rpc_p99_ms:>8.2f}{memory}"
+    )
+    for i in report.fn[:8]:
+        print(f"{'':<23} {i['fn']:<60} {i['count']:>8} {i['mean_us']:>9.1f}us")
+
+
+async def run_one(args: argparse.Namespace, protocol: str, name: str) -> Report | None:
+    standin_type = load_standin(protocol)
+    if standin_type is None:
+        return
+    frames = None
+    if args.replay is not None:
+        frames = [json.loads(line) for line in Path(args.replay).read_text("utf-8").splitlines() if line.strip()]
+    scenario = SCENARIOS[name].with_events(args.events)
+    async with Run(standin_type(scenario), profile=args.profile) as run:
+        return await run.measure(frames=frames, rpc_calls=args.rpc, memory=args.memory)
+
+
+def isolated(argv: list[str], protocol: str, name: str) -> Report | None:
+    """在独立的进程中运行一组 (协议, 场景); 上一次运行遗留的对象不会影响之后的测量."""
+    result = subprocess.run(
+        [sys.executable, "-m", "benchmarks.e2e", *argv, "--isolated", "--protocol", protocol, "--scenario", name],
+        stdout=subprocess.PIPE,
+        text=True,
+    )
+    if result.returncode != 0:
+        print(f"{protocol}/{name} failed with exit code {result.returncode}", file=sys.stderr)
+        return
+    lines = result.stdout.strip().splitlines()
+    return Report(**json.loads(lines[-1])) if lines else None
+
+
+def main(args: argparse.Namespace, argv: list[str]):
+    if args.isolated:
+        report = asyncio.run(run_one(args, args.protocol[0], args.scenario[0]))
+        if report is not None:
+            print(json.dumps(asdict(report), ensure_ascii=False))
+        return
+
+    if not args.json:
+        memory = f" {'KB/10k kept':>10} {'KB/10k peak':>10}" if args.memory else ""
+        print(
+            f"{'protocol':<10} {'scenario':<12} {'received/pushed':>15} {'drop':>6} {'events/s':>9} "
+            f"{'p50 ms':>8} {'p99 ms':>8} {'rpc p50':>8} {'rpc p99':>8}{memory}"
+        )
+
+    for protocol in args.protocol:
+        for name in args.scenario:
+            report = isolated(argv, protocol, name)
+            if report is None:
+                continue
+            if args.json:
+                print(json.dumps(asdict(report), ensure_ascii=False), flush=True)
+            else:
+                print_report(report)
+                sys.stdout.flush()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(prog="python -m benchmarks.e2e")
+    parser.add_argument("--protocol", nargs="+", choices=list(STANDINS), default=list(STANDINS))
+    parser.add_argument("--scenario", nargs="+", choices=list(SCENARIOS), default=list(SCENARIOS))
+    parser.add_argument("--events", type=int, default=None, help="覆盖场景的事件数")
+    parser.add_argument("--rpc", type=int, default=200, help="测量 send_message 往返耗时的调用次数")
+    parser.add_argument("--memory", action="store_true", help="以 tracemalloc 测量内存, 会显著降低吞吐")
+    parser.add_argument("--profile", action="store_true", help="启用 Avilla.metrics, 列出耗时最多的 Fn")
+    parser.add_argument("--replay", default=None, help="回放录制的原始事件帧 (JSON Lines), 需指定单个协议")
+    parser.add_argument("--json", action="store_true", help="每次运行输出一行 JSON, 便于在提交间比较")
+    parser.add_argument("--log-level", default="ERROR")
+    parser.add_argument("--isolated", action="store_true", help=argparse.SUPPRESS)
+    argv = sys.argv[1:]
+    args = parser.parse_args(argv)
+    if args.replay is not None and len(args.protocol) != 1:
+        parser.error("--replay requires exactly one --protocol")
+
+    logger.remove()
+    logger.add(sys.stderr, level=args.log_level)
+    main(args, [i for i in argv if i not in {"--json"}])
@@ -0,0 +1,88 @@
+from __future__ import annotations
+
+import time
+
+from aiohttp import WSMsgType, web
+
+from avilla.elizabeth.protocol import ElizabethConfig, ElizabethProtocol
+
+from .harness import StandIn
+
+
+class ElizabethStandIn(StandIn):
+    """mirai-api-http 的 websocket adapter; 每个账号一条连接, 接口调用经由同一连接."""
+
+    name = "elizabeth"
+
+    def routes(self):
+        return [web.get("/all", self.serve)]
+
+    def protocol(self):
+        self._protocol = ElizabethProtocol()
+        for account in self.accounts:
+            self._protocol.configure(ElizabethConfig(int(account), "127.0.0.1", self.port, "verify-key"))
+        return self._protocol
+
+    def ready(self, avilla):
+        connections = self._protocol.service.account_map.values()
+        return (
+            super().ready(avilla)
+            and len(connections) >= len(self.accounts)
+            and all(i.session_key for i in connections)
+        )
+
+    async def serve(self, request: web.Request):
+        account = request.query["qq"]
+        ws = await self.accept(request)
+        await ws.send_json({"syncId": "", "data": {"code": 0, "session": f"session-{account}"}})
+        self.peers[account] = ws
+        async for msg in ws:
+            if msg.type != WSMsgType.TEXT:
+                break
+            call = msg.json()
+            self.rpc_calls += 1
+            if call["command"] in {"sendGroupMessage", "sendFriendMessage", "sendTempMessage"}:
+                data = {"code": 0, "msg": "success", "messageId": self.next_message_id()}
+            else:
+                data = {"code": 400, "msg": "unsupported"}
+            await ws.send_json({"syncId": call["syncId"], "data": data})
+        self.peers.pop(account, None)
+        return ws
+
+    def message(self, seq: int, account: str, group: str, member: str):
+        chain: list[dict] = [
+            {"type": "Source", "id": seq, "time": int(time.time())},
+            {"type": "Plain", "text": self.scenario.text(seq)},
+        ]
+        if self.scenario.has_media(seq):
+            chain.extend(
+                {
+                    "type": "Image",
+                    "imageId": f"{{{seq:08X}-0000-0000-0000-{i:012X}}}.png",
+                    "url": self.media_url(seq, i),
+                }
+                for i in range(self.scenario.images)
+            )
+        return str(seq), {
+            "syncId": "-1",
+            "data": {
+                "type": "GroupMessage",
+                "messageChain": chain,
+                "sender": {
+                    "id": int(member),
+                    "memberName": f"member {member}",
+                    "specialTitle": "",
+                    "permission": "MEMBER",
+                    "joinTimestamp": 0,
+                    "lastSpeakTimestamp": 0,
+                    "muteTimeRemaining": 0,
+                    "group": {"id": int(group), "name": f"group {group}", "permission": "MEMBER"},
+                },
+            },
+        }
+
+    def replay_target(self, frame: dict):
+        data = frame.get("data") or {}
+        chain = data.get("messageChain")
+        message_id = str(chain[0]["id"]) if chain and chain[0].get("type") == "Source" else None
+        return self.accounts[0], message_id
@@ -0,0 +1,309 @@
+from __future__ import annotations
+
+import asyncio
+import gc
+import json
+import time
+import tracemalloc
+from array import array
+from contextlib import suppress
+from dataclasses import dataclass, field
+from typing import Any, ClassVar, Iterable
+
+from aiohttp import web
+from graia.broadcast import Broadcast
+from launart import Launart
+
+from avilla.core import Avilla, Context
+from avilla.core.ingestion import EventIngestion
+from avilla.core.metrics import MetricsConfig
+from avilla.core.protocol import BaseProtocol
+from avilla.standard.core.message import MessageReceived
+
+from .scenarios import Scenario
+
+ACCOUNT_BASE = 10000
+GROUP_BASE = 200000
+MEMBER_BASE = 3000000
+
+
+class StandIn:
+    """模拟协议实现端的本地服务, 经由 aiohttp 提供 websocket 与 HTTP 接口.
+
+    子类描述协议的握手、消息事件帧与发送消息的响应; 推送消息时记录发送时刻, 供探针计算处理延迟.
+    """
+
+    name: ClassVar[str]
+
+    scenario: Scenario
+    port: int
+    sent: dict[str, float]
+    peers: dict[str, web.WebSocketResponse]
+    rpc_calls: int
+
+    def __init__(self, scenario: Scenario) -> None:
+        self.scenario = scenario
+        self.port = 0
+        self.sent = {}
+        self.peers = {}
+        self.rpc_calls = 0
+        self._message_ids = iter(range(1 << 62))
+        self._runner: web.AppRunner | None = None
+
+    @property
+    def accounts(self) -> list[str]:
+        return [str(ACCOUNT_BASE + i) for i in range(self.scenario.accounts)]
+
+    def routes(self) -> list[web.RouteDef]:
+        raise NotImplementedError
+
+    def protocol(self) -> BaseProtocol:
+        raise NotImplementedError
+
+    def message(self, seq: int, account: str, group: str, member: str) -> tuple[str, dict]:
+        """构造一条群消息事件, 返回 (消息 ID, 帧)."""
+        raise NotImplementedError
+
+    def ready(self, avilla: Avilla) -> bool:
+        return len(avilla.accounts) >= self.scenario.accounts and len(self.peers) >= len(self.accounts)
+
+    def replay_target(self, frame: dict) -> tuple[str, str | None]:
+        """回放录制的帧时, 返回 (推送到的账号, 帧中的消息 ID); 无法识别消息 ID 时不计入延迟."""
+        return self.accounts[0], None
+
+    def next_message_id(self) -> int:
+        return next(self._message_ids)
+
+    def media_url(self, seq: int, index: int) -> str:
+        return f"http://127.0.0.1:{self.port}/media/{seq}-{index}.png"
+
+    async def push(self, account: str, frame: dict, message_id: str | None = None):
+        data = json.dumps(frame)
+        if message_id is not None:
+            self.sent[message_id] = time.perf_counter()
+        await self.peers[account].send_str(data)
+
+    async def accept(self, request: web.Request) -> web.WebSocketResponse:
+        ws = web.WebSocketResponse(max_msg_size=0)
+        await ws.prepare(request)
+        return ws
+
+    async def start(self):
+        app = web.Application()
+        app.add_routes(self.routes())
+        self._runner = web.AppRunner(app, access_log=None)
+        await self._runner.setup()
+        site = web.TCPSite(self._runner, "127.0.0.1", 0)
+        await site.start()
+        self.port = self._runner.addresses[0][1]
+
+    async def stop(self):
+        for ws in list(self.peers.values()):
+            await ws.close()
+        if self._runner is not None:
+            await self._runner.cleanup()
+
+
+class Probe:
+    """监听 MessageReceived, 以替身记录的发送时刻计算从推送到监听器被调用的耗时."""
+
+    received: int
+    latencies: array
+    last: float
+    context: Context | None
+
+    def __init__(self, standin: StandIn) -> None:
+        self.sent = standin.sent
+        self.received = 0
+        self.latencies = array("d")
+        self.last = 0.0
+        self.context = None
+
+    async def __call__(self, event: MessageReceived):
+        now = time.perf_counter()
+        self.received += 1
+        self.last = now
+        self.context = event.context
+        if (sent := self.sent.pop(str(event.message.id), None)) is not None:
+            self.latencies.append(now - sent)
+
+
+def _ingested() -> int:
+    return sum(
+        i.stats.handled + i.stats.failed + i.stats.dropped + i.stats.shed for i in list(EventIngestion.instances)
+    )
+
+
+def _dropped() -> int:
+    return sum(i.stats.dropped + i.stats.shed for i in list(EventIngestion.instances))
+
+
+def _percentile(values: Iterable[float], q: float) -> float:
+    ordered = sorted(values)
+    if not ordered:
+        return 0.0
+    return ordered[min(int(q * len(ordered)), len(ordered) - 1)]
+
+
+@dataclass
+class Report:
+    protocol: str
+    scenario: str
+    pushed: int
+    received: int
+    dropped: int
+    seconds: float
+    events_per_second: float
+    p50_ms: float
+    p99_ms: float
+    rpc_calls: int = 0
+    rpc_p50_ms: float = 0.0
+    rpc_p99_ms: float = 0.0
+    retained_kb_per_10k: float | None = None
+    peak_kb_per_10k: float | None = None
+    fn: list[dict[str, Any]] = field(default_factory=list)
+
+
+class Run:
+    """一次基准: 启动替身与完整的 Avilla 生命周期, 推送事件, 再测量发送消息的往返耗时."""
+
+    standin: StandIn
+    scenario: Scenario
+    avilla: Avilla
+    probe: Probe
+
+    def __init__(self, standin: StandIn, *, profile: bool = False) -> None:
+        self.standin = standin
+        self.scenario = standin.scenario
+        self.profile = profile
+
+    async def __aenter__(self):
+        await self.standin.start()
+        self.avilla = Avilla(
+            broadcast=Broadcast(),
+            launch_manager=Launart(),
+            metrics_config=MetricsConfig(enabled=self.profile, endpoint=None),
+        )
+        self.avilla.apply_protocols(self.standin.protocol())
+        self.probe = Probe(self.standin)
+        self.avilla.listen(MessageReceived)(self.probe.__call__)
+        self._launch = asyncio.create_task(self.avilla.launch_manager.launch())
+        await self._wait(lambda: self.standin.ready(self.avilla), 30, "accounts did not become ready")
+        return self
+
+    async def __aexit__(self, *_):
+        # 与 Ctrl-C 相同的退出流程
+        self.avilla.launch_manager._on_sys_signal(None, None, self._launch)
+        with suppress(asyncio.CancelledError):
+            await self._launch
+        await self.standin.stop()
+
+    async def _wait(self, predicate, timeout: float, message: str):
+        deadline = time.monotonic() + timeout
+        while not predicate():
+            if self._launch.done():
+                raise RuntimeError(f"{self.standin.name}: launart exited early")
+            if time.monotonic() > deadline:
+                raise TimeoutError(f"{self.standin.name}: {message}")
+            await asyncio.sleep(0.01)
+
+    async def _settle(self, target: int, timeout: float = 60):
+        """等待 target 条条目被 ingestion 处理 (含丢弃), 且监听器不再收到新事件."""
+        deadline = time.monotonic() + timeout
+        while _ingested() < target and time.monotonic() < deadline:
+            await asyncio.sleep(0.001)
+        received = -1
+        while received != self.probe.received and time.monotonic() < deadline:
+            received = self.probe.received
+            await asyncio.sleep(0.05)
+
+    async def drive(self, frames: Iterable[tuple[str, dict, str | None]]) -> tuple[int, float]:
+        base = _ingested()
+        pushed = 0
+        burst = self.scenario.burst
+        window = self.scenario.window
+        start = time.perf_counter()
+        for account, frame, message_id in frames:
+            if burst is not None:
+                if pushed and pushed % burst == 0:
+                    await self._settle(base + pushed)
+            else:
+                while base + pushed - _ingested() >= window:
+                    await asyncio.sleep(0.0005)
+            await self.standin.push(account, frame, message_id)
+            pushed += 1
+        await self._settle(base + pushed)
+        return pushed, start
+
+    def synthetic(self) -> Iterable[tuple[str, dict, str | None]]:
+        standin = self.standin
+        accounts = standin.accounts
+        for seq, account, group, member in self.scenario.plan():
+            message_id, frame = standin.message(
+                seq, accounts[account], str(GROUP_BASE + group), str(MEMBER_BASE + member)
+            )
+            yield accounts[account], frame, message_id
+
+    def replay(self, frames: Iterable[dict]) -> Iterable[tuple[str, dict, str | None]]:
+        for frame in frames:
+            account, message_id = self.standin.replay_target(frame)
+            yield account, frame, message_id
+
+    async def rpc(self, calls: int) -> list[float]:
+        context = self.probe.context
+        if context is None or not calls:
+            return []
+        samples = []
+        for i in range(calls):
+            start = time.perf_counter()
+            await context.scene.send_message(f"pong {i}")
+            samples.append(time.perf_counter() - start)
+        return samples
+
+    async def measure(
+        self, *, frames: Iterable[dict] | None = None, rpc_calls: int = 200, memory: bool = False
+    ) -> Report:
+        dropped = _dropped()
+        if memory:
+            gc.collect()
+            tracemalloc.start()
+            baseline = tracemalloc.get_traced_memory()[0]
+            tracemalloc.reset_peak()
+
+        pushed, start = await self.drive(self.replay(frames) if frames is not None else self.synthetic())
+
+        retained = peak = None
+        if memory:
+            gc.collect()
+            current, peak_bytes = tracemalloc.get_traced_memory()
+            tracemalloc.stop()
+            scale = 10_000 / max(self.probe.received, 1) / 1024
+            retained = (current - baseline) * scale
+            peak = (peak_bytes - baseline) * scale
+
+        seconds = max(self.probe.last - start, 1e-9)
+        rpc = await self.rpc(rpc_calls)
+        report = Report(
+            protocol=self.standin.name,
+            scenario=self.scenario.name,
+            pushed=pushed,
+            received=self.probe.received,
+            dropped=_dropped() - dropped,
+            seconds=seconds,
+            events_per_second=self.probe.received / seconds,
+            p50_ms=_percentile(self.probe.latencies, 0.5) * 1000,
+            p99_ms=_percentile(self.probe.latencies, 0.99) * 1000,
+            rpc_calls=len(rpc),
+            rpc_p50_ms=_percentile(rpc, 0.5) * 1000,
+            rpc_p99_ms=_percentile(rpc, 0.99) * 1000,
+            retained_kb_per_10k=retained,
+            peak_kb_per_10k=peak,
+        )
+        if self.profile:
+            fn = self.avilla.metrics.snapshot()["fn"]
+            report.fn = sorted(
+                ({"fn": k, "count": v["count"], "mean_us": v["mean"] * 1e6} for k, v in fn.items()),
+                key=lambda i: i["count"] * i["mean_us"],
+                reverse=True,
+            )
+        return report
@@ -0,0 +1,83 @@
+from __future__ import annotations
+
+import time
+
+from aiohttp import WSMsgType, web
+from yarl import URL
+
+from avilla.onebot.v11.protocol import OneBot11ForwardConfig, OneBot11Protocol
+
+from .harness import StandIn
+
+
+class OneBot11StandIn(StandIn):
+    """正向 websocket 的 OneBot v11 实现端, 每个账号一条连接."""
+
+    name = "onebot11"
+
+    def routes(self):
+        return [web.get("/onebot/{account}", self.serve)]
+
+    def protocol(self):
+        protocol = OneBot11Protocol()
+        for account in self.accounts:
+            protocol.configure(OneBot11ForwardConfig(URL(f"ws://127.0.0.1:{self.port}/onebot/{account}")))
+        return protocol
+
+    async def serve(self, request: web.Request):
+        account = request.match_info["account"]
+        ws = await self.accept(request)
+        await ws.send_json(
+            {
+                "time": int(time.time()),
+                "self_id": int(account),
+                "post_type": "meta_event",
+                "meta_event_type": "lifecycle",
+                "sub_type": "connect",
+            }
+        )
+        self.peers[account] = ws
+        async for msg in ws:
+            if msg.type != WSMsgType.TEXT:
+                break
+            call = msg.json()
+            self.rpc_calls += 1
+            if call["action"] in {"send_group_msg", "send_private_msg", "send_msg"}:
+                await ws.send_json(
+                    {"status": "ok", "retcode": 0, "data": {"message_id": self.next_message_id()}, "echo": call["echo"]}
+                )
+            else:
+                await ws.send_json({"status": "failed", "retcode": 1404, "data": None, "echo": call["echo"]})
+        self.peers.pop(account, None)
+        return ws
+
+    def message(self, seq: int, account: str, group: str, member: str):
+        text = self.scenario.text(seq)
+        segments: list[dict] = [{"type": "text", "data": {"text": text}}]
+        if self.scenario.has_media(seq):
+            segments.extend(
+                {"type": "image", "data": {"file": f"{seq:032x}{i}.image", "url": self.media_url(seq, i)}}
+                for i in range(self.scenario.images)
+            )
+        return str(seq), {
+            "time": int(time.time()),
+            "self_id": int(account),
+            "post_type": "message",
+            "message_type": "group",
+            "sub_type": "normal",
+            "message_id": seq,
+            "group_id": int(group),
+            "user_id": int(member),
+            "anonymous": None,
+            "message": segments,
+            "raw_message": text,
+            "font": 0,
+            "sender": {"user_id": int(member), "nickname": f"member {member}", "card": "", "role": "member"},
+        }
+
+    def replay_target(self, frame: dict):
+        account = str(frame.get("self_id", self.accounts[0]))
+        if account not in self.peers:
+            account = self.accounts[0]
+        message_id = frame.get("message_id") if frame.get("post_type") == "message" else None
+        return account, None if message_id is None else str(message_id)
@@ -0,0 +1,134 @@
+from __future__ import annotations
+
+from datetime import datetime, timezone
+
+from aiohttp import WSMsgType, web
+from yarl import URL
+
+from avilla.core.ratelimit import RateLimitConfig
+from avilla.qqapi.protocol import QQAPIConfig, QQAPIProtocol
+
+from .harness import StandIn
+
+
+def _now() -> str:
+    return datetime.now(timezone.utc).isoformat()
+
+
+class QQAPIStandIn(StandIn):
+    """QQ 开放平台的网关与 HTTP 接口; 每个账号 (即 AppID) 一条网关连接, 以鉴权信息区分账号."""
+
+    name = "qqapi"
+
+    def __init__(self, scenario) -> None:
+        super().__init__(scenario)
+        self._sequence: dict[str, int] = {}
+
+    def routes(self):
+        return [
+            web.get("/gateway/bot", self.gateway),
+            web.get("/websocket", self.serve),
+            web.post("/channels/{channel}/messages", self.send_message),
+        ]
+
+    def protocol(self):
+        protocol = QQAPIProtocol()
+        for account in self.accounts:
+            protocol.configure(
+                QQAPIConfig(
+                    account,
+                    f"token-{account}",
+                    "secret",
+                    api_base=URL(f"http://127.0.0.1:{self.port}/"),
+                    # 测量调度本身的开销, 而不是限频的等待
+                    rate_limit=RateLimitConfig(rate=1e9, burst=1 << 30),
+                )
+            )
+        return protocol
+
+    async def gateway(self, request: web.Request):
+        return web.json_response(
+            {
+                "url": f"ws://127.0.0.1:{self.port}/websocket",
+                "shards": 1,
+                "session_start_limit": {"total": 1000, "remaining": 1000, "reset_after": 0, "max_concurrency": 1},
+            }
+        )
+
+    async def serve(self, request: web.Request):
+        ws = await self.accept(request)
+        await ws.send_json({"op": 10, "d": {"heartbeat_interval": 30000}})
+        identify = await ws.receive_json()
+        account = identify["d"]["token"].removeprefix("Bot ").partition(".")[0]
+        self._sequence[account] = 1
+        await ws.send_json(
+            {
+                "op": 0,
+                "s": 1,
+                "t": "READY",
+                "d": {
+                    "version": 1,
+                    "session_id": f"session-{account}",
+                    "user": {"id": account, "username": f"bot {account}", "bot": True},
+                    "shard": [0, 1],
+                },
+            }
+        )
+        self.peers[account] = ws
+        async for msg in ws:
+            if msg.type != WSMsgType.TEXT:
+                break
+            if msg.json().get("op") == 1:
+                await ws.send_json({"op": 11})
+        self.peers.pop(account, None)
+        return ws
+
+    async def send_message(self, request: web.Request):
+        self.rpc_calls += 1
+        account = request.headers["Authorization"].removeprefix("Bot ").partition(".")[0]
+        params = await request.json()
+        channel = request.match_info["channel"]
+        return web.json_response(
+            {
+                "id": str(self.next_message_id()),
+                "channel_id": channel,
+                "guild_id": channel,
+                "content": params.get("content", ""),
+                "timestamp": _now(),
+                "author": {"id": account, "username": f"bot {account}", "avatar": "", "bot": True},
+            }
+        )
+
+    def message(self, seq: int, account: str, group: str, member: str):
+        data: dict = {
+            "id": str(seq),
+            "channel_id": group,
+            "guild_id": group,
+            "content": f"<@!{account}> {self.scenario.text(seq)}",
+            "timestamp": _now(),
+            "author": {"id": member, "username": f"member {member}", "avatar": self.media_url(seq, 0), "bot": False},
+            "member": {"nick": f"member {member}", "roles": ["1"], "joined_at": _now()},
+            "seq": seq,
+            "seq_in_channel": str(seq),
+        }
+        if self.scenario.has_media(seq):
+            data["attachments"] = [
+                {
+                    "id": f"{seq}-{i}",
+                    "content_type": "image/png",
+                    "filename": f"{seq}-{i}.png",
+                    "height": 720,
+                    "width": 1280,
+                    "size": 204800,
+                    "url": self.media_url(seq, i),
+                }
+                for i in range(self.scenario.images)
+            ]
+        self._sequence[account] += 1
+        frame = {"op": 0, "s": self._sequence[account], "t": "AT_MESSAGE_CREATE", "id": f"AT_MESSAGE_CREATE:{seq}"}
+        return str(seq), {**frame, "d": data}
+
+    def replay_target(self, frame: dict):
+        data = frame.get("d") or {}
+        message_id = data.get("id") if "MESSAGE_CREATE" in (frame.get("t") or "") else None
+        return self.accounts[0], message_id
@@ -0,0 +1,104 @@
+from __future__ import annotations
+
+import time
+
+from aiohttp import WSMsgType, web
+
+from avilla.red.protocol import RedConfig, RedProtocol
+
+from .harness import StandIn
+
+
+class RedStandIn(StandIn):
+    """Chronocat 风格的 Red 协议实现端; 每个账号一条 websocket, 以 token 区分账号."""
+
+    name = "red"
+
+    def routes(self):
+        return [web.get("/", self.serve), web.post("/api/message/send", self.send_message)]
+
+    def protocol(self):
+        protocol = RedProtocol()
+        for account in self.accounts:
+            protocol.configure(RedConfig(f"token-{account}", host="127.0.0.1", port=self.port))
+        return protocol
+
+    async def serve(self, request: web.Request):
+        ws = await self.accept(request)
+        connect = await ws.receive_json()
+        account = connect["payload"]["token"].removeprefix("token-")
+        await ws.send_json(
+            {
+                "type": "meta::connect",
+                "payload": {"version": "0.0.0", "name": "stand-in", "authData": {"account": account, "uin": account}},
+            }
+        )
+        self.peers[account] = ws
+        async for msg in ws:
+            if msg.type != WSMsgType.TEXT:
+                break
+        self.peers.pop(account, None)
+        return ws
+
+    async def send_message(self, request: web.Request):
+        self.rpc_calls += 1
+        account = request.headers["Authorization"].removeprefix("Bearer token-")
+        params = await request.json()
+        for element in params["elements"]:
+            # 实现端返回的是补全了字段的消息记录
+            if "textElement" in element:
+                element["textElement"].setdefault("atType", 0)
+        message = self._record(
+            str(self.next_message_id()), account, params["peer"]["peerUin"], account, params["elements"]
+        )
+        return web.json_response(message)
+
+    @staticmethod
+    def _record(message_id: str, account: str, group: str, member: str, elements: list[dict]) -> dict:
+        return {
+            "msgId": message_id,
+            "msgSeq": message_id,
+            "chatType": 2,
+            "msgType": 2,
+            "subMsgType": 1 | (2 if any(i["elementType"] == 2 for i in elements) else 0),
+            "sendType": 0,
+            "senderUin": member,
+            "senderUid": f"u_{member}",
+            "peerUin": group,
+            "peerUid": group,
+            "msgTime": str(int(time.time())),
+            "sendMemberName": f"member {member}",
+            "elements": elements,
+            "selfUin": account,
+        }
+
+    def message(self, seq: int, account: str, group: str, member: str):
+        elements: list[dict] = [
+            {"elementType": 1, "elementId": f"{seq}0", "textElement": {"content": self.scenario.text(seq), "atType": 0}}
+        ]
+        if self.scenario.has_media(seq):
+            elements.extend(
+                {
+                    "elementType": 2,
+                    "elementId": f"{seq}{i + 1}",
+                    "picElement": {
+                        "md5HexStr": f"{seq:030x}{i:02x}",
+                        "fileSize": "204800",
+                        "fileName": f"{seq}-{i}.png",
+                        "fileUuid": f"{seq}-{i}",
+                        "sourcePath": f"/tmp/stand-in/{seq}-{i}.png",
+                        "picWidth": 1280,
+                        "picHeight": 720,
+                    },
+                }
+                for i in range(self.scenario.images)
+            )
+        message = self._record(str(seq), account, group, member, elements)
+        return str(seq), {"type": "message::recv", "payload": [message]}
+
+    def replay_target(self, frame: dict):
+        if frame.get("type") != "message::recv" or not frame.get("payload"):
+            return self.accounts[0], None
+        message = frame["payload"][0]
+        account = str(message.get("selfUin", self.accounts[0]))
+        return account if account in self.peers else self.accounts[0], str(message["msgId"])
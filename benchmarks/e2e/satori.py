@@ -0,0 +1,86 @@
+from __future__ import annotations
+
+import time
+
+from aiohttp import WSMsgType, web
+
+from avilla.satori.protocol import SatoriConfig, SatoriProtocol
+
+from .harness import StandIn
+
+PLATFORM = "bench"
+
+
+class SatoriStandIn(StandIn):
+    """Satori 服务端; 所有账号共用一条 websocket, 在 READY 中一并登录."""
+
+    name = "satori"
+
+    def __init__(self, scenario) -> None:
+        super().__init__(scenario)
+        self._sequence = 0
+
+    def routes(self):
+        return [web.get("/v1/events", self.serve), web.post("/v1/{action}", self.api)]
+
+    def protocol(self):
+        return SatoriProtocol().configure(SatoriConfig(host="127.0.0.1", port=self.port))
+
+    async def serve(self, request: web.Request):
+        ws = await self.accept(request)
+        identify = await ws.receive_json()
+        if identify.get("op") != 3:
+            await ws.close()
+            return ws
+        await ws.send_json(
+            {
+                "op": 4,
+                "body": {"logins": [{"platform": PLATFORM, "self_id": i, "status": 1} for i in self.accounts]},
+            }
+        )
+        for account in self.accounts:
+            self.peers[account] = ws
+        async for msg in ws:
+            if msg.type != WSMsgType.TEXT:
+                break
+            if msg.json().get("op") == 1:
+                await ws.send_json({"op": 2})
+        for account in self.accounts:
+            self.peers.pop(account, None)
+        return ws
+
+    async def api(self, request: web.Request):
+        self.rpc_calls += 1
+        if request.match_info["action"] != "message.create":
+            return web.Response(status=500)
+        params = await request.json()
+        return web.json_response([{"id": str(self.next_message_id()), "content": params["content"]}])
+
+    def message(self, seq: int, account: str, group: str, member: str):
+        content = self.scenario.text(seq)
+        if self.scenario.has_media(seq):
+            content += "".join(f'<img src="{self.media_url(seq, i)}"/>' for i in range(self.scenario.images))
+        self._sequence += 1
+        return str(seq), {
+            "op": 0,
+            "body": {
+                "id": self._sequence,
+                "type": "message-created",
+                "platform": PLATFORM,
+                "self_id": account,
+                "timestamp": int(time.time() * 1000),
+                "channel": {"id": group, "type": 0},
+                "guild": {"id": group},
+                "user": {"id": member, "name": f"member {member}"},
+                "member": {"user": {"id": member, "name": f"member {member}"}},
+                "message": {"id": str(seq), "content": content},
+            },
+        }
+
+    def replay_target(self, frame: dict):
+        body = frame.get("body") or {}
+        account = str(body.get("self_id", self.accounts[0]))
+        if account not in self.peers:
+            account = self.accounts[0]
+        message = body.get("message") if body.get("type") == "message-created" else None
+        return account, None if message is None else str(message["id"])
@@ -0,0 +1,51 @@
+from __future__ import annotations
+
+from dataclasses import dataclass, replace
+from typing import Iterator
+
+
+@dataclass(frozen=True)
+class Scenario:
+    name: str
+    description: str
+    events: int = 10_000
+    accounts: int = 1
+    groups: int = 16
+    members: int = 64
+    media: float = 0.0
+    """携带图片的消息所占比例."""
+    images: int = 1
+    """每条携带图片的消息中的图片数量."""
+    text_length: int = 24
+    burst: int | None = None
+    """设置后以此数量为一批无间隔推送, 每批处理完毕后再推送下一批; 超出队列容量的部分会被丢弃或阻塞."""
+    window: int = 64
+    """未设置 burst 时, 已推送但尚未处理完的事件数上限."""
+
+    def with_events(self, events: int | None) -> Scenario:
+        return self if events is None else replace(self, events=events)
+
+    def plan(self) -> Iterator[tuple[int, int, int, int]]:
+        """依次产出 (序号, 账号下标, 群组下标, 成员下标)."""
+        for seq in range(self.events):
+            yield seq, seq % self.accounts, (seq // self.accounts) % self.groups, (seq * 7919) % self.members
+
+    def has_media(self, seq: int) -> bool:
+        # 按比例均匀分布
+        return int((seq + 1) * self.media) > int(seq * self.media)
+
+    def text(self, seq: int) -> str:
+        head = f"message #{seq} "
+        return head + "x" * max(self.text_length - len(head), 0)
+
+
+SCENARIOS: dict[str, Scenario] = {
+    i.name: i
+    for i in (
+        Scenario("steady", "单账号, 16 个群内的短文本消息, 保持 64 条在途"),
+        Scenario("burst", "单账号的突发消息: 每批 2000 条无间隔推送", events=20_000, burst=2_000),
+        Scenario("accounts", "32 个账号交替收到消息", accounts=32, groups=4),
+        Scenario("large_group", "单个 5000 人大群, 成员轮流发言; 同一群的事件只能顺序处理", groups=1, members=5_000),
+        Scenario("media", "每条消息携带 4 张图片与 2 KB 文本", events=5_000, media=1.0, images=4, text_length=2_048),
+    )
+}
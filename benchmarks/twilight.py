@@ -0,0 +1,81 @@
+"""Twilight 每条消息的匹配开销随注册数量的变化.
+
+对比两种路径:
+
+- baseline: 每个 Twilight 各自转换、切分消息链并运行完整匹配 (旧行为);
+- shared: 与 `Twilight.beforeExecution` 相同, 共享切分结果并经由字面量前缀索引预筛.
+
+    python -m benchmarks.twilight [--rounds 200]
+"""
+from __future__ import annotations
+
+import argparse
+import time
+
+from graia.amnesia.message import MessageChain
+
+from avilla.core.elements import Notice, Text
+from avilla.core.selector import Selector
+from avilla.twilight.twilight import FullMatch, ParamMatch, Twilight, UnionMatch, WildcardMatch, _matcher_index
+from avilla.twilight.util import _to_mapping_str, elem_mapping_ctx, split, tokenize_chain
+
+MESSAGES = [
+    MessageChain([Text("今天天气不错, 一起出去玩吧")]),
+    MessageChain([Notice(Selector().land("qq").group("1").member("2")), Text(" 看看这个")]),
+    MessageChain([Text("cmd7 alpha beta")]),
+    MessageChain([Text("echo hello world")]),
+]
+
+
+def build(count: int) -> list[Twilight]:
+    twilights: list[Twilight] = [Twilight(UnionMatch("echo", "say"), WildcardMatch() @ "content")]
+    for i in range(count - 1):
+        twilights.append(Twilight(FullMatch(f"cmd{i}"), ParamMatch() @ "first", WildcardMatch() @ "rest"))
+    return twilights
+
+
+def baseline(twilight: Twilight, chain: MessageChain):
+    mapping_str, elem_mapping = _to_mapping_str(chain, **twilight.map_param)
+    token = elem_mapping_ctx.set(elem_mapping)
+    try:
+        return twilight.matcher.match(split(mapping_str, keep_quote=True), elem_mapping)
+    finally:
+        elem_mapping_ctx.reset(token)
+
+
+def shared(twilight: Twilight, chain: MessageChain):
+    # 与 Twilight.beforeExecution 相同的路径
+    tokens = tokenize_chain(chain, **twilight.map_param)
+    if _matcher_index.may_match(twilight.matcher, tokens.joined):
+        return twilight._generate(tokens)
+
+
+def measure(twilights: list[Twilight], run, rounds: int) -> float:
+    start = time.perf_counter()
+    for _ in range(rounds):
+        for chain in MESSAGES:
+            # 与 Broadcast 分发时相同: 同一条消息依次经过每个 Twilight
+            for twilight in twilights:
+                try:
+                    run(twilight, chain)
+                except ValueError:
+                    pass
+    return (time.perf_counter() - start) / (rounds * len(MESSAGES)) * 1e6
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--rounds", type=int, default=200)
+    parser.add_argument("--counts", type=int, nargs="+", default=[1, 10, 50, 200, 500])
+    args = parser.parse_args()
+
+    print(f"{'matchers':>8} {'baseline us/msg':>16} {'shared us/msg':>14} {'speedup':>8}")
+    for count in args.counts:
+        twilights = build(count)
+        before = measure(twilights, baseline, args.rounds)
+        after = measure(twilights, shared, args.rounds)
+        print(f"{count:>8} {before:>16.1f} {after:>14.1f} {before / after:>7.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,9 +1,12 @@
+from ._runtime import GLOBAL_DISPATCH_CACHE as GLOBAL_DISPATCH_CACHE
 from ._runtime import GLOBAL_GALLERY as GLOBAL_GALLERY
+from ._runtime import invalidate as invalidate
 from ._runtime import merge as merge
 from ._runtime import ref as ref
 from .access import Access as Access
 from .access import OptionalAccess as OptionalAccess
 from .behavior import OverloadBehavior as OverloadBehavior
+from .cache import DispatchCache as DispatchCache
 from .capability import Capability as Capability
 from .collector import BaseCollector as BaseCollector
 from .endpoint import Endpoint as Endpoint
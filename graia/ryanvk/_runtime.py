@@ -4,9 +4,11 @@ from collections import ChainMap
 from itertools import chain
 from typing import Any
 
+from graia.ryanvk.cache import DispatchCache
 from graia.ryanvk.typing import SupportsMerge
 
 GLOBAL_GALLERY = {}  # layout: {namespace: {identify: {...}}}, cover-mode.
+GLOBAL_DISPATCH_CACHE = DispatchCache()
 
 
 def ref(namespace: str, identify: str | None = None) -> dict[Any, Any]:
@@ -15,6 +17,10 @@ def ref(namespace: str, identify: str | None = None) -> dict[Any, Any]:
     return scope
 
 
+def invalidate():
+    GLOBAL_DISPATCH_CACHE.invalidate()
+
+
 def merge(*artifacts: dict[Any, Any]):
     chainmap = ChainMap(*artifacts)
     total_signatures = list(dict.fromkeys(chain(*[i.keys() for i in artifacts])))
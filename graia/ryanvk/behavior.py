@@ -1,9 +1,10 @@
 from __future__ import annotations
 
-from typing import TYPE_CHECKING, Any, Callable, TypeVar
+from typing import TYPE_CHECKING, Any, Callable, Hashable, TypeVar
 
 from typing_extensions import Concatenate, ParamSpec
 
+from ._runtime import GLOBAL_DISPATCH_CACHE
 from .sign import FnImplement, FnRecord
 
 if TYPE_CHECKING:
@@ -25,29 +26,57 @@ class OverloadBehavior:
             raise NotImplementedError
         return result
 
+    def get_dispatch_key(self, fn: Fn, arguments: dict[str, Any]) -> Hashable | None:
+        try:
+            key = (
+                fn,
+                *(
+                    overload_item.get_dispatch_key({i: arguments[i] for i in required_args})
+                    for overload_item, required_args in fn.overload_param_map.items()
+                ),
+            )
+            hash(key)
+        except TypeError:
+            return
+
+        return key
+
     def harvest_overload(
         self, staff: Staff, fn: Fn[P, R], *args: P.args, **kwargs: P.kwargs
     ) -> tuple[BaseCollector, Callable[Concatenate[Any, P], R]]:
-        artifact_record = self.harvest_record(staff, fn)
+        collections = tuple(staff.artifact_map.maps)
 
         if fn.has_overload_capability:
-            bound_args = fn.shape_signature.bind(*args, **kwargs)
-            bound_args.apply_defaults()
-            collections = None
+            arguments = fn.bind_arguments(args, kwargs)
+            key = self.get_dispatch_key(fn, arguments)
+        else:
+            arguments = None
+            key = (fn,)
+
+        if key is not None and (cached := GLOBAL_DISPATCH_CACHE.get(collections, key)) is not None:
+            return cached
+
+        artifact_record = self.harvest_record(staff, fn)
+
+        if arguments is not None:
+            entities = None
 
             for overload_item, required_args in fn.overload_param_map.items():
                 scope = artifact_record["overload_scopes"][overload_item.identity]
-                entities = overload_item.get_entities(scope, {i: bound_args.arguments[i] for i in required_args})
-                collections = entities if collections is None else collections.intersection(entities)
+                current = overload_item.get_entities(scope, {i: arguments[i] for i in required_args})
+                entities = current if entities is None else entities.intersection(current)
 
-            if not collections:
+            if not entities:
                 raise NotImplementedError
 
-            return collections.pop()  # type: ignore
-
+            result = next(iter(entities))
         else:
-            return artifact_record["record_tuple"]  # type: ignore
+            result = artifact_record["record_tuple"]
+
+        if key is not None and result is not None:
+            GLOBAL_DISPATCH_CACHE.set(collections, key, result)
 
+        return result  # type: ignore
 
 
 DEFAULT_BEHAVIOR = OverloadBehavior()
@@ -0,0 +1,46 @@
+from __future__ import annotations
+
+from collections import OrderedDict
+from typing import Any, Hashable, MutableMapping
+
+
+class DispatchCache:
+    """记录 (artifact collections, fn, overload keys) -> 实现 的结果, 由 harvest 过程使用.
+
+    缓存项同时持有 artifact collections 本身的引用, 以保证以 `id` 作为键时不会因对象回收而错配;
+    artifacts 的内容发生变化时 (collect, apply_to 等), 需要调用 `invalidate`.
+    """
+
+    maxsize: int
+    generation: int
+    records: OrderedDict[Hashable, tuple[tuple[MutableMapping[Any, Any], ...], Any]]
+
+    def __init__(self, maxsize: int = 4096) -> None:
+        self.maxsize = maxsize
+        self.generation = 0
+        self.records = OrderedDict()
+
+    @property
+    def enabled(self) -> bool:
+        return self.maxsize > 0
+
+    def get(self, collections: tuple[MutableMapping[Any, Any], ...], key: Hashable) -> Any | None:
+        cache_key = (tuple(map(id, collections)), key)
+        record = self.records.get(cache_key)
+        if record is None:
+            return
+
+        self.records.move_to_end(cache_key)
+        return record[1]
+
+    def set(self, collections: tuple[MutableMapping[Any, Any], ...], key: Hashable, value: Any) -> None:
+        if not self.enabled:
+            return
+
+        self.records[(tuple(map(id, collections)), key)] = (collections, value)
+        if len(self.records) > self.maxsize:
+            self.records.popitem(last=False)
+
+    def invalidate(self) -> None:
+        self.generation += 1
+        self.records.clear()
@@ -3,7 +3,7 @@ from __future__ import annotations
 from contextlib import AbstractContextManager
 from typing import TYPE_CHECKING, Any, Callable, TypeVar
 
-from ._runtime import GLOBAL_GALLERY
+from ._runtime import GLOBAL_GALLERY, invalidate
 from .perform import BasePerform
 
 if TYPE_CHECKING:
@@ -30,6 +30,7 @@ class BaseCollector:
             ns: dict = GLOBAL_GALLERY.setdefault(self.namespace, {})
             locate: dict = ns.setdefault(self.identify or "_", {})
             locate.update(self.artifacts)
+            invalidate()
 
     @property
     def _(self):
@@ -44,6 +45,7 @@ class BaseCollector:
 
     def collect(self, signature: Any, artifact: Any):
         self.artifacts[signature] = artifact
+        invalidate()
 
     def on_collected(self, func: Callable[[type], Any]):
         self.collected_callbacks.append(func)
@@ -66,7 +68,11 @@ class BaseCollector:
         return context_manager.__enter__()
 
     def post_merge(self, origin: dict):
-        self.on_collected(lambda _: origin.update(self.artifacts))
+        def merge_callback(_):
+            origin.update(self.artifacts)
+            invalidate()
+
+        self.on_collected(merge_callback)
 
     def entity(self, signature: SupportsCollect[P, R], *args: P.args, **kwargs: P.kwargs) -> R:
         return signature.collect(self, *args, **kwargs)
@@ -5,6 +5,7 @@ from typing import TYPE_CHECKING, Any, Callable, Generic, overload
 
 from typing_extensions import Concatenate, ParamSpec, Self, TypeVar
 
+from graia.ryanvk._runtime import invalidate
 from graia.ryanvk.sign import FnImplement
 
 from .behavior import DEFAULT_BEHAVIOR, OverloadBehavior
@@ -46,6 +47,11 @@ class Fn(Generic[P, R]):
     overload_param_map: dict[FnOverload, list[str]]
     overload_map: dict[str, FnOverload]
 
+    _positional_names: tuple[str, ...]
+    _keyword_names: frozenset[str]
+    _defaults: dict[str, Any]
+    _bind_fastpath: bool
+
     def __init__(
         self: Fn[P, R],
         shape: Callable[Concatenate[Any, P], R],
@@ -60,6 +66,16 @@ class Fn(Generic[P, R]):
         self.overload_params = {i: k for k, v in self.overload_param_map.items() for i in v}
         self.overload_map = {i.identity: i for i in self.overload_param_map}
 
+        parameters = self.shape_signature.parameters.values()
+        self._positional_names = tuple(
+            i.name for i in parameters if i.kind in {i.POSITIONAL_ONLY, i.POSITIONAL_OR_KEYWORD}
+        )
+        self._keyword_names = frozenset(
+            i.name for i in parameters if i.kind in {i.POSITIONAL_OR_KEYWORD, i.KEYWORD_ONLY}
+        )
+        self._defaults = {i.name: i.default for i in parameters if i.default is not i.empty}
+        self._bind_fastpath = all(i.kind not in {i.VAR_POSITIONAL, i.VAR_KEYWORD} for i in parameters)
+
     def __set_name__(self, owner: type[BasePerform], name: str):
         self.owner = owner
         self.name = name
@@ -92,6 +108,21 @@ class Fn(Generic[P, R]):
     def has_overload_capability(self) -> bool:
         return bool(self.overload_param_map)
 
+    def bind_arguments(self, args: tuple[Any, ...], kwargs: dict[str, Any]) -> dict[str, Any]:
+        if self._bind_fastpath and len(args) <= len(self._positional_names):
+            arguments = dict(zip(self._positional_names, args))
+            if kwargs.keys() <= self._keyword_names and arguments.keys().isdisjoint(kwargs):
+                arguments.update(kwargs)
+                for name, default in self._defaults.items():
+                    arguments.setdefault(name, default)
+                if len(arguments) == len(self.shape_signature.parameters):
+                    return arguments
+
+        # 交由 inspect 处理剩下的情况, 包括抛出参数错误.
+        bound_args = self.shape_signature.bind(*args, **kwargs)
+        bound_args.apply_defaults()
+        return bound_args.arguments
+
     def collect(
         self,
         collector: BaseCollector,
@@ -118,6 +149,7 @@ class Fn(Generic[P, R]):
             else:
                 artifact["record_tuple"] = (collector, entity)
 
+            invalidate()
             return entity
 
         return wrapper
@@ -126,14 +158,17 @@ class Fn(Generic[P, R]):
         raise ValueError("common staff can only works with static perform")
 
     def _get_instance(self, staff: Staff, cls: type[N]) -> N:
-        if cls not in staff.instances:
-            if cls.__static__:
-                instance = staff.instances[cls] = cls(staff)
-            else:
-                instance = self.dyn_perform(staff, cls)
-        else:
-            instance = staff.instances[cls]
+        if cls in staff.instances:
+            return staff.instances[cls]
+
+        if not cls.__static__:
+            return self.dyn_perform(staff, cls)
+
+        owner = staff.instance_owner(cls)
+        if cls not in owner.instances:
+            owner.instances[cls] = cls(owner)
 
+        instance = staff.instances[cls] = owner.instances[cls]
         return instance
 
     def execute(
@@ -1,6 +1,6 @@
 from __future__ import annotations
 
-from typing import Any, Callable
+from typing import Any, Callable, Hashable
 
 from graia.ryanvk.collector import BaseCollector
 
@@ -22,6 +22,10 @@ class FnOverload:
     def get_entities(self, scope: dict[Any, Any], args: dict[str, Any]) -> set[tuple[BaseCollector, Callable]]:
         return scope["_"]
 
+    def get_dispatch_key(self, args: dict[str, Any]) -> Hashable:
+        # 同一 key 必须总是得到同样的 entities, 无法 hash 时会退回到未缓存的流程.
+        return tuple(args.items())
+
     def merge_scopes(self, *scopes: dict[Any, Any]) -> dict:
         return scopes[-1]
 
@@ -102,6 +106,9 @@ class TypeOverload(FnOverload):
 
         return result_sets.pop().intersection(*result_sets)
 
+    def get_dispatch_key(self, args: dict[str, Any]) -> Hashable:
+        return tuple((arg_name, type(arg_value)) for arg_name, arg_value in args.items())
+
     def merge_scopes(self, *scopes: dict[Any, Any]):
         # layout: {arg: {value: set}}
 
@@ -169,6 +176,13 @@ class NoneOverload(FnOverload):
 
         return sets.pop().intersection(*sets)
 
+    def get_dispatch_key(self, args: dict[str, Any]) -> Hashable:
+        return tuple(
+            (arg_name, None if arg_value is None else self.bypassing.get_dispatch_key({arg_name: arg_value}))
+            for arg_name, arg_value in args.items()
+        )
+
+
 class PredicateOverload(FnOverload):
     predicate: Callable[[str, Any], Any]
 
@@ -204,6 +218,9 @@ class PredicateOverload(FnOverload):
 
         return result_sets.pop().intersection(*result_sets)
 
+    def get_dispatch_key(self, args: dict[str, Any]) -> Hashable:
+        return tuple((arg_name, self.predicate(arg_name, arg_value)) for arg_name, arg_value in args.items())
+
     def merge_scopes(self, *scopes: dict[Any, Any]):
         # layout: {arg: {value: set}}
 
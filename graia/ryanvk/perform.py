@@ -3,6 +3,7 @@ from __future__ import annotations
 from contextlib import AsyncExitStack, asynccontextmanager
 from typing import TYPE_CHECKING, Any, ClassVar
 
+from ._runtime import invalidate
 from .endpoint import Endpoint
 
 if TYPE_CHECKING:
@@ -21,6 +22,10 @@ class BasePerform:
     # when a perform is static, its lifespan won't execute,
     # which means dynamic endpoint cannot be used in the perform.
 
+    __accessed__: ClassVar[frozenset[str]]
+    # names of the endpoints declared on the perform (and its bases),
+    # used by `Staff.ext` to decide whether an instance can be shared with the parent staff.
+
     staff: Staff
 
     def __init__(self, staff: Staff) -> None:
@@ -32,6 +37,7 @@ class BasePerform:
     @classmethod
     def apply_to(cls, map: dict[Any, Any]):
         map.update(cls.__collector__.artifacts)
+        invalidate()
 
     @classmethod
     def endpoints(cls):
@@ -54,6 +60,9 @@ class BasePerform:
 
         collector = cls.__collector__
         cls.__static__ = static
+        cls.__accessed__ = frozenset(
+            v.name for klass in cls.__mro__ for v in vars(klass).values() if isinstance(v, Endpoint)
+        )
 
         for i in collector.collected_callbacks:
             i(cls)
@@ -1,20 +1,25 @@
 from __future__ import annotations
 
+import asyncio
+import inspect
 from collections import ChainMap
 from contextlib import AsyncExitStack, asynccontextmanager
 from copy import copy
-from typing import TYPE_CHECKING, Any, Callable, Protocol, TypeVar, overload
+from typing import TYPE_CHECKING, Any, Awaitable, Callable, Hashable, Iterable, Protocol, TypeVar, overload
 
 from typing_extensions import ParamSpec
 
 if TYPE_CHECKING:
+    from .collector import BaseCollector
     from .fn import Fn
     from .perform import BasePerform
 
 P = ParamSpec("P")
+T = TypeVar("T")
 R = TypeVar("R", covariant=True)
 VnCallable = TypeVar("VnCallable", bound=Callable)
 
+
 class Staff:
     artifact_collections: list[dict[Any, Any]]
     artifact_map: ChainMap[Any, Any]
@@ -22,17 +27,61 @@ class Staff:
     exit_stack: AsyncExitStack
     instances: dict[type, Any]
 
+    parent: Staff | None
+    overridden: frozenset[str]
+    # ext 产生的 staff 会与 parent 共享 artifacts, 并复用不依赖 overridden components 的 perform 实例.
+
     def __init__(self, artifacts_collections: list[dict[Any, Any]], components: dict[str, Any]) -> None:
         self.artifact_collections = artifacts_collections
         self.artifact_map = ChainMap(*artifacts_collections)
         self.components = components
         self.exit_stack = AsyncExitStack()
         self.instances = {}
+        self.parent = None
+        self.overridden = frozenset()
 
     def call_fn(self, fn: Fn[P, R], *args: P.args, **kwargs: P.kwargs) -> R:
         collector, entity = fn.behavior.harvest_overload(self, fn, *args, **kwargs)
         return fn.execute(self, collector, entity, *args, **kwargs)
 
+    async def call_fn_many(self, fn: Fn[[T], R | Awaitable[R]], items: Iterable[T]) -> list[R]:
+        """对 items 中的每一项调用 fn, 按原顺序返回结果.
+
+        同一 dispatch key 的实现只会解析一次, 且全部解析完成后才开始执行;
+        同步实现直接得出结果, 异步实现则并发执行.
+        """
+        items = list(items)
+        behavior = fn.behavior
+        resolved: dict[Hashable, tuple[BaseCollector, Callable]] = {}
+        records = []
+
+        for item in items:
+            key = behavior.get_dispatch_key(fn, fn.bind_arguments((item,), {})) if fn.has_overload_capability else ()
+            record = resolved.get(key) if key is not None else None
+            if record is None:
+                record = behavior.harvest_overload(self, fn, item)
+                if key is not None:
+                    resolved[key] = record
+            records.append(record)
+
+        results: list[Any] = []
+        pending: dict[int, Awaitable[R]] = {}
+
+        for index, (item, (collector, entity)) in enumerate(zip(items, records)):
+            result = fn.execute(self, collector, entity, item)
+            if inspect.isawaitable(result):
+                pending[index] = result
+            results.append(result)
+
+        if len(pending) == 1:
+            index, awaitable = pending.popitem()
+            results[index] = await awaitable
+        elif pending:
+            for index, result in zip(pending, await asyncio.gather(*pending.values())):
+                results[index] = result
+
+        return results
+
     class PostInitShape(Protocol[P]):
         def __post_init__(self, *args: P.args, **kwargs: P.kwargs) -> Any:
             ...
@@ -48,7 +97,16 @@ class Staff:
     def inject(self, perform_type: ..., *args, **kwargs):
         perform = perform_type(self)
         perform.__post_init__(*args, **kwargs)
+
+        if self.parent is not None:
+            # copy on write, 不影响 parent.
+            self.artifact_collections = [*self.artifact_collections]
+            self.instances = {k: v for k, v in self.instances.items() if v.staff is self}
+            self.parent = None
+            self.overridden = frozenset()
+
         self.artifact_collections.insert(0, perform.__collector__.artifacts)
+        self.artifact_map = ChainMap(*self.artifact_collections)
 
     async def maintain(self, perform: BasePerform):
         await self.exit_stack.enter_async_context(perform.lifespan())
@@ -60,9 +118,25 @@ class Staff:
 
     def ext(self, components: dict[str, Any]):
         instance = copy(self)
-        instance.components.update(components)
+        instance.components = {**self.components, **components}
+        instance.instances = {}
+        instance.parent = self
+        instance.overridden = frozenset(
+            k for k, v in components.items() if k not in self.components or self.components[k] is not v
+        )
         return instance
 
+    def instance_owner(self, perform_type: type[BasePerform]) -> Staff:
+        accessed = getattr(perform_type, "__accessed__", None)
+        if accessed is None:
+            return self
+
+        staff = self
+        while staff.parent is not None and staff.overridden.isdisjoint(accessed):
+            staff = staff.parent
+
+        return staff
+
     def get_fn_call(self, fn: Fn[P, R]) -> Callable[P, R]:
         def wrapper(*args: P.args, **kwargs: P.kwargs):
             return self.call_fn(fn, *args, **kwargs)
@@ -0,0 +1,47 @@
+from __future__ import annotations
+
+import asyncio
+
+from launart import Launart
+
+from avilla.core.application import Avilla
+from avilla.core.resource import UrlResource
+from avilla.core.ryanvk.staff import Staff
+from avilla.core.utilles.resource_cache import ResourceCacheConfig
+
+
+def make_staff(config: ResourceCacheConfig, payload: bytes) -> tuple[Staff, list[str]]:
+    avilla = Avilla(launch_manager=Launart(), resource_cache_config=config)
+    fetched = []
+
+    async def fetch(url, *, headers=None):
+        fetched.append(str(url))
+        return payload
+
+    avilla.http_client.fetch = fetch  # type: ignore
+    return Staff(avilla.get_staff_artifacts(), avilla.get_staff_components()), fetched
+
+
+async def collect(staff: Staff, resource: UrlResource, chunk_size: int = 8) -> bytes:
+    return b"".join([chunk async for chunk in staff.stream_resource(resource, chunk_size)])
+
+
+def test_stream_resource_larger_than_memory_item_without_disk_tier():
+    payload = bytes(range(256)) * 4
+    staff, fetched = make_staff(ResourceCacheConfig(enabled=True, memory_item_bytes=64, disk_bytes=0), payload)
+    resource = UrlResource("http://example.invalid/large.bin")
+
+    assert asyncio.run(collect(staff, resource)) == payload
+    assert fetched == [resource.url]
+
+
+def test_stream_resource_served_from_memory_tier():
+    payload = b"small resource"
+    staff, fetched = make_staff(ResourceCacheConfig(enabled=True), payload)
+    resource = UrlResource("http://example.invalid/small.bin")
+
+    async def stream_twice():
+        return await collect(staff, resource), await collect(staff, resource)
+
+    assert asyncio.run(stream_twice()) == (payload, payload)
+    assert fetched == [resource.url]